@@ -0,0 +1,346 @@
+"""
+Benchmarks every Blign align and distribute mode on synthetic scenes of increasing size.
+
+Headless, against the stand-in scene in blign.headless:
+    python benchmarks/bench_blign.py --sizes 1000 10000 100000
+
+Inside Blender, against real objects and the registered operators:
+    blender --background --python benchmarks/bench_blign.py -- --sizes 1000 10000
+
+Results (best wall time and peak traced memory per mode and size) are written as JSON.
+With --baseline, every result more than --tolerance slower than the stored one is flagged
+and the script exits with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from blign import core, headless  # noqa: E402
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+# name: (number of Blign objects, BlignSettings values, operator, number of shared meshes)
+# With 0 shared meshes every object is a box, otherwise the objects share that many random meshes.
+MODES = {
+    'align_axis_0_center': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': 'center'}, 'blign_align_button0', 0),
+    'align_axis_0_vertex': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': '+y'}, 'blign_align_button0', 0),
+    'align_plane_0_center': (0, {'Plane0': 'y-z', 'check_plane0': True, 'yz_selected0': 'center'}, 'blign_align_button0', 0),
+    'align_plane_0_vertex': (0, {'Plane0': 'y-z', 'check_plane0': True, 'yz_selected0': '-x'}, 'blign_align_button0', 0),
+    'align_axis_1_center': (1, {'Axis1': 'z', 'check_plane1': False, 'z_selected1': 'center'}, 'blign_align_button1', 0),
+    'align_axis_1_vertex': (1, {'Axis1': 'z', 'check_plane1': False, 'z_selected1': '-x'}, 'blign_align_button1', 0),
+    'align_plane_1_center': (1, {'Plane1': 'x-y', 'check_plane1': True, 'xy_selected1': 'center'}, 'blign_align_button1', 0),
+    'align_plane_1_vertex': (1, {'Plane1': 'x-y', 'check_plane1': True, 'xy_selected1': '+z'}, 'blign_align_button1', 0),
+    'align_2_center': (2, {'align_to_2_ops': 'center'}, 'blign_align_button2', 0),
+    'align_2_vertex': (2, {'align_to_2_ops': '+y'}, 'blign_align_button2', 0),
+    'distribute_0_center': (0, {'Axis0': 'x', 'distribute_ops0': 'center', 'indicate_spacing0': False}, 'blign_distribute_button0', 0),
+    'distribute_0_edge': (0, {'Axis0': 'x', 'distribute_ops0': 'edge', 'indicate_spacing0': False}, 'blign_distribute_button0', 0),
+    'distribute_1_center': (1, {'Axis1': 'y', 'distribute_ops1': 'center', 'indicate_spacing1': True, 'Spacing0': 3}, 'blign_distribute_button1', 0),
+    'distribute_1_edge': (1, {'Axis1': 'y', 'distribute_ops1': 'edge', 'indicate_spacing1': True, 'Spacing1': 2}, 'blign_distribute_button1', 0),
+    'distribute_2_even': (2, {'indicate_spacing2': False}, 'blign_distribute_button2', 0),
+    'distribute_2_spacing': (2, {'indicate_spacing2': True, 'Spacing2': 2}, 'blign_distribute_button2', 0),
+    'align_axis_0_overlaps': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': 'center', 'avoid_overlaps': True}, 'blign_align_button0', 0),
+    'align_axis_0_shared': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': '+y'}, 'blign_align_button0', 8),
+    'distribute_0_edge_shared': (0, {'Axis0': 'x', 'distribute_ops0': 'edge', 'indicate_spacing0': False}, 'blign_distribute_button0', 8),
+    'align_axis_0_exact': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': '+y', 'exact_geometry': True}, 'blign_align_button0', 8),
+    'align_2_exact': (2, {'align_to_2_ops': '+y', 'exact_geometry': True}, 'blign_align_button2', 8),
+    'distribute_0_edge_exact': (0, {'Axis0': 'x', 'distribute_ops0': 'edge', 'indicate_spacing0': False, 'exact_geometry': True}, 'blign_distribute_button0', 8),
+    'distribute_grid_center': (0, {'grid_ops': 'center'}, 'blign_distribute_grid', 0),
+    'distribute_grid_edge': (0, {'grid_ops': 'edge', 'grid_sort': 'SIZE'}, 'blign_distribute_grid', 0),
+    'pack_x_y': (0, {'pack_plane': 'x-y'}, 'blign_pack', 0),
+    'align_axis_0_active': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': '+y', 'basis': 'ACTIVE'}, 'blign_align_button0', 0),
+    'distribute_0_edge_active': (0, {'Axis0': 'x', 'distribute_ops0': 'edge', 'indicate_spacing0': False, 'basis': 'ACTIVE'}, 'blign_distribute_button0', 0),
+    'align_axis_0_hierarchy': (0, {'Axis0': 'x', 'check_plane0': False, 'x_selected0': '+y', 'align_units': 'HIERARCHY'}, 'blign_align_button0', 0),
+    'distribute_0_edge_collection': (0, {'Axis0': 'x', 'distribute_ops0': 'edge', 'indicate_spacing0': False, 'align_units': 'COLLECTION'}, 'blign_distribute_button0', 0),
+}
+
+# Objects are parented in hierarchies of this many for the Hierarchies modes, and linked to
+# collections of this many. Other modes leave every object unparented.
+HIERARCHY_SIZE = 4
+COLLECTION_SIZE = 8
+
+
+def find_mode_settings(mode):
+    """BlignSettings values a mode runs with, the defaults overridden by the mode's own, so no mode inherits another's."""
+    return dict(headless.DEFAULT_SETTINGS, **MODES[mode][1])
+
+
+def run_headless_mode(scene, mode):
+    """
+    Runs one mode against a headless scene through the blign.core operations the add-on's operators call,
+    with the scene as the reader in place of addon.BlenderReader.
+    Arguments
+    ---------
+    scene : blign.headless.Scene
+        Scene whose selection is aligned or distributed.
+    mode : str
+        Key of MODES.
+    Returns
+    -------
+    """
+    operator = MODES[mode][2]
+    settings = scene.settings = headless.make_settings(**find_mode_settings(mode))
+    references = scene.blign_objects
+    oblist = scene.find_units(settings.align_units)
+    basis = scene.find_basis()
+
+    if operator in ('blign_align_button0', 'blign_align_button1'):
+        tab = operator[-1]
+        columns, direction = core.find_alignment(settings, tab)
+        reference = references[0] if tab == '1' else None
+        locations = core.align_objects(scene, oblist, settings, columns, direction, reference, basis)
+    elif operator == 'blign_align_button2':
+        oblist, locations = core.align_objects_to_line(scene, oblist, references, settings)
+    elif operator in ('blign_distribute_button0', 'blign_distribute_button1'):
+        tab = operator[-1]
+        locations = core.distribute_objects(scene, oblist, settings, getattr(settings, 'indicate_spacing' + tab),
+                                            getattr(settings, 'Axis' + tab), getattr(settings, 'distribute_ops' + tab),
+                                            getattr(settings, 'Spacing' + tab), basis)
+    elif operator == 'blign_distribute_button2':
+        locations = core.distribute_objects_between(scene, oblist, references, settings, basis)
+    elif operator == 'blign_distribute_grid':
+        locations = core.arrange_objects(scene, oblist, settings, basis)
+    else:
+        locations = core.pack_objects(scene, oblist, settings, basis)
+
+    if locations is not None:
+        scene.set_locations(locations, oblist)
+
+
+class HeadlessBackend:
+    """Runs modes against blign.headless scenes."""
+    name = 'headless'
+
+    def setup(self, count, mode, seed):
+        nblign, meshes = MODES[mode][0], MODES[mode][3]
+        self.scene = headless.random_scene(count, seed=seed, shared_meshes=meshes)
+        objects = self.scene.objects
+        for obj in objects[:nblign]:
+            obj.blign = True
+        hierarchies = MODES[mode][1].get('align_units') == 'HIERARCHY'
+        for i, obj in enumerate(objects):
+            if hierarchies and i % HIERARCHY_SIZE:
+                obj.parent = objects[i - i % HIERARCHY_SIZE]
+            obj.collection = "Bench.{:06d}".format(i // COLLECTION_SIZE)
+        self.scene.active = objects[-1]
+        self.initial = self.scene.get_locations(objects)
+
+    def reset(self):
+        self.scene.set_locations(self.initial, self.scene.objects)
+
+    def run(self, mode):
+        run_headless_mode(self.scene, mode)
+
+    def teardown(self):
+        self.scene = None
+
+
+class BlenderBackend:
+    """Runs modes through the registered Blign operators on real objects in a scratch collection."""
+    name = 'blender'
+
+    def __init__(self):
+        import blign
+        if not hasattr(bpy.types.Scene, 'blign_objects'):
+            blign.register()
+
+    def setup(self, count, mode, seed):
+        import bmesh
+        from blign import addon
+
+        nblign, meshes = MODES[mode][0], MODES[mode][3]
+        rng = np.random.default_rng(seed)
+        self.meshes = []
+        for _ in range(max(meshes, 1)):
+            mesh = bpy.data.meshes.new("blign_bench")
+            bm = bmesh.new()
+            if meshes:
+                # Jittered spheres, so exact geometry has hulls of a few hundred vertices to read.
+                bmesh.ops.create_icosphere(bm, subdivisions=3, radius=1.0)
+                for vert in bm.verts:
+                    vert.co = np.array(vert.co) * rng.uniform(0.5, 1.5, size=3)
+            else:
+                bmesh.ops.create_cube(bm, size=2.0)
+            bm.to_mesh(mesh)
+            bm.free()
+            self.meshes.append(mesh)
+
+        scene = bpy.context.scene
+        self.collection = bpy.data.collections.new("blign_bench")
+        scene.collection.children.link(self.collection)
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for item in list(addon.get_blign_objects(scene)):
+            addon.remove_blign_object(item, scene)
+
+        self.objects = []
+        for i in range(count):
+            obj = bpy.data.objects.new("Bench.{:06d}".format(i), self.meshes[i % len(self.meshes)])
+            obj.location = rng.uniform(-100, 100, size=3)
+            obj.rotation_euler = rng.uniform(0, 2 * np.pi, size=3)
+            obj.scale = rng.uniform(0.2, 2.0, size=3)
+            if i % COLLECTION_SIZE == 0:
+                collection = bpy.data.collections.new("Bench.{:06d}".format(i // COLLECTION_SIZE))
+                self.collection.children.link(collection)
+            collection.objects.link(obj)
+            obj.select_set(True)
+            self.objects.append(obj)
+        bpy.context.view_layer.update()
+        hierarchies = MODES[mode][1].get('align_units') == 'HIERARCHY'
+        for i, obj in enumerate(self.objects):
+            if hierarchies and i % HIERARCHY_SIZE:
+                parent = self.objects[i - i % HIERARCHY_SIZE]
+                obj.parent = parent
+                obj.matrix_parent_inverse = parent.matrix_world.inverted()
+        for obj in self.objects[:nblign]:
+            addon.add_blign_object(obj, scene)
+        bpy.context.view_layer.objects.active = self.objects[-1]
+        bpy.context.view_layer.update()
+        self.initial = addon.get_locations(self.objects)
+
+    def reset(self):
+        from blign import addon
+        addon.set_locations(self.objects, self.initial)
+        # Every timed run starts cold, so regressions in reading bounds and hulls or in sorting show up.
+        addon.invalidate_geometry_cache()
+
+    def run(self, mode):
+        for key, value in find_mode_settings(mode).items():
+            setattr(bpy.context.scene.object_settings, key, value)
+        getattr(bpy.ops.rigidbody, MODES[mode][2])()
+
+    def teardown(self):
+        from blign import addon
+        for obj in list(addon.get_blign_objects()):
+            addon.remove_blign_object(obj)
+        for obj in self.objects:
+            bpy.data.objects.remove(obj)
+        for mesh in self.meshes:
+            bpy.data.meshes.remove(mesh)
+        for collection in list(self.collection.children):
+            bpy.data.collections.remove(collection)
+        bpy.data.collections.remove(self.collection)
+        self.objects = []
+        self.meshes = []
+
+
+def benchmark(backend, modes, sizes, repeat, seed):
+    """
+    Times every mode at every size.
+    Arguments
+    ---------
+    backend : HeadlessBackend or BlenderBackend
+        Where the modes run.
+    modes : list
+        Keys of MODES.
+    sizes : list
+        Object counts.
+    repeat : int
+        Number of timed runs per mode and size, the best is kept.
+    seed : int
+        Seed of the synthetic scenes.
+    Returns
+    -------
+    results : list
+        One dict per mode and size with wall time and peak memory.
+    """
+    results = []
+    for count in sizes:
+        for mode in modes:
+            backend.setup(count, mode, seed)
+            times = []
+            for _ in range(repeat):
+                backend.reset()
+                start = time.perf_counter()
+                backend.run(mode)
+                times.append(time.perf_counter() - start)
+            backend.reset()
+            tracemalloc.start()
+            backend.run(mode)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            backend.teardown()
+            results.append({'mode': mode, 'count': count, 'seconds': min(times), 'peak_bytes': peak})
+            print("{:<30} {:>8d} objects {:>10.4f} s {:>10.1f} MB".format(
+                mode, count, min(times), peak / 2 ** 20))
+    return results
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compares results with a stored baseline.
+    Arguments
+    ---------
+    results : list
+        Results from benchmark.
+    baseline : dict
+        Previously written report.
+    tolerance : float
+        Allowed relative slowdown, e.g. 0.2 for 20 %.
+    Returns
+    -------
+    regressions : list
+        One dict per mode and size that got slower than allowed.
+    """
+    previous = {(r['mode'], r['count']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get((result['mode'], result['count']))
+        if old is not None and result['seconds'] > old['seconds'] * (1 + tolerance):
+            regressions.append({'mode': result['mode'], 'count': result['count'],
+                                'seconds': result['seconds'], 'baseline_seconds': old['seconds']})
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=list(MODES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--backend', choices=['headless', 'blender'],
+                        default='blender' if bpy is not None else 'headless')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help="report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if args.backend == 'blender' and bpy is None:
+        parser.error("the blender backend has to run inside Blender")
+    backend = BlenderBackend() if args.backend == 'blender' else HeadlessBackend()
+
+    results = benchmark(backend, args.modes, args.sizes, args.repeat, args.seed)
+    report = {'backend': backend.name, 'python': platform.python_version(),
+              'numpy': np.__version__, 'results': results}
+    if bpy is not None:
+        report['blender'] = bpy.app.version_string
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            report['regressions'] = find_regressions(results, json.load(f), args.tolerance)
+        for r in report['regressions']:
+            print("REGRESSION {mode} at {count} objects: {seconds:.4f} s (baseline {baseline_seconds:.4f} s)".format(**r))
+        status = 1 if report['regressions'] else 0
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    return status
+
+
+if __name__ == '__main__':
+    if '--' in sys.argv:
+        argv = sys.argv[sys.argv.index('--') + 1:]
+    else:
+        argv = [] if bpy is not None else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,19 @@
+bl_info = {
+    "name": "Blign",
+    "author": "Wilmer Lab Group",
+    "version": (1, 0),
+    "blender": (2, 80, 0),
+    "location": "3D View Sidebar > Geometry tab",
+    "description": "Align and distribute objects about an axis or between objects",
+    "tracker_url": "",
+    "category": "Geometry"
+}
+
+try:
+    import bpy
+except ImportError:
+    # Outside Blender only the bpy-free modules (blign.core, blign.headless) are usable.
+    bpy = None
+
+if bpy is not None:
+    from .addon import register, unregister
@@ -0,0 +1,3448 @@
+import math
+import functools
+import json
+import time
+from collections import OrderedDict
+import bpy
+import bmesh
+import numpy as np
+from .core import (AXIS_COLUMNS, PLANE_COLUMNS, to_basis, from_basis, basis_inverse, orthonormal_basis,
+                   transform_corners, find_bounds, find_vertices,
+                   align_to_point, project_onto_line, distribute_centers, distribute_edges,
+                   find_unit_groups, union_bounds, box_corners, find_islands, sort_order, update_order,
+                   find_axis_direction, find_alignment, find_alignment_target)
+from . import core, parallel, profiling
+from .parallel import pack_hulls, find_packed_bounds, find_packed_support
+from .profiling import phase
+
+try:
+    from bpy_extras.anim_utils import action_ensure_channelbag_for_slot
+except ImportError:
+    # Before Blender 4.4 actions are not layered and hold their F-curves themselves.
+    action_ensure_channelbag_for_slot = None
+
+# Convex hull vertices of each geometry datablock, keyed by pointer, used by exact geometry mode.
+# Least recently used entries are evicted once the cache grows past BlignSettings.cache_budget.
+_vertex_cache = OrderedDict()
+_vertex_cache_bytes = 0
+
+# World space corners, extents and support points of each object, keyed by object pointer. Each entry
+# keeps the world matrix it was computed with, is shifted along when Blign itself moves the object and
+# is dropped when a depsgraph update changes the object's geometry or transform. Frame changes move
+# animated objects without a depsgraph update, so every entry is dropped on each frame change.
+_bounds_cache = {}
+
+# Orders of the last objects sorted by each key, e.g. 'x', 'NAME' or ('PROPERTY', name), each entry
+# holding the object pointers, the keys and the order found. Keys are always read fresh and compared,
+# so an entry only saves sorting again and can never make an order stale.
+_order_index = {}
+
+# Last alignment that live alignment keeps the members on, None when live alignment is idle.
+_live_alignment = None
+# True while live alignment writes, so its own updates do not re-enter it.
+_live_solving = False
+
+# Location snapshots of recent Blign operations for Revert and Reapply, each (objects, old, new)
+# with old and new (N, 3) arrays of the moved objects only.
+_revert_snapshots = []
+_reapply_snapshots = []
+# Snapshot parts collected by set_locations while an operator runs, None outside operators.
+_recording = None
+
+# While a chunked operator computes its result, set_locations queues (objects, locations) here instead of writing.
+_deferred_writes = None
+# Locations queued by set_locations while a frame range is keyframed, None otherwise.
+_keyframe_writes = None
+
+
+def get_blign_objects(scene=None):
+    """
+    Finds the Blign objects of a scene from its registry.
+    Arguments
+    ---------
+    scene : Blender scene
+        Scene to read the registry of, defaults to the active scene.
+    Returns
+    -------
+    blobs : list
+        Blign objects in the order they were added.
+    """
+    if scene is None:
+        scene = bpy.context.scene
+    return [item.object for item in scene.blign_objects if item.object is not None]
+
+
+def count_blign_objects():
+    """
+    Counts the number of selected Blign objects.
+    Registry entries whose object was deleted are not counted, so the count always matches get_blign_objects.
+    Arguments
+    ---------
+    Returns
+    -------
+    len.... : int
+        Number of Blign objects.
+    """
+    return len(get_blign_objects())
+
+
+def add_blign_object(obj, scene=None):
+    """
+    Sets an object as a Blign object and appends it to the scene's registry.
+    Arguments
+    ---------
+    obj : Blender object
+        Object to add.
+    scene : Blender scene
+        Scene whose registry is updated, defaults to the active scene.
+    Returns
+    -------
+    """
+    if scene is None:
+        scene = bpy.context.scene
+    if obj not in get_blign_objects(scene):
+        scene.blign_objects.add().object = obj
+    obj.blign = True
+
+
+def remove_blign_object(obj, scene=None):
+    """
+    Unsets an object as a Blign object and removes it from the scene's registry.
+    Arguments
+    ---------
+    obj : Blender object
+        Object to remove.
+    scene : Blender scene
+        Scene whose registry is updated, defaults to the active scene.
+    Returns
+    -------
+    """
+    if scene is None:
+        scene = bpy.context.scene
+    for i in reversed(range(len(scene.blign_objects))):
+        if scene.blign_objects[i].object == obj:
+            scene.blign_objects.remove(i)
+    obj.blign = False
+
+
+def sync_blign_objects(scene):
+    """
+    Drops registry entries whose object was deleted or unset by other means.
+    Only the registry itself is walked, so this is cheap enough to run on every depsgraph update.
+    Arguments
+    ---------
+    scene : Blender scene
+        Scene whose registry is checked.
+    Returns
+    -------
+    """
+    for i in reversed(range(len(scene.blign_objects))):
+        obj = scene.blign_objects[i].object
+        if obj is None or not obj.blign or not obj.users_collection:
+            scene.blign_objects.remove(i)
+
+
+def rebuild_blign_objects(scene):
+    """
+    Rebuilds a scene's registry from the object.blign flags, for files saved before the registry existed.
+    Arguments
+    ---------
+    scene : Blender scene
+        Scene whose registry is rebuilt.
+    Returns
+    -------
+    """
+    scene.blign_objects.clear()
+    for obj in scene.objects:
+        if obj.blign:
+            scene.blign_objects.add().object = obj
+
+
+@bpy.app.handlers.persistent
+def blign_depsgraph_handler(scene, depsgraph=None):
+    """Keeps the registry in sync after deletions, drops cached geometry that changed and re-solves live alignment."""
+    if len(scene.blign_objects):
+        sync_blign_objects(scene)
+    invalidate_geometry_cache(depsgraph)
+    if _live_alignment is not None and depsgraph is not None:
+        update_live_alignment(depsgraph)
+
+
+@bpy.app.handlers.persistent
+def blign_frame_handler(scene, depsgraph=None):
+    """Drops cached bounds and the hulls of evaluated geometry, which animation may have changed."""
+    drop_cached_bounds()
+    for key in [key for key, (signature, _) in _vertex_cache.items() if signature[0] == 'EVALUATED']:
+        drop_cached_hull(key)
+
+
+@bpy.app.handlers.persistent
+def blign_undo_handler(scene, dummy=None):
+    """Keeps the registry in sync after undo and redo, drops all cached geometry, stops live alignment and forgets snapshots."""
+    if len(scene.blign_objects):
+        sync_blign_objects(scene)
+    invalidate_geometry_cache()
+    stop_live_alignment()
+    clear_snapshots()
+
+
+@bpy.app.handlers.persistent
+def blign_load_handler(dummy):
+    """Builds the registry of every scene in a newly loaded file, drops all cached geometry, stops live alignment and forgets snapshots."""
+    invalidate_geometry_cache()
+    stop_live_alignment()
+    clear_snapshots()
+    for scene in bpy.data.scenes:
+        if not len(scene.blign_objects):
+            rebuild_blign_objects(scene)
+
+
+def find_object_rows(oblist):
+    """
+    Finds the index of each object in bpy.data.objects, so that a property of every object can be read
+    with one foreach_get over the whole collection and picked out. Only the session_uid of each object is read on its own.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find.
+    Returns
+    -------
+    rows : numpy array
+        (N,) array of each object's index in bpy.data.objects.
+    """
+    uids = np.empty(len(bpy.data.objects), dtype=np.int32)
+    bpy.data.objects.foreach_get('session_uid', uids)
+    wanted = np.fromiter((obj.session_uid for obj in oblist), dtype=np.int64, count=len(oblist))
+    sorter = np.argsort(uids, kind='stable')
+    return sorter[np.searchsorted(uids, wanted, sorter=sorter)]
+
+
+def find_world_corners(oblist):
+    """
+    Finds the world space bounding box corners of every object in one batch.
+    When the objects are a good part of the file, every world matrix and bounding box is read with one
+    foreach_get each; a few objects out of many are read one by one, which is cheaper than reading the whole file.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the corners of.
+    Returns
+    -------
+    corners : numpy array
+        (N, 8, 3) array of the world space bounding box corners of each object.
+    """
+    with phase('bounds'):
+        n = len(oblist)
+        objects = bpy.data.objects
+        if n and n * 8 >= len(objects) and 'session_uid' in bpy.types.ID.bl_rna.properties:
+            rows = find_object_rows(oblist)
+            matrices = np.empty(len(objects) * 16, dtype=np.float32)
+            objects.foreach_get('matrix_world', matrices)
+            local = np.empty(len(objects) * 24, dtype=np.float32)
+            objects.foreach_get('bound_box', local)
+            # Matrix properties are read column by column.
+            matrices = matrices.reshape(-1, 4, 4)[rows].transpose(0, 2, 1).astype(float)
+            local = local.reshape(-1, 8, 3)[rows].astype(float)
+        else:
+            matrices = np.empty((n, 4, 4))
+            local = np.empty((n, 8, 3))
+            for i, obj in enumerate(oblist):
+                matrices[i] = obj.matrix_world
+                local[i] = obj.bound_box
+        return transform_corners(matrices, local)
+
+
+def find_geometry_key(obj):
+    """
+    Finds the key an object's evaluated vertices are cached under.
+    Objects whose evaluated geometry is exactly their mesh share the mesh's key, so instances are only read once.
+    Arguments
+    ---------
+    obj : Blender object
+        Object to find the key of.
+    Returns
+    -------
+    key : int
+        Pointer of the datablock that owns the geometry.
+    signature : tuple
+        Kind, name and size of that datablock, used to reject stale entries. The kind is 'DATA' for
+        a mesh read as it is and 'EVALUATED' for geometry that modifiers, shape keys or animation may change.
+    """
+    if obj.type == 'MESH' and not obj.modifiers and obj.data.shape_keys is None:
+        return obj.data.as_pointer(), ('DATA', obj.data.name, len(obj.data.vertices))
+    return obj.as_pointer(), ('EVALUATED', obj.name, obj.type)
+
+
+def find_convex_hull(vertices):
+    """
+    Reduces a set of points to the vertices of its convex hull.
+    Extreme points in any direction always lie on the hull, so support queries only need these.
+    Arguments
+    ---------
+    vertices : numpy array
+        (M, 3) array of points.
+    Returns
+    -------
+    hull : numpy array
+        (H, 3) array of hull vertices, or the input points if they are too few or degenerate.
+    """
+    if len(vertices) <= 64:
+        return vertices
+    mesh = bpy.data.meshes.new("blign_hull")
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', vertices.astype(np.float32).ravel())
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bpy.data.meshes.remove(mesh)
+    result = bmesh.ops.convex_hull(bm, input=bm.verts)
+    hull = np.array([ele.co for ele in result['geom']
+                     if isinstance(ele, bmesh.types.BMVert)], dtype=float)
+    bm.free()
+    if len(hull) < 4:
+        return vertices
+    return hull
+
+
+def cache_hull_vertices(key, signature, hull):
+    """
+    Stores hull vertices in the cache, evicting the least recently used entries over the budget.
+    Arguments
+    ---------
+    key : int
+        Pointer of the datablock that owns the geometry.
+    signature : tuple
+        Kind, name and size of that datablock, from find_geometry_key.
+    hull : numpy array
+        (H, 3) array of hull vertices.
+    Returns
+    -------
+    """
+    global _vertex_cache_bytes
+    budget = bpy.context.scene.object_settings.cache_budget * 2 ** 20
+    drop_cached_hull(key)
+    _vertex_cache[key] = (signature, hull)
+    _vertex_cache_bytes += hull.nbytes
+    while _vertex_cache_bytes > budget and len(_vertex_cache) > 1:
+        drop_cached_hull(next(iter(_vertex_cache)))
+
+
+def drop_cached_hull(key=None):
+    """
+    Drops one entry of the hull cache, or the whole cache.
+    Arguments
+    ---------
+    key : int
+        Pointer of the datablock to drop. If None, every entry is dropped.
+    Returns
+    -------
+    """
+    global _vertex_cache_bytes
+    if key is None:
+        _vertex_cache.clear()
+        _vertex_cache_bytes = 0
+    elif key in _vertex_cache:
+        _vertex_cache_bytes -= _vertex_cache.pop(key)[1].nbytes
+
+
+def find_hull_vertices(obj, depsgraph):
+    """
+    Finds the local space convex hull of an object's evaluated geometry, reading its vertices in bulk and caching the hull.
+    Objects without geometry fall back to their bounding box corners.
+    Arguments
+    ---------
+    obj : Blender object
+        Object to find the hull of.
+    depsgraph : Blender depsgraph
+        Evaluated depsgraph used for objects with modifiers or shape keys.
+    Returns
+    -------
+    hull : numpy array
+        (H, 3) array of local space hull vertex coordinates.
+    """
+    key, signature = find_geometry_key(obj)
+    cached = _vertex_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        _vertex_cache.move_to_end(key)
+        return cached[1]
+
+    vertices = np.empty(0)
+    if obj.data is not None and key == obj.data.as_pointer():
+        vertices = np.empty(len(obj.data.vertices) * 3)
+        obj.data.vertices.foreach_get('co', vertices)
+    elif obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}:
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = eval_obj.to_mesh()
+        if mesh is not None:
+            vertices = np.empty(len(mesh.vertices) * 3)
+            mesh.vertices.foreach_get('co', vertices)
+        eval_obj.to_mesh_clear()
+    vertices = vertices.reshape(-1, 3)
+    if not len(vertices):
+        vertices = np.array(obj.bound_box, dtype=float)
+
+    hull = find_convex_hull(vertices)
+    cache_hull_vertices(key, signature, hull)
+    return hull
+
+
+def invalidate_geometry_cache(depsgraph=None):
+    """
+    Drops cached hulls of every datablock whose geometry changed in a depsgraph update,
+    and cached bounds of every object whose geometry or world matrix changed.
+    Transform updates that leave the world matrix where Blign already shifted the entry keep it.
+    Arguments
+    ---------
+    depsgraph : Blender depsgraph
+        Depsgraph passed to the update handler. If None, every cache and the ordering index are dropped.
+    Returns
+    -------
+    """
+    if depsgraph is None:
+        drop_cached_hull()
+        drop_cached_bounds()
+        _order_index.clear()
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry:
+            drop_cached_hull(update.id.original.as_pointer())
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        entry = _bounds_cache.get(obj.as_pointer())
+        if entry is None:
+            continue
+        if update.is_updated_geometry or (update.is_updated_transform and not np.allclose(
+                np.array(obj.matrix_world), entry['matrix'], rtol=1e-6, atol=1e-6)):
+            del _bounds_cache[obj.as_pointer()]
+
+
+def find_cached(oblist, kind, compute):
+    """
+    Looks up one kind of per-object world space result in the bounds cache, computing only the misses in one batch.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to look up.
+    kind : hashable
+        Name of the result, e.g. 'corners' or ('support', 'x', '+').
+    compute : function
+        Takes a list of objects and returns an array with one row per object.
+    Returns
+    -------
+    values : numpy array
+        Array with one row per object of oblist.
+    """
+    if not oblist:
+        return compute(oblist)
+    entries = []
+    missing = []
+    for i, obj in enumerate(oblist):
+        entry = _bounds_cache.get(obj.as_pointer())
+        if entry is None or kind not in entry:
+            missing.append(i)
+        entries.append(entry)
+    if missing:
+        objects = [oblist[i] for i in missing]
+        for i, obj, value in zip(missing, objects, compute(objects)):
+            if entries[i] is None:
+                entries[i] = _bounds_cache[obj.as_pointer()] = {'matrix': np.array(obj.matrix_world)}
+            entries[i][kind] = value
+    return np.array([entry[kind] for entry in entries])
+
+
+def shift_cached_bounds(oblist, offsets):
+    """
+    Moves the cached bounds of objects that Blign is translating, so they stay valid.
+    Entries of parented objects are dropped, since their location is not in world space.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects being moved.
+    offsets : numpy array
+        (N, 3) array of location changes.
+    Returns
+    -------
+    """
+    for obj, offset in zip(oblist, offsets):
+        key = obj.as_pointer()
+        entry = _bounds_cache.get(key)
+        if entry is None:
+            continue
+        if obj.parent is not None:
+            del _bounds_cache[key]
+            continue
+        for kind, value in entry.items():
+            if kind == 'matrix':
+                value[:3, 3] += offset
+            else:
+                entry[kind] = value + offset
+
+
+def drop_cached_bounds(oblist=None):
+    """
+    Drops the cached bounds of some objects, or of every object.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to drop. If None, the whole cache is dropped.
+    Returns
+    -------
+    """
+    if oblist is None:
+        _bounds_cache.clear()
+        return
+    for obj in oblist:
+        _bounds_cache.pop(obj.as_pointer(), None)
+
+
+def find_sort_order(oblist, kind, keys):
+    """
+    Sorts objects by a key through the ordering index, so repeated and multi-axis operations on the same
+    selection update the last order instead of sorting from scratch. Objects added to or removed from the
+    selection and objects whose key changed are merged into the order of the others.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects being sorted.
+    kind : hashable
+        Name of the key, e.g. 'x', 'NAME', 'SIZE' or ('PROPERTY', name).
+    keys : numpy array
+        (N,) array of each object's current key.
+    Returns
+    -------
+    order : numpy array
+        (N,) array of object indices by ascending key, ties going to the lower index.
+    """
+    pointers = np.fromiter((obj.as_pointer() for obj in oblist), dtype=np.uint64, count=len(oblist))
+    keys = np.array(keys)
+    entry = _order_index.get(kind)
+    with phase('sort'):
+        if entry is None or not len(entry['pointers']):
+            order = sort_order(keys)
+        elif np.array_equal(entry['pointers'], pointers):
+            order = update_order(entry['order'], entry['keys'], keys)
+        else:
+            old = entry['pointers']
+            sorter = np.argsort(old)
+            found = np.minimum(np.searchsorted(old, pointers, sorter=sorter), len(old) - 1)
+            old_of_new = np.where(old[sorter[found]] == pointers, sorter[found], -1)
+            order = update_order(entry['order'], entry['keys'], keys, old_of_new)
+    _order_index[kind] = {'pointers': pointers, 'keys': keys, 'order': order}
+    return order
+
+
+def find_packed_hulls(oblist):
+    """
+    Reads the hull of every object and its world matrix once, packed for blign.parallel.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to read.
+    Returns
+    -------
+    vertices : numpy array
+        (M, 3) array of every object's local space hull vertices.
+    offsets : numpy array
+        (N + 1,) array of where each object's vertices start in vertices.
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    matrices = np.empty((len(oblist), 4, 4))
+    hulls = []
+    for i, obj in enumerate(oblist):
+        matrices[i] = obj.matrix_world
+        hulls.append(find_hull_vertices(obj, depsgraph))
+    vertices, offsets = pack_hulls(hulls)
+    return vertices, offsets, matrices
+
+
+def find_support_points(oblist, u):
+    """
+    Finds the point of each object's evaluated geometry that lies furthest along a world space direction.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the points of.
+    u : numpy array
+        World space direction to query, need not be normalized.
+    Returns
+    -------
+    p : numpy array
+        (N, 3) array of the world space support point of each object.
+    """
+    settings = bpy.context.scene.object_settings
+    vertices, offsets, matrices = find_packed_hulls(oblist)
+    p = find_packed_support(vertices, offsets, matrices, u,
+                            settings.bounds_backend, settings.bounds_workers)
+    return p
+
+
+def find_exact_vertices(oblist, direction, vertex_sign, basis=None):
+    """
+    Finds the extreme vertex of each object's evaluated geometry in a given direction.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the vertices of.
+    direction : str
+        Direction in 3D space ['x', 'y', 'z'].
+    vertex_sign : str
+        Sign of the vertex ['+', '-'].
+    basis : tuple
+        (rotation, origin) from find_basis whose axis the direction is, None for the world axes.
+    Returns
+    -------
+    p : numpy array
+        (N, 3) array of the desired world space vertex on each object.
+    """
+    return find_support_points(oblist, find_axis_direction(direction, vertex_sign, basis))
+
+
+def find_exact_bounds(oblist, basis=None):
+    """
+    Finds the per-axis extents of each object's evaluated geometry.
+    In another basis, the world matrices are moved into it with one matmul before the extents are reduced.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the extents of.
+    basis : tuple
+        (rotation, origin) from find_basis, None for the world axes.
+    Returns
+    -------
+    lo : numpy array
+        (N, 3) array of each object's most negative point along x, y and z.
+    hi : numpy array
+        (N, 3) array of each object's most positive point along x, y and z.
+    center : numpy array
+        (N, 3) array of the center of each object's extents.
+    """
+    settings = bpy.context.scene.object_settings
+    vertices, offsets, matrices = find_packed_hulls(oblist)
+    if basis is not None:
+        matrices = basis_inverse(basis) @ matrices
+    return find_packed_bounds(vertices, offsets, matrices,
+                              settings.bounds_backend, settings.bounds_workers)
+
+
+def find_object_vertices(oblist, direction, vertex_sign, basis=None):
+    """
+    Finds the 3d coordinates for a specified vertex on a batch of objects.
+    Uses the evaluated geometry when exact geometry is enabled, the bounding box otherwise.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the vertices of.
+    direction : str
+        Direction in 3D space ['x', 'y', 'z'].
+    vertex_sign : str
+        Sign of the vertex ['+', '-'].
+    basis : tuple
+        (rotation, origin) from find_basis, None for the world axes.
+    Returns
+    -------
+    p : numpy array
+        (N, 3) array of the desired vertex on each object, in basis coordinates.
+    """
+    with phase('bounds'):
+        if oblist and isinstance(oblist[0], Unit):
+            return find_vertices(to_basis(np.array([unit.corners for unit in oblist]), basis), direction, vertex_sign)
+        if bpy.context.scene.object_settings.exact_geometry:
+            kind = ('support', direction, vertex_sign)
+            if basis is not None:
+                kind += tuple(find_axis_direction(direction, vertex_sign, basis))
+            return to_basis(find_cached(oblist, kind, lambda obs: find_exact_vertices(obs, direction, vertex_sign, basis)),
+                            basis)
+        return find_vertices(to_basis(find_cached(oblist, 'corners', find_world_corners), basis), direction, vertex_sign)
+
+
+def find_object_bounds(oblist, basis=None):
+    """
+    Finds the per-axis extents of a batch of objects.
+    Uses the evaluated geometry when exact geometry is enabled, the bounding box otherwise.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to find the extents of.
+    basis : tuple
+        (rotation, origin) from find_basis whose axes the extents are along, None for the world axes.
+    Returns
+    -------
+    lo : numpy array
+        (N, 3) array of each object's most negative point along x, y and z.
+    hi : numpy array
+        (N, 3) array of each object's most positive point along x, y and z.
+    center : numpy array
+        (N, 3) array of the center of each object's extents.
+    """
+    with phase('bounds'):
+        if oblist and isinstance(oblist[0], Unit):
+            return find_bounds(to_basis(np.array([unit.corners for unit in oblist]), basis))
+        if bpy.context.scene.object_settings.exact_geometry:
+            if basis is not None:
+                # Extents along other axes are not cached, since moving objects shifts them differently.
+                return find_exact_bounds(oblist, basis)
+            extents = find_cached(oblist, 'extents', lambda obs: np.stack(find_exact_bounds(obs)[:2], axis=1))
+            lo, hi = extents[:, 0], extents[:, 1]
+            return lo, hi, (lo + hi) / 2
+        return find_bounds(to_basis(find_cached(oblist, 'corners', find_world_corners), basis))
+
+
+def get_locations(oblist):
+    """
+    Reads the locations of a list of objects into one array.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to read the locations of.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of object locations.
+    """
+    with phase('read'):
+        locations = np.empty((len(oblist), 3))
+        for i, obj in enumerate(oblist):
+            locations[i] = obj.location
+        return locations
+
+
+def set_locations(oblist, locations, update=True):
+    """
+    Writes an array of locations back to a list of objects.
+    Only objects whose location actually changed are written, each with a
+    single vector assignment, and the view layer is updated once at the end.
+    Their cached bounds are shifted along with them, and while an operator runs their old
+    and new locations are kept for Revert.
+    While a chunked operator is computing, the writes are queued instead. While a frame range
+    is keyframed, every location is queued as a keyframe and nothing is moved.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects to move.
+    locations : numpy array
+        (N, 3) array of new object locations.
+    update : bool
+        If False, the view layer is left for Blender to update, as inside depsgraph handlers.
+    Returns
+    -------
+    """
+    with phase('write'):
+        if _keyframe_writes is not None:
+            _keyframe_writes.append((list(oblist), np.array(locations)))
+            return
+        old = get_locations(oblist)
+        changed = np.flatnonzero(np.any(old != locations, axis=1))
+        shift_cached_bounds([oblist[i] for i in changed], locations[changed] - old[changed])
+        if _recording is not None and len(changed):
+            _recording.append(([oblist[i] for i in changed], old[changed], locations[changed]))
+        if _deferred_writes is not None:
+            _deferred_writes.append(
+                ([oblist[i] for i in changed], locations[changed]))
+            return
+        for i in changed:
+            oblist[i].location = locations[i]
+        if len(changed) and update:
+            bpy.context.view_layer.update()
+
+
+class Unit:
+    """A hierarchy or collection that is aligned as one rigid object.
+    It stands in for a Blender object in the align and distribute functions: its location is
+    the world location of its first root, its bounds are the union of its members' bounds,
+    and moving it moves only its roots, which carry the other members along. Blign objects
+    parented to a member are pinned, moved back by as much as the unit moves so they stay put.
+    """
+
+    def __init__(self, roots, members, corners, pinned=()):
+        self.roots = roots
+        self.members = members
+        self.corners = corners
+        self.pinned = list(pinned)
+        self.blign = False
+        self._location = np.array(roots[0].matrix_world)[:3, 3]
+
+    @property
+    def parent(self):
+        return self.roots[0].parent
+
+    def as_pointer(self):
+        return self.roots[0].as_pointer()
+
+    def find_root_locations(self, location):
+        """Locations of the roots and the pinned objects that would move the unit to a world location,
+        in their parents' space."""
+        delta = np.asarray(location, dtype=float) - self._location
+        locations = []
+        for obj in self.roots + self.pinned:
+            shift = -delta if obj.blign else delta
+            if obj.parent is None:
+                local = shift
+            else:
+                basis = np.array(obj.parent.matrix_world)[:3, :3] @ np.array(obj.matrix_parent_inverse)[:3, :3]
+                local = np.linalg.solve(basis, shift)
+            locations.append(np.array(obj.location) + local)
+        return locations
+
+    @property
+    def location(self):
+        return self._location.copy()
+
+    @location.setter
+    def location(self, location):
+        delta = np.asarray(location, dtype=float) - self._location
+        for obj, obj_location in zip(self.roots + self.pinned, self.find_root_locations(location)):
+            obj.location = obj_location
+        self._location = self._location + delta
+        self.corners = self.corners + delta
+        drop_cached_bounds(self.members[1:])
+
+
+def find_selected_units():
+    """
+    Finds what the align and distribute functions move: the selected objects, or the hierarchies or
+    collections they belong to when Move is set to Hierarchies or Collections. Blign objects are left
+    out of units, see core.find_unit_groups. An object linked straight to the scene collection is a unit
+    of its own. The parents and children of the whole scene are read once.
+    Arguments
+    ---------
+    Returns
+    -------
+    oblist : list
+        Selected Blender objects, or Unit objects.
+    """
+    mode = bpy.context.scene.object_settings.align_units
+    selected = bpy.context.selected_objects
+    if mode == 'OBJECT':
+        return selected
+
+    objects = list(bpy.context.scene.objects)
+    index = {obj.as_pointer(): i for i, obj in enumerate(objects)}
+    parents = np.array([-1 if obj.parent is None else index.get(obj.parent.as_pointer(), -1) for obj in objects],
+                       dtype=int)
+    blign = np.array([obj.blign for obj in objects], dtype=bool)
+    chosen = [index[obj.as_pointer()] for obj in selected if obj.as_pointer() in index]
+    collections = np.full(len(objects), -1)
+    collection_members = []
+    if mode == 'COLLECTION':
+        masters = {scene.collection.as_pointer() for scene in bpy.data.scenes}
+        found = {}
+        for i in chosen:
+            users = objects[i].users_collection
+            if users and users[0].as_pointer() not in masters:
+                if users[0].as_pointer() not in found:
+                    found[users[0].as_pointer()] = len(collection_members)
+                    collection_members.append([index[obj.as_pointer()] for obj in users[0].all_objects
+                                               if obj.as_pointer() in index])
+                collections[i] = found[users[0].as_pointer()]
+
+    groups = find_unit_groups(chosen, parents, blign, mode, collections, collection_members)
+    if not groups:
+        return []
+    flat = [objects[i] for _, members, _ in groups for i in members]
+    offsets = np.cumsum([0] + [len(members) for _, members, _ in groups])
+    lo, hi = find_object_bounds(flat)[:2]
+    corners = box_corners(*union_bounds(lo, hi, offsets))
+    return [Unit([objects[i] for i in roots], [objects[i] for i in members], unit_corners,
+                 [objects[i] for i in pinned])
+            for (roots, members, pinned), unit_corners in zip(groups, corners)]
+
+
+class BlenderReader:
+    """Reads Blender objects and units for the operations in blign.core, through the bounds and order caches."""
+
+    def locations(self, oblist):
+        return get_locations(oblist)
+
+    def points(self, oblist, direction, vertex_sign, basis=None):
+        return find_object_vertices(oblist, direction, vertex_sign, basis)
+
+    def extents(self, oblist, basis=None):
+        return find_object_bounds(oblist, basis)[:2]
+
+    def sort(self, oblist, kind, keys):
+        return find_sort_order(oblist, kind, keys)
+
+    def names(self, oblist):
+        return [obj.roots[0].name if isinstance(obj, Unit) else obj.name for obj in oblist]
+
+    def property_keys(self, oblist, name):
+        return find_property_keys(oblist, name)
+
+
+# The reader every operation reads the scene through.
+READER = BlenderReader()
+
+
+def start_live_alignment(members, references, direction, columns=None, line=None, basis=None):
+    """
+    Remembers an alignment so live alignment can keep its members on it, if Live Alignment is enabled.
+    The previous live alignment is always stopped. Hierarchy and collection units are not kept live.
+    Arguments
+    ---------
+    members : list
+        Blender objects that were aligned. Any of the references among them are left out.
+    references : list
+        Blign objects the alignment was made to, empty when aligning to the world origin.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    columns : list
+        Location columns of a point alignment, from AXIS_COLUMNS or PLANE_COLUMNS.
+    line : tuple
+        (clamp, stations) of an alignment to the line through 2 references, instead of columns.
+    basis : tuple
+        (rotation, origin) from find_basis the columns are in, None for the world axes.
+    Returns
+    -------
+    """
+    global _live_alignment
+    stop_live_alignment()
+    if not bpy.context.scene.object_settings.live_alignment or (members and isinstance(members[0], Unit)):
+        return
+    reference_keys = {obj.as_pointer() for obj in references}
+    members = [obj for obj in members if obj.as_pointer() not in reference_keys]
+    _live_alignment = {
+        'members': members,
+        'member_keys': [obj.as_pointer() for obj in members],
+        'references': list(references),
+        'reference_keys': reference_keys,
+        'direction': direction,
+        'columns': columns,
+        'line': line,
+        'basis': basis,
+    }
+    _live_alignment['target'] = find_live_target(_live_alignment)
+
+
+def stop_live_alignment(self=None, context=None):
+    """Forgets the live alignment. Also the update callback of BlignSettings.live_alignment."""
+    global _live_alignment
+    _live_alignment = None
+
+
+def find_live_target(live):
+    """
+    Finds the point or line a live alignment aligns to from its references.
+    Arguments
+    ---------
+    live : dict
+        Live alignment from start_live_alignment.
+    Returns
+    -------
+    target : numpy array
+        Target point in the coordinates of the alignment's basis, or the (2, 3) array of the points the line runs through.
+    """
+    references = live['references']
+    direction = live['direction']
+    if live['line'] is not None:
+        if direction == 'center':
+            return get_locations(references)
+        return find_object_vertices(references, direction[1], direction[0])
+    return find_alignment_target(READER, references[0] if references else None, direction, live['basis'])
+
+
+def solve_live_alignment(live, oblist):
+    """
+    Finds where some members of a live alignment belong, using the cached target and bounds.
+    Arguments
+    ---------
+    live : dict
+        Live alignment from start_live_alignment.
+    oblist : list
+        Members to solve.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of aligned locations.
+    """
+    basis = live['basis']
+    locations = to_basis(get_locations(oblist), basis)
+    direction = live['direction']
+    if direction == 'center':
+        points = locations
+    else:
+        points = find_object_vertices(oblist, direction[1], direction[0], basis)
+    with phase('math'):
+        if live['line'] is None:
+            return from_basis(align_to_point(locations, points, live['target'], live['columns']), basis)
+        p1, p2 = live['target']
+        return locations + project_onto_line(points, p1, p2, *live['line']) - points
+
+
+def update_live_alignment(depsgraph):
+    """
+    Re-solves a live alignment after a depsgraph update. When a reference moved, the target is
+    found again and every member is re-solved; otherwise only the members that moved are.
+    Only members that end up somewhere else are written.
+    Arguments
+    ---------
+    depsgraph : Blender depsgraph
+        Depsgraph passed to the update handler.
+    Returns
+    -------
+    """
+    global _live_solving
+    if _live_solving:
+        return
+    live = _live_alignment
+    moved = {update.id.original.as_pointer() for update in depsgraph.updates
+             if isinstance(update.id, bpy.types.Object)
+             and (update.is_updated_transform or update.is_updated_geometry)}
+    if not moved:
+        return
+    _live_solving = True
+    try:
+        if moved & live['reference_keys']:
+            live['target'] = find_live_target(live)
+            oblist = live['members']
+        else:
+            oblist = [obj for obj, key in zip(live['members'], live['member_keys']) if key in moved]
+        if not oblist:
+            return
+        old = get_locations(oblist)
+        locations = solve_live_alignment(live, oblist)
+        changed = np.flatnonzero(~np.isclose(locations, old, rtol=1e-6, atol=1e-6).all(axis=1))
+        set_locations([oblist[i] for i in changed], locations[changed], update=False)
+    except (ReferenceError, ValueError):
+        # A member or reference was deleted, or the 2 references now coincide.
+        stop_live_alignment()
+    finally:
+        _live_solving = False
+
+
+def find_basis():
+    """
+    Finds the axes and origin that alignment and distribution work in, from the Axes setting:
+    the world, the active object's local axes, the current custom transform orientation or the 3D cursor.
+    Scale and shear are removed, so distances stay in world units.
+    Arguments
+    ---------
+    Returns
+    -------
+    basis : tuple
+        (rotation, origin): (3, 3) array whose columns are the basis axes in world space, and the
+        world space origin. None for the world axes, or when the chosen basis does not exist.
+    """
+    mode = bpy.context.scene.object_settings.basis
+    if mode == 'ACTIVE':
+        obj = bpy.context.view_layer.objects.active
+        if obj is None:
+            return None
+        matrix = np.array(obj.matrix_world)
+    elif mode == 'ORIENTATION':
+        orientation = bpy.context.scene.transform_orientation_slots[0].custom_orientation
+        if orientation is None:
+            return None
+        matrix = np.eye(4)
+        matrix[:3, :3] = np.array(orientation.matrix)
+    elif mode == 'CURSOR':
+        matrix = np.array(bpy.context.scene.cursor.matrix)
+    else:
+        return None
+    return orthonormal_basis(matrix)
+
+
+def align_selected(columns, direction, blign_obj=None):
+    """
+    Aligns the selected objects on an axis or plane of the basis, to its origin or to a Blign object.
+    Arguments
+    ---------
+    columns : list
+        Location columns to set, from AXIS_COLUMNS or PLANE_COLUMNS.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    blign_obj : Blender object
+        Blign object to align to, None to align to the origin of the basis.
+    Returns
+    -------
+    """
+    basis = find_basis()
+    oblist = find_selected_units()
+    set_locations(oblist, core.align_objects(READER, oblist, bpy.context.scene.object_settings,
+                                             columns, direction, blign_obj, basis))
+    start_live_alignment(oblist, [blign_obj] if blign_obj is not None else [], direction,
+                         columns=columns, basis=basis)
+
+
+def align_axis_0():
+    """
+    Aligns the object on the principal, function called in Blign_Align_Button0.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    axis = bpy.context.scene.object_settings.Axis0
+    align_selected(AXIS_COLUMNS[axis], getattr(bpy.context.scene.object_settings, axis + '_selected0'))
+
+
+def align_plane_0():
+    """
+    Aligns the object to the same plane as an added Blign object, function called in Blign_Align_Button1.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    plane = bpy.context.scene.object_settings.Plane0
+    align_selected(PLANE_COLUMNS[plane],
+                   getattr(bpy.context.scene.object_settings, plane.replace('-', '') + '_selected0'))
+
+
+def align_axis_1():
+    """
+    Aligns the object to an added Blign object, function called in Blign_Align_Button1.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    axis = bpy.context.scene.object_settings.Axis1
+    align_selected(AXIS_COLUMNS[axis], getattr(bpy.context.scene.object_settings, axis + '_selected1'),
+                   get_blign_objects()[0])
+
+
+def align_plane_1():
+    """
+    Aligns the object to the same plane as the an added Blign object, function called in Blign_Align_Button1.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    plane = bpy.context.scene.object_settings.Plane1
+    align_selected(PLANE_COLUMNS[plane],
+                   getattr(bpy.context.scene.object_settings, plane.replace('-', '') + '_selected1'),
+                   get_blign_objects()[0])
+
+
+def align_2():
+    """
+    Aligns the object to two added Blign objects, function called in Blign_Align_Button2.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    settings = bpy.context.scene.object_settings
+    references = get_blign_objects()
+    oblist, locations = core.align_objects_to_line(READER, find_selected_units(), references, settings)
+    set_locations(oblist, locations)
+    start_live_alignment(oblist, references, settings.align_to_2_ops,
+                         line=(settings.clamp_segment2, settings.stations2))
+
+
+def distribute_0_or_1(indicate, axis, dist_type, spacing):
+    """
+    Distributes objects from their centers or edges when 0 or 1 blign objects are added.
+    Arguments
+    ---------
+    indicate : bool
+        If True, user can set spacing. If False, Blign finds default spacing.
+    axis: str
+        Either x y or z.
+    dist_type : str
+        The user's choice to distribute from either center or edge.
+    spacing : int
+        number of units between objects (specified by user).
+    Returns
+    -------
+    """
+    oblist = find_selected_units()
+    locations = core.distribute_objects(READER, oblist, bpy.context.scene.object_settings,
+                                        indicate, axis, dist_type, spacing, find_basis())
+    if locations is not None:
+        set_locations(oblist, locations)
+
+
+def distribute_2():
+    """
+    Distributes objects from their centers or edges when 2 blign objects are added.
+    Arguments
+    ---------
+
+    Returns
+    -------
+    """
+    oblist = find_selected_units()
+    locations = core.distribute_objects_between(READER, oblist, get_blign_objects(),
+                                                bpy.context.scene.object_settings, find_basis())
+    if locations is not None:
+        set_locations(oblist, locations)
+
+
+# Instances transformed per batch, so millions of them never need their (N, 8, 3) corners at once.
+INSTANCE_CHUNK = 65536
+
+
+def find_reference_box(reference):
+    """Local bounding box corners of what an instance refers to. Collections and geometry count as points."""
+    if isinstance(reference, bpy.types.Object):
+        return np.array(reference.bound_box, dtype=float)
+    return np.zeros((8, 3))
+
+
+def find_instances(objects, depsgraph):
+    """
+    Reads the world matrices of the instances objects generate with geometry nodes,
+    from the evaluated depsgraph and without realizing them. Particle instances are left out,
+    since their locations come from the particle simulation and cannot be written back.
+    Where Blender exposes the evaluated instances as a point cloud they are read in bulk with foreach_get,
+    otherwise the depsgraph's instances are walked once for every object and sorted by parent.
+    Arguments
+    ---------
+    objects : list
+        Objects whose instances are read.
+    depsgraph : Blender depsgraph
+        Evaluated depsgraph.
+    Returns
+    -------
+    instances : list
+        One (matrices, boxes, reference) tuple per object: an (N, 4, 4) array of instance world matrices,
+        an (R, 8, 3) array of the local bounding box corners of each instanced reference
+        and an (N,) array of the index in boxes of each instance's reference.
+    """
+    instances = [None] * len(objects)
+    walked = {}
+    for i, obj in enumerate(objects):
+        evaluated = obj.evaluated_get(depsgraph)
+        if not hasattr(evaluated, 'evaluated_geometry'):
+            walked[obj.as_pointer()] = i
+            continue
+        geometry = evaluated.evaluated_geometry()
+        points = geometry.instances_pointcloud()
+        if points is None:
+            instances[i] = np.empty((0, 4, 4)), np.zeros((1, 8, 3)), np.empty(0, dtype=np.int32)
+            continue
+        count = len(points.points)
+        transforms = np.empty(count * 16, dtype=np.float32)
+        points.attributes['instance_transform'].data.foreach_get('value', transforms)
+        reference = np.zeros(count, dtype=np.int32)
+        if '.reference_index' in points.attributes:
+            points.attributes['.reference_index'].data.foreach_get('value', reference)
+        boxes = np.array([find_reference_box(item) for item in geometry.instance_references()] or [np.zeros((8, 3))])
+        # Matrix attributes are stored column by column.
+        matrices = np.array(evaluated.matrix_world) @ transforms.reshape(-1, 4, 4).transpose(0, 2, 1)
+        instances[i] = matrices, boxes, reference
+
+    if walked:
+        matrices = [[] for _ in objects]
+        boxes = [[] for _ in objects]
+        indices = [{} for _ in objects]
+        reference = [[] for _ in objects]
+        for instance in depsgraph.object_instances:
+            if not instance.is_instance or instance.particle_system:
+                continue
+            i = walked.get(instance.parent.original.as_pointer())
+            if i is None:
+                continue
+            matrices[i].append(np.array(instance.matrix_world))
+            key = instance.object.original.as_pointer()
+            if key not in indices[i]:
+                indices[i][key] = len(boxes[i])
+                boxes[i].append(find_reference_box(instance.object.original))
+            reference[i].append(indices[i][key])
+        for i in walked.values():
+            instances[i] = (np.array(matrices[i]).reshape(-1, 4, 4), np.array(boxes[i] or [np.zeros((8, 3))]),
+                            np.array(reference[i], dtype=np.int32))
+    return instances
+
+
+def reduce_instance_corners(matrices, boxes, reference, reduce):
+    """
+    Applies a function to the world space bounding box corners of instances a chunk at a time.
+    Arguments
+    ---------
+    matrices : numpy array
+        (N, 4, 4) array of instance world matrices.
+    boxes : numpy array
+        (R, 8, 3) array of local bounding box corners of each reference.
+    reference : numpy array
+        (N,) array of each instance's reference.
+    reduce : function
+        Takes (M, 8, 3) world space corners and returns one row per instance.
+    Returns
+    -------
+    values : numpy array
+        The rows of every chunk, joined.
+    """
+    with phase('bounds'):
+        return np.concatenate([
+            reduce(transform_corners(matrices[i:i + INSTANCE_CHUNK], boxes[reference[i:i + INSTANCE_CHUNK]]))
+            for i in range(0, len(matrices), INSTANCE_CHUNK)])
+
+
+def check_instance_target(obj, count, name):
+    """
+    Checks that the offsets of an object's instances can be written to its points, before anything is written.
+    Arguments
+    ---------
+    obj : Blender object
+        Object generating the instances.
+    count : int
+        Number of instances.
+    name : str
+        Attribute name.
+    Returns
+    -------
+    """
+    data = obj.data
+    if not hasattr(data, 'attributes'):
+        raise ValueError("{} has no point attributes to write instance offsets to".format(obj.name))
+    points = data.vertices if hasattr(data, 'vertices') else data.points
+    if len(points) != count:
+        raise ValueError("{} has {} points for {} instances".format(obj.name, len(points), count))
+    attribute = data.attributes.get(name)
+    if attribute is not None and (attribute.domain != 'POINT' or attribute.data_type != 'FLOAT_VECTOR'):
+        raise ValueError("{} is not a vector attribute on the points of {}".format(name, obj.name))
+
+
+def write_instance_offsets(obj, offsets, name):
+    """
+    Moves the instances of an object through a vector attribute on its points, one per instance,
+    which its geometry nodes apply, e.g. with Named Attribute into Translate Instances.
+    The offsets are added to the values already in the attribute, since the instances read already include them.
+    The object must have passed check_instance_target.
+    Arguments
+    ---------
+    obj : Blender object
+        Object generating the instances.
+    offsets : numpy array
+        (N, 3) array of world space offsets of the instances.
+    name : str
+        Attribute name.
+    Returns
+    -------
+    """
+    with phase('write'):
+        attributes = obj.data.attributes
+        attribute = attributes.get(name)
+        if attribute is None:
+            attribute = attributes.new(name, 'FLOAT_VECTOR', 'POINT')
+        values = np.empty(len(offsets) * 3, dtype=np.float32)
+        attribute.data.foreach_get('vector', values)
+        local = offsets @ np.linalg.inv(np.array(obj.matrix_world)[:3, :3]).T
+        attribute.data.foreach_set('vector', (values.reshape(-1, 3) + local).ravel())
+        obj.data.update()
+
+
+def move_instances(objects, find_offsets, minimum):
+    """
+    Reads the instances of objects once, checks every object's points can take the offsets, then writes them.
+    Arguments
+    ---------
+    objects : list
+        Objects generating the instances.
+    find_offsets : function
+        Takes an object's (matrices, boxes, reference) and returns the (N, 3) world space offsets of its instances.
+    minimum : int
+        Objects with fewer instances are left alone.
+    Returns
+    -------
+    count : int
+        Number of instances moved.
+    """
+    settings = bpy.context.scene.object_settings
+    with phase('read'):
+        instances = find_instances(objects, bpy.context.evaluated_depsgraph_get())
+    moved = [(obj, found) for obj, found in zip(objects, instances) if len(found[0]) >= max(minimum, 1)]
+    for obj, found in moved:
+        check_instance_target(obj, len(found[0]), settings.instance_attribute)
+    offsets = [find_offsets(*found) for obj, found in moved]
+    for (obj, found), obj_offsets in zip(moved, offsets):
+        write_instance_offsets(obj, obj_offsets, settings.instance_attribute)
+    return sum(len(obj_offsets) for obj_offsets in offsets)
+
+
+def align_instances(objects):
+    """
+    Aligns the instances of objects like align_axis_0 and align_plane_0 align objects, with the Principal Axes settings.
+    Arguments
+    ---------
+    objects : list
+        Objects generating the instances.
+    Returns
+    -------
+    count : int
+        Number of instances aligned.
+    """
+    settings = bpy.context.scene.object_settings
+    columns, direction = find_alignment(settings, '0')
+    basis = find_basis()
+
+    def find_offsets(matrices, boxes, reference):
+        if basis is not None:
+            matrices = basis_inverse(basis) @ matrices
+        locations = matrices[:, :3, 3]
+        if direction == 'center':
+            points = locations
+        else:
+            points = reduce_instance_corners(matrices, boxes, reference,
+                                             lambda corners: find_vertices(corners, direction[1], direction[0]))
+        with phase('math'):
+            aligned = align_to_point(locations, points, np.zeros(3), columns)
+            return from_basis(aligned, basis) - from_basis(locations, basis)
+
+    return move_instances(objects, find_offsets, 1)
+
+
+def distribute_instances(objects):
+    """
+    Distributes the instances of objects like distribute_0_or_1 distributes objects, with the Principal Axes settings.
+    Arguments
+    ---------
+    objects : list
+        Objects generating the instances.
+    Returns
+    -------
+    count : int
+        Number of instances distributed.
+    """
+    settings = bpy.context.scene.object_settings
+    spacing = settings.Spacing0 if settings.indicate_spacing0 else None
+    basis = find_basis()
+
+    def find_offsets(matrices, boxes, reference):
+        if basis is not None:
+            matrices = basis_inverse(basis) @ matrices
+        locations = matrices[:, :3, 3]
+        if settings.distribute_ops0 == 'center':
+            with phase('math'):
+                distributed = distribute_centers(locations, settings.Axis0, spacing)
+        else:
+            extents = reduce_instance_corners(matrices, boxes, reference,
+                                              lambda corners: np.stack(find_bounds(corners)[:2], axis=1))
+            with phase('math'):
+                distributed = distribute_edges(locations, extents[:, 0], extents[:, 1], settings.Axis0, spacing)
+        return from_basis(distributed, basis) - from_basis(locations, basis)
+
+    return move_instances(objects, find_offsets, 2)
+
+
+def read_edit_selection(objects, islands):
+    """
+    Reads the selected vertices of meshes in world space, in one foreach_get per mesh and attribute.
+    The meshes must be out of edit mode, so their data holds the edit mode changes.
+    Arguments
+    ---------
+    objects : list
+        Mesh objects.
+    islands : bool
+        If True, vertices joined by selected edges belong to one unit, otherwise every vertex is its own unit.
+    Returns
+    -------
+    parts : list
+        (object, local coordinates, selected vertex indices) of each mesh, for write_edit_selection.
+    world : numpy array
+        (S, 3) array of the selected vertices of every mesh in world space.
+    units : numpy array
+        (S,) array of the unit of each selected vertex, None when every vertex is its own unit.
+    """
+    with phase('read'):
+        parts = []
+        worlds = []
+        units = []
+        start = 0
+        for obj in objects:
+            mesh = obj.data
+            count = len(mesh.vertices)
+            co = np.empty(count * 3)
+            mesh.vertices.foreach_get('co', co)
+            co = co.reshape(-1, 3)
+            select = np.empty(count, dtype=bool)
+            mesh.vertices.foreach_get('select', select)
+            index = np.flatnonzero(select)
+            if not len(index):
+                continue
+            matrix = np.array(obj.matrix_world)
+            worlds.append(co[index] @ matrix[:3, :3].T + matrix[:3, 3])
+            if islands:
+                edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+                mesh.edges.foreach_get('vertices', edges)
+                edges = edges.reshape(-1, 2)
+                edges = edges[select[edges].all(axis=1)]
+                compact = np.cumsum(select) - 1
+                units.append(find_islands(compact[edges], len(index)) + start)
+            start += len(index)
+            parts.append((obj, co, index))
+    if not parts:
+        return parts, np.empty((0, 3)), None
+    return parts, np.concatenate(worlds), np.concatenate(units) if islands else None
+
+
+def find_edit_units(world, units):
+    """
+    Finds the location and extents of each unit of selected vertices. A unit's location is the center of its extents.
+    Arguments
+    ---------
+    world : numpy array
+        (S, 3) array of selected vertices in world space.
+    units : numpy array
+        (S,) array of the unit of each vertex, or None when every vertex is its own unit.
+    Returns
+    -------
+    locations : numpy array
+        (U, 3) array of unit locations.
+    lo : numpy array
+        (U, 3) array of each unit's most negative point.
+    hi : numpy array
+        (U, 3) array of each unit's most positive point.
+    inverse : numpy array
+        (S,) array of the row of each vertex's unit.
+    """
+    if units is None:
+        return world, world, world, np.arange(len(world))
+    with phase('bounds'):
+        order = np.argsort(units, kind='stable')
+        ordered = world[order]
+        sorted_units = units[order]
+        first = np.r_[True, sorted_units[1:] != sorted_units[:-1]]
+        lo, hi = union_bounds(ordered, ordered, np.r_[np.flatnonzero(first), len(order)])
+        inverse = np.empty(len(units), dtype=int)
+        inverse[order] = np.cumsum(first) - 1
+        return (lo + hi) / 2, lo, hi, inverse
+
+
+def write_edit_selection(parts, offsets):
+    """
+    Moves the selected vertices of meshes, in one foreach_set per mesh.
+    Arguments
+    ---------
+    parts : list
+        Meshes read by read_edit_selection.
+    offsets : numpy array
+        (S, 3) array of world space offsets of the selected vertices, in the order they were read.
+    Returns
+    -------
+    """
+    with phase('write'):
+        start = 0
+        for obj, co, index in parts:
+            stop = start + len(index)
+            co[index] += offsets[start:stop] @ np.linalg.inv(np.array(obj.matrix_world)[:3, :3]).T
+            obj.data.vertices.foreach_set('co', co.ravel())
+            obj.data.update()
+            start = stop
+
+
+def move_edit_selection(context, solve):
+    """
+    Moves the selected vertices, or the islands they form, of every mesh in edit mode.
+    Edit mode is left once so that all the meshes can be read and written in bulk, then entered again.
+    Arguments
+    ---------
+    context : Blender context
+        Context with the meshes in edit mode.
+    solve : function
+        Takes the (U, 3) unit locations, lo and hi in the coordinates of the basis, and returns their new locations.
+    Returns
+    -------
+    count : int
+        Number of units moved.
+    """
+    objects = [obj for obj in context.objects_in_mode_unique_data if obj.type == 'MESH']
+    islands = context.scene.object_settings.edit_units == 'ISLAND'
+    basis = find_basis()
+    bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        parts, world, units = read_edit_selection(objects, islands)
+        if not len(world):
+            return 0
+        locations, lo, hi, inverse = find_edit_units(to_basis(world, basis), units)
+        with phase('math'):
+            new_locations = solve(locations, lo, hi)
+            offsets = from_basis(new_locations, basis) - from_basis(locations, basis)
+        write_edit_selection(parts, offsets[inverse])
+        return len(locations)
+    finally:
+        bpy.ops.object.mode_set(mode='EDIT')
+
+
+def align_edit_selection(context):
+    """
+    Aligns the selected vertices or islands like the Align button of the Principal Axes tab,
+    or of the One Object tab when one Blign object is added.
+    Arguments
+    ---------
+    context : Blender context
+        Context with the meshes in edit mode.
+    Returns
+    -------
+    count : int
+        Number of units aligned.
+    """
+    settings = context.scene.object_settings
+    tab = '1' if count_blign_objects() == 1 else '0'
+    columns, direction = find_alignment(settings, tab)
+    target = find_alignment_target(READER, get_blign_objects()[0] if tab == '1' else None, direction, find_basis())
+
+    def solve(locations, lo, hi):
+        # A single vertex is its own extreme vertex in every direction.
+        if direction == 'center' or settings.edit_units == 'VERTEX':
+            points = locations
+        else:
+            points = find_vertices(box_corners(lo, hi), direction[1], direction[0])
+        return align_to_point(locations, points, target, columns)
+
+    return move_edit_selection(context, solve)
+
+
+def distribute_edit_selection(context):
+    """
+    Distributes the selected vertices or islands like the Distribute button of the Principal Axes tab.
+    Arguments
+    ---------
+    context : Blender context
+        Context with the meshes in edit mode.
+    Returns
+    -------
+    count : int
+        Number of units distributed.
+    """
+    settings = context.scene.object_settings
+    spacing = settings.Spacing0 if settings.indicate_spacing0 else None
+
+    def solve(locations, lo, hi):
+        if len(locations) < 2:
+            return locations
+        if settings.distribute_ops0 == 'center':
+            return distribute_centers(locations, settings.Axis0, spacing)
+        return distribute_edges(locations, lo, hi, settings.Axis0, spacing)
+
+    return move_edit_selection(context, solve)
+
+
+def push_snapshot(parts, steps):
+    """
+    Joins the parts an operation recorded into one snapshot and adds it to the Revert history.
+    Arguments
+    ---------
+    parts : list
+        (objects, old, new) tuples recorded by set_locations.
+    steps : int
+        Number of snapshots to keep.
+    Returns
+    -------
+    """
+    if not parts or steps == 0:
+        return
+    objects = [obj for oblist, _, _ in parts for obj in oblist]
+    old = np.concatenate([old for _, old, _ in parts])
+    new = np.concatenate([new for _, _, new in parts])
+    _revert_snapshots.append((objects, old, new))
+    del _revert_snapshots[:-steps]
+    _reapply_snapshots.clear()
+
+
+def clear_snapshots():
+    """Forgets every Revert and Reapply snapshot, e.g. once Blender's undo has replaced the objects."""
+    _revert_snapshots.clear()
+    _reapply_snapshots.clear()
+
+
+def snapshotted(execute):
+    """
+    Wraps an operator's execute method so that the locations it changes are kept as one snapshot for Revert.
+    Live alignment is stopped first, so the depsgraph handler does not move the objects back onto the
+    last alignment afterwards. Align operators start a new one.
+    Arguments
+    ---------
+    execute : function
+        The operator's execute method.
+    Returns
+    -------
+    wrapper : function
+        The snapshotting execute method.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _recording
+        stop_live_alignment()
+        _recording = []
+        try:
+            result = execute(self, context)
+        finally:
+            parts, _recording = _recording, None
+        push_snapshot(parts, context.scene.object_settings.snapshot_steps)
+        return result
+    return wrapper
+
+
+# Keyframe point settings carried over when keyframes are rewritten in bulk.
+KEYFRAME_ATTRIBUTES = ('interpolation', 'easing', 'type', 'handle_left_type', 'handle_right_type')
+
+
+def read_keyframe_points(points, name, width=1, dtype=float):
+    """Reads one property of every keyframe point with a single foreach_get."""
+    values = np.empty(len(points) * width, dtype=dtype)
+    points.foreach_get(name, values)
+    return values.reshape(-1, width) if width > 1 else values
+
+
+def write_keyframes(fcurve, frames, values):
+    """
+    Replaces the keyframes of an F-curve from the first to the last of some frames, in bulk.
+    The keyframe points are read, merged and written back with foreach_get and foreach_set
+    instead of one keyframe_insert per frame. Keys outside the range keep their settings,
+    new keys get the settings Blender gives new keyframe points. A curve that loses keys is
+    cleared and refilled, since removing keys one at a time reallocates the points every time.
+    Arguments
+    ---------
+    fcurve : Blender F-curve
+        Curve to write.
+    frames : numpy array
+        (F,) array of increasing frames.
+    values : numpy array
+        (F,) array of the curve's value at each frame.
+    Returns
+    -------
+    """
+    points = fcurve.keyframe_points
+    count = len(points)
+    co = read_keyframe_points(points, 'co', 2)
+    handles = [read_keyframe_points(points, name, 2) for name in ('handle_left', 'handle_right')]
+    old = {name: read_keyframe_points(points, name, dtype=np.int32) for name in KEYFRAME_ATTRIBUTES}
+    keep = (co[:, 0] < frames[0]) | (co[:, 0] > frames[-1])
+    total = np.count_nonzero(keep) + len(frames)
+
+    if total > count:
+        points.add(total - count)
+        defaults = {name: read_keyframe_points(points, name, dtype=np.int32)[count] for name in KEYFRAME_ATTRIBUTES}
+    else:
+        dropped = np.flatnonzero(~keep)[0]
+        defaults = {name: old[name][dropped] for name in KEYFRAME_ATTRIBUTES}
+        if total < count and hasattr(points, 'clear'):
+            points.clear()
+            points.add(total)
+        else:
+            # Older Blender versions cannot clear the points in one call.
+            for _ in range(count - total):
+                points.remove(points[-1], fast=True)
+
+    new_co = np.stack([frames, values], axis=1)
+    order = np.argsort(np.concatenate([co[keep, 0], frames]), kind='stable')
+    points.foreach_set('co', np.concatenate([co[keep], new_co])[order].ravel())
+    for name, handle in zip(('handle_left', 'handle_right'), handles):
+        points.foreach_set(name, np.concatenate([handle[keep], new_co])[order].ravel())
+    for name in KEYFRAME_ATTRIBUTES:
+        merged = np.concatenate([old[name][keep], np.full(len(frames), defaults[name], dtype=np.int32)])
+        points.foreach_set(name, merged[order])
+    fcurve.update()
+
+
+def find_location_fcurve(obj, action, index):
+    """
+    Finds or creates the F-curve of one location channel of an object. With layered actions (Blender 4.4+)
+    it is in the channelbag of the object's action slot, created along with the slot when needed.
+    Arguments
+    ---------
+    obj : Blender object
+        Object being keyed.
+    action : Blender action
+        The object's action.
+    index : int
+        Location channel, 0 to 2.
+    Returns
+    -------
+    fcurve : Blender F-curve
+        Curve of the channel.
+    """
+    if action_ensure_channelbag_for_slot is None:
+        fcurve = action.fcurves.find('location', index=index)
+        if fcurve is None:
+            fcurve = action.fcurves.new('location', index=index, action_group="Object Transforms")
+        return fcurve
+    slot = obj.animation_data.action_slot
+    if slot is None:
+        slot = obj.animation_data.action_slot = action.slots.new(id_type='OBJECT', name=obj.name)
+    fcurves = action_ensure_channelbag_for_slot(action, slot).fcurves
+    fcurve = fcurves.find('location', index=index)
+    if fcurve is None:
+        fcurve = fcurves.new('location', index=index)
+    return fcurve
+
+
+def insert_location_keyframes(obj, frames, locations):
+    """
+    Keys an object's location at some frames, creating its action and F-curves when needed.
+    Arguments
+    ---------
+    obj : Blender object
+        Object to key.
+    frames : numpy array
+        (F,) array of increasing frames.
+    locations : numpy array
+        (F, 3) array of the object's location at each frame.
+    Returns
+    -------
+    """
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    action = obj.animation_data.action
+    if action is None:
+        action = obj.animation_data.action = bpy.data.actions.new(obj.name + "Action")
+    for k in range(3):
+        write_keyframes(find_location_fcurve(obj, action, k), frames, locations[:, k])
+
+
+def find_keyframe_writes(writes):
+    """
+    Turns the locations an operation queued into locations of Blender objects, replacing each unit by its roots
+    and pinned objects.
+    Arguments
+    ---------
+    writes : list
+        (oblist, locations) pairs queued by set_locations.
+    Returns
+    -------
+    objects : list
+        Blender objects.
+    locations : numpy array
+        (N, 3) array of their locations.
+    """
+    objects = []
+    locations = []
+    for oblist, oblocations in writes:
+        if oblist and isinstance(oblist[0], Unit):
+            for unit, location in zip(oblist, oblocations):
+                objects.extend(unit.roots + unit.pinned)
+                locations.extend(unit.find_root_locations(location))
+        else:
+            objects.extend(oblist)
+            locations.extend(oblocations)
+    return objects, np.array(locations).reshape(-1, 3)
+
+
+def insert_keyframe_tracks(frames, found):
+    """
+    Keys every object an operation moved at the frames it was moved on.
+    Objects are matched across frames by pointer, reusing the match while their order does not change.
+    Arguments
+    ---------
+    frames : list
+        Frames the operation ran on.
+    found : list
+        (objects, locations) pairs from find_keyframe_writes, one per frame.
+    Returns
+    -------
+    """
+    index = OrderedDict()
+    tracks = np.full((len(frames), 0, 3), np.nan)
+    previous = None
+    for f, (objects, locations) in enumerate(found):
+        keys = [obj.as_pointer() for obj in objects]
+        if keys != previous:
+            for obj, key in zip(objects, keys):
+                index.setdefault(key, obj)
+            positions = {key: i for i, key in enumerate(index)}
+            columns = np.array([positions[key] for key in keys], dtype=int)
+            previous = keys
+        if len(index) > tracks.shape[1]:
+            tracks = np.concatenate([tracks, np.full((len(frames), len(index) - tracks.shape[1], 3), np.nan)], axis=1)
+        tracks[f, columns] = locations
+    frames = np.array(frames, dtype=float)
+    for i, obj in enumerate(index.values()):
+        keyed = ~np.isnan(tracks[:, i, 0])
+        if keyed.any():
+            insert_location_keyframes(obj, frames[keyed], tracks[keyed, i])
+
+
+def keyframed(execute):
+    """
+    Wraps an operator's execute method so that, when Keyframe Range is enabled, it runs once per frame
+    of the range and keys the resulting locations instead of moving the objects.
+    Each frame is evaluated with frame_set, so bounds follow the animation. The locations of all frames
+    are gathered first and every F-curve is then written once in bulk.
+    Arguments
+    ---------
+    execute : function
+        The operator's execute method.
+    Returns
+    -------
+    wrapper : function
+        The keyframing execute method.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _keyframe_writes, _deferred_writes
+        settings = context.scene.object_settings
+        if not settings.keyframe_range:
+            return execute(self, context)
+
+        scene = context.scene
+        current = scene.frame_current
+        frames = list(range(settings.keyframe_start, settings.keyframe_end + 1, settings.keyframe_step))
+        found = []
+        result = {'FINISHED'}
+        deferred, _deferred_writes = _deferred_writes, None
+        try:
+            for frame in frames:
+                scene.frame_set(frame)
+                _keyframe_writes = []
+                try:
+                    result = execute(self, context)
+                finally:
+                    writes, _keyframe_writes = _keyframe_writes, None
+                found.append(find_keyframe_writes(writes))
+            with phase('keyframes'):
+                insert_keyframe_tracks(frames, found)
+        finally:
+            _deferred_writes = deferred
+            stop_live_alignment()
+            scene.frame_set(current)
+        return result
+    return wrapper
+
+
+def find_property_keys(oblist, name):
+    """
+    Reads a custom property of each object as a sort key.
+    Arguments
+    ---------
+    oblist : list
+        Blender objects or units, a unit's property is read from its first root.
+    name : str
+        Custom property name.
+    Returns
+    -------
+    keys : numpy array
+        (N,) array of property values, infinity where the property is missing or not a number, so those objects go last.
+    """
+    keys = np.full(len(oblist), np.inf)
+    for i, obj in enumerate(oblist):
+        value = (obj.roots[0] if isinstance(obj, Unit) else obj).get(name)
+        if isinstance(value, (int, float)):
+            keys[i] = value
+    return keys
+
+
+def distribute_grid():
+    """
+    Distributes objects in a grid of columns, rows and layers, function called in Blign_Distribute_Grid.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    oblist = find_selected_units()
+    locations = core.arrange_objects(READER, oblist, bpy.context.scene.object_settings, find_basis())
+    if locations is not None:
+        set_locations(oblist, locations)
+
+
+def pack_objects():
+    """
+    Packs objects of different sizes into a compact layout on a plane, function called in Blign_Pack.
+    Arguments
+    ---------
+    Returns
+    -------
+    """
+    oblist = find_selected_units()
+    locations = core.pack_objects(READER, oblist, bpy.context.scene.object_settings, find_basis())
+    if locations is not None:
+        set_locations(oblist, locations)
+
+
+def instrumented(execute):
+    """
+    Wraps an operator's execute method so that, when Profile Operations is enabled,
+    its phases are timed, summarized in the Info report and appended to the timing log.
+    Arguments
+    ---------
+    execute : function
+        The operator's execute method.
+    Returns
+    -------
+    wrapper : function
+        The instrumented execute method.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        settings = context.scene.object_settings
+        if not settings.instrument:
+            return execute(self, context)
+        with profiling.record(self.bl_idname, len(context.selected_objects),
+                              profile=settings.capture_profile) as rec:
+            result = execute(self, context)
+        self.report({'INFO'}, rec.summary())
+        if settings.timing_log:
+            profiling.append_to_log(rec, bpy.path.abspath(settings.timing_log))
+        return result
+    return wrapper
+
+
+class ChunkedOperator:
+    """Mixin that runs an align or distribute operator modally when the selection is large.
+    The result is computed in one pass with the writes queued, then the locations are
+    written a chunk per timer tick with progress in the status bar. Esc restores every
+    object that was already moved. Small selections, and calls from scripts that go
+    straight to execute, use the synchronous path.
+    """
+    # Seconds of writing per timer tick, so the interface stays responsive.
+    tick_budget = 0.05
+
+    def invoke(self, context, event):
+        global _deferred_writes
+        if len(context.selected_objects) < context.scene.object_settings.modal_threshold:
+            return self.execute(context)
+
+        previous = _revert_snapshots[-1] if _revert_snapshots else None
+        _deferred_writes = []
+        try:
+            self.execute(context)
+        finally:
+            pending, _deferred_writes = _deferred_writes, None
+        self._snapshot = _revert_snapshots[-1] if _revert_snapshots else None
+        if self._snapshot is previous:
+            self._snapshot = None
+
+        self._objects = [obj for oblist, _ in pending for obj in oblist]
+        if not self._objects:
+            return {'FINISHED'}
+        self._locations = np.concatenate([locations for _, locations in pending])
+        self._original = get_locations(self._objects)
+        self._done = 0
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._objects))
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            stop_live_alignment()
+            for obj, location in zip(self._objects[:self._done], self._original[:self._done]):
+                obj.location = location
+            drop_cached_bounds(self._objects)
+            if _revert_snapshots and _revert_snapshots[-1] is self._snapshot:
+                _revert_snapshots.pop()
+            self.finish(context)
+            self.report({'INFO'}, "Blign cancelled, objects restored")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            start = time.perf_counter()
+            total = len(self._objects)
+            while self._done < total and time.perf_counter() - start < self.tick_budget:
+                stop = min(self._done + 256, total)
+                for i in range(self._done, stop):
+                    self._objects[i].location = self._locations[i]
+                self._done = stop
+            context.window_manager.progress_update(self._done)
+            context.workspace.status_text_set(
+                "Blign: {} / {} objects moved (Esc to cancel)".format(self._done, total))
+            if self._done == total:
+                self.finish(context)
+                return {'FINISHED'}
+
+        return {'RUNNING_MODAL'}
+
+    def finish(self, context):
+        """Removes the timer and progress display and updates the view layer once."""
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        context.view_layer.update()
+
+
+class BLIGN_OT_Add_Object(bpy.types.Operator):
+    """Class that defines the Add Object button."""
+    bl_idname = "rigidbody.blign_add_object"
+    bl_label = "Add Object"
+    bl_description = "Set selected object as a blign object"
+
+    def execute(self, context):
+        """Sets the object as object.blign."""
+
+        if len(context.selected_objects) == 1:
+            for object in context.selected_objects:
+                if not object.blign:
+                    context.view_layer.objects.active = object
+                    add_blign_object(object, context.scene)
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Remove_Object(bpy.types.Operator):
+    """Class that defines the Remove Object button."""
+    bl_idname = "rigidbody.blign_remove_object"
+    bl_label = "Remove Object"
+    bl_description = "Remove object from as a blign object"
+
+    @classmethod
+    def poll(cls, context):
+        if context.object:
+            return context.object.blign
+
+    def execute(self, context):
+        """Unsets object as object.blign."""
+        for object in context.selected_objects:
+            if object.blign:
+                context.view_layer.objects.active = object
+                remove_blign_object(object, context.scene)
+
+        return {'FINISHED'}
+
+
+class Blign_OT_Clear_Objects(bpy.types.Operator):
+    """CLass that defines the Clear Objects button."""
+    bl_idname = "rigidbody.blign_clear_objects"
+    bl_label = "Clear Objects"
+    bl_description = "Removes all Blign Objects"
+
+    def execute(self, context):
+        for object in get_blign_objects(context.scene):
+            remove_blign_object(object, context.scene)
+
+        return {'FINISHED'}
+
+class BLIGN_OT_Align_Button0(ChunkedOperator, bpy.types.Operator):
+    """Defines the Align button."""
+    bl_idname = "rigidbody.blign_align_button0"
+    bl_label = "Align"
+    bl_description = "Align selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        """Iterates through all objects, counts number of blign objects.
+        If number of blign objects = 0, aligns selected objects to the selected axis or plane.
+        """
+        i = count_blign_objects()
+        plane = bpy.context.scene.object_settings.check_plane0
+
+        if i == 0:
+            if plane == False:
+                align_axis_0()
+            else:
+                align_plane_0()
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Align_Button1(ChunkedOperator, bpy.types.Operator):
+    """Defines the Align button."""
+    bl_idname = "rigidbody.blign_align_button1"
+    bl_label = "Align"
+    bl_description = "Align selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        """Iterates through all objects, counts number of blign objects.
+        If number of blign objects = 1, aligns selected objects to that one object.
+        """
+        i = count_blign_objects()
+        plane = bpy.context.scene.object_settings.check_plane1
+
+        if i == 1:
+            if plane == False:
+                align_axis_1()
+            else:
+                align_plane_1()
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Align_Button2(ChunkedOperator, bpy.types.Operator):
+    """Defines the Align button."""
+    bl_idname = "rigidbody.blign_align_button2"
+    bl_label = "Align"
+    bl_description = "Align selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        """Iterates through all objects, counts number of blign objects.
+        If number of blign objects = 2, aligns selected objects along the line between the 2 blign objects.
+        """
+        if count_blign_objects() == 2:
+            align_2()
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Button0(ChunkedOperator, bpy.types.Operator):
+    """Defines the Distribute button."""
+    bl_idname = "rigidbody.blign_distribute_button0"
+    bl_label = "Distribute"
+    bl_description = "Distribute objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        indicate = bpy.context.scene.object_settings.indicate_spacing0
+        axis = bpy.context.scene.object_settings.Axis0
+        dist_type = bpy.context.scene.object_settings.distribute_ops0
+        spacing = bpy.context.scene.object_settings.Spacing0
+
+        if count_blign_objects() != 2:
+            distribute_0_or_1(indicate, axis, dist_type, spacing)
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Grid(ChunkedOperator, bpy.types.Operator):
+    """Defines the Distribute Grid button."""
+    bl_idname = "rigidbody.blign_distribute_grid"
+    bl_label = "Distribute Grid"
+    bl_description = "Distribute selected objects in a grid of columns, rows and layers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        distribute_grid()
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Pack(ChunkedOperator, bpy.types.Operator):
+    """Defines the Pack button."""
+    bl_idname = "rigidbody.blign_pack"
+    bl_label = "Pack"
+    bl_description = "Pack selected objects of different sizes into a compact layout on a plane"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        pack_objects()
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Button1(ChunkedOperator, bpy.types.Operator):
+    """Defines the Distribute button."""
+    bl_idname = "rigidbody.blign_distribute_button1"
+    bl_label = "Distribute"
+    bl_description = "Distribute objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        """Distributes objects between first and last object.
+        Indicate = the indicate spacing button. If unchecked, evenly distributes shapes. 
+        If checked, distributes objects 'spacing' units apart.
+        """
+        indicate = bpy.context.scene.object_settings.indicate_spacing1
+        axis = bpy.context.scene.object_settings.Axis1
+        dist_type = bpy.context.scene.object_settings.distribute_ops1
+        spacing = bpy.context.scene.object_settings.Spacing1
+
+        if count_blign_objects() != 2:
+            distribute_0_or_1(indicate, axis, dist_type, spacing)
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Button2(ChunkedOperator, bpy.types.Operator):
+    """Defines the Distribute button."""
+    bl_idname = "rigidbody.blign_distribute_button2"
+    bl_label = "Distribute"
+    bl_description = "Distribute objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    @snapshotted
+    @keyframed
+    def execute(self, context):
+        """Distributes objects between first and last object.
+        Indicate = the indicate spacing button. If unchecked, evenly distributes shapes. 
+        If checked, distributes objects 'spacing' units apart.
+        """
+        if count_blign_objects() == 2:
+            distribute_2()
+        else:
+            pass
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Align_Instances(bpy.types.Operator):
+    """Defines the Align Instances button."""
+    bl_idname = "rigidbody.blign_align_instances"
+    bl_label = "Align Instances"
+    bl_description = "Align the geometry node instances of the selected objects through a point attribute"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    def execute(self, context):
+        """Aligns the instances of every selected object that has any."""
+        stop_live_alignment()
+        try:
+            count = align_instances(context.selected_objects)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Aligned {} instances".format(count))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Instances(bpy.types.Operator):
+    """Defines the Distribute Instances button."""
+    bl_idname = "rigidbody.blign_distribute_instances"
+    bl_label = "Distribute Instances"
+    bl_description = "Distribute the geometry node instances of the selected objects through a point attribute"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @instrumented
+    def execute(self, context):
+        """Distributes the instances of every selected object that has any."""
+        stop_live_alignment()
+        try:
+            count = distribute_instances(context.selected_objects)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Distributed {} instances".format(count))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Align_Edit(bpy.types.Operator):
+    """Defines the Align Selection button of edit mode."""
+    bl_idname = "rigidbody.blign_align_edit"
+    bl_label = "Align Selection"
+    bl_description = "Align the selected vertices, or the islands they form, of the meshes in edit mode"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'EDIT_MESH'
+
+    @instrumented
+    def execute(self, context):
+        """Aligns with the Principal Axes settings, or the One Object settings when one Blign object is added."""
+        stop_live_alignment()
+        self.report({'INFO'}, "Aligned {} elements".format(align_edit_selection(context)))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Distribute_Edit(bpy.types.Operator):
+    """Defines the Distribute Selection button of edit mode."""
+    bl_idname = "rigidbody.blign_distribute_edit"
+    bl_label = "Distribute Selection"
+    bl_description = "Distribute the selected vertices, or the islands they form, of the meshes in edit mode"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'EDIT_MESH'
+
+    @instrumented
+    def execute(self, context):
+        """Distributes with the Principal Axes settings."""
+        stop_live_alignment()
+        self.report({'INFO'}, "Distributed {} elements".format(distribute_edit_selection(context)))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Revert(bpy.types.Operator):
+    """Defines the Revert button. Restores the locations from Blign's own snapshot without a global undo step."""
+    bl_idname = "rigidbody.blign_revert"
+    bl_label = "Revert"
+    bl_description = "Move the objects of the last Blign operation back to where they were"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_revert_snapshots)
+
+    def execute(self, context):
+        """Writes the old locations of the last snapshot, in reverse so an object moved twice ends where it started."""
+        stop_live_alignment()
+        objects, old, new = _revert_snapshots.pop()
+        try:
+            set_locations(objects[::-1], old[::-1])
+        except ReferenceError:
+            clear_snapshots()
+            self.report({'WARNING'}, "Objects of the last Blign operation no longer exist")
+            return {'CANCELLED'}
+        _reapply_snapshots.append((objects, old, new))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Reapply(bpy.types.Operator):
+    """Defines the Reapply button. Moves reverted objects back to where the Blign operation put them."""
+    bl_idname = "rigidbody.blign_reapply"
+    bl_label = "Reapply"
+    bl_description = "Redo the last reverted Blign operation"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_reapply_snapshots)
+
+    def execute(self, context):
+        """Writes the new locations of the last reverted snapshot."""
+        stop_live_alignment()
+        objects, old, new = _reapply_snapshots.pop()
+        try:
+            set_locations(objects, new)
+        except ReferenceError:
+            clear_snapshots()
+            self.report({'WARNING'}, "Objects of the reverted Blign operation no longer exist")
+            return {'CANCELLED'}
+        _revert_snapshots.append((objects, old, new))
+
+        return {'FINISHED'}
+
+
+class BLIGN_OT_Save_Profile(bpy.types.Operator):
+    """Defines the Save Profile button."""
+    bl_idname = "rigidbody.blign_save_profile"
+    bl_label = "Save Profile"
+    bl_description = "Save the timings and cProfile capture of the last Blign operation"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+
+    @classmethod
+    def poll(cls, context):
+        return profiling.last_record is not None
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "blign_profile.txt"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        """Writes the last record as JSON followed by the cProfile stats, if captured."""
+        with open(bpy.path.abspath(self.filepath), 'w') as f:
+            f.write(json.dumps(profiling.last_record.as_dict(), indent=2) + "\n")
+            if profiling.last_profile is not None:
+                f.write("\n" + profiling.format_profile(profiling.last_profile))
+        self.report({'INFO'}, "Saved Blign profile to {}".format(self.filepath))
+
+        return {'FINISHED'}
+
+
+class BLIGN_PT_Blign(bpy.types.Panel):
+    """Parent tab, all other tabs are within this one."""
+    bl_label = "Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        """Outlines the Add and Remove buttons in the Blign tab.
+        Finds the number of objects added.
+        If one or more objects are added, shows remove button. 
+        Does not allow user to add more than 2 objects as blign objects.
+        Shows which objects have been added as blign objects below the add/remove button.
+        """
+        layout = self.layout
+        layout.use_property_split = True
+
+        blobs = [object.name for object in get_blign_objects(context.scene)]
+        i = len(blobs)
+
+        try:
+            if (bpy.context.object.blign == True):
+                row = layout.row()
+                row.operator('rigidbody.blign_remove_object')
+            elif (bpy.context.object.blign == False):
+                if (i < 2):
+                    row = layout.row()
+                    row.operator('rigidbody.blign_add_object')
+        except AttributeError:
+            pass
+
+        if i > 0:
+            row = layout.row()
+            row.operator('rigidbody.blign_clear_objects')
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "align_units")
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "basis")
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "avoid_overlaps")
+        if context.scene.object_settings.avoid_overlaps:
+            row = layout.row()
+            row.prop(context.scene.object_settings, "overlap_gap")
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "exact_geometry")
+        if context.scene.object_settings.exact_geometry:
+            row = layout.row()
+            row.prop(context.scene.object_settings, "cache_budget")
+            row = layout.row()
+            row.prop(context.scene.object_settings, "bounds_backend")
+            if context.scene.object_settings.bounds_backend != 'SERIAL':
+                row = layout.row()
+                row.prop(context.scene.object_settings, "bounds_workers")
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "modal_threshold")
+
+        row = layout.row(align=True)
+        row.operator('rigidbody.blign_revert')
+        row.operator('rigidbody.blign_reapply')
+        row = layout.row()
+        row.prop(context.scene.object_settings, "snapshot_steps")
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "live_alignment")
+        if _live_alignment is not None:
+            row = layout.row()
+            row.label(text="Live: {} objects".format(len(_live_alignment['members'])))
+
+        row = layout.row()
+        row.prop(context.scene.object_settings, "keyframe_range")
+        if context.scene.object_settings.keyframe_range:
+            row = layout.row(align=True)
+            row.prop(context.scene.object_settings, "keyframe_start")
+            row.prop(context.scene.object_settings, "keyframe_end")
+            row = layout.row()
+            row.prop(context.scene.object_settings, "keyframe_step")
+
+        if i == 1:
+            row = layout.row()
+            row.label(text="Object 1: {}".format(str(blobs[0])))
+        if i == 2:
+            row = layout.row()
+            row.label(text="Object 1: {}".format(str(blobs[0])))
+
+            row = layout.row()
+            row.label(text="Object 2: {}".format(str(blobs[1])))
+
+
+class BlignObject(bpy.types.PropertyGroup):
+    """An entry in a scene's registry of Blign objects."""
+
+    object: bpy.props.PointerProperty(type=bpy.types.Object)
+
+
+class BlignSettings(bpy.types.PropertyGroup):
+    """All buttons used in the add-on are defined in this class."""
+
+    Axis0: bpy.props.EnumProperty(
+        name="Axis",
+        items=[("x", "x", "Align objects in the x direction"),
+               ("y", "y", "Align objects in the y direction"),
+               ("z", "z", "Align objects in the z direction")],
+        default='x',
+        options={'HIDDEN'},
+    )
+
+    check_plane0: bpy.props.BoolProperty(
+        name="Align to Plane",
+        description="Choose whether or not to align objects to a plane",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    Plane0: bpy.props.EnumProperty(
+        name="Plane",
+        items=[("y-z", "y-z", "Align objects to the y-z plane"),
+               ("x-z", "x-z", "Align objects to the x-z plane"),
+               ("x-y", "x-y", "Align objects to the x-y plane")],
+        default='y-z',
+        options={'HIDDEN'},
+    )
+
+    Axis1: bpy.props.EnumProperty(
+        name="Axis",
+        items=[("x", "x", "Align objects in the x direction"),
+               ("y", "y", "Align objects in the y direction"),
+               ("z", "z", "Align objects in the z direction")],
+        default='x',
+        options={'HIDDEN'},
+    )
+
+    check_plane1: bpy.props.BoolProperty(
+        name="Align to Plane",
+        description="Choose whether or not to align objects to a plane",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    Plane1: bpy.props.EnumProperty(
+        name="Plane",
+        items=[("y-z", "y-z", "Align objects to the y-z plane"),
+               ("x-z", "x-z", "Align objects to the x-z plane"),
+               ("x-y", "x-y", "Align objects to the x-y plane")],
+        default='y-z',
+        options={'HIDDEN'},
+    )
+
+    indicate_spacing0: bpy.props.BoolProperty(
+        name="",
+        description="Choose whether or not to indicate spacing betweeen objects",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    indicate_spacing1: bpy.props.BoolProperty(
+        name="",
+        description="Choose whether or not to indicate spacing betweeen objects",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    indicate_spacing2: bpy.props.BoolProperty(
+        name="",
+        description="Choose whether or not to indicate spacing betweeen objects",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    Spacing0: bpy.props.IntProperty(
+        name="Spacing",
+        description="Set distribution value between objects",
+        default=1,
+        options={'HIDDEN'},
+    )
+
+    Spacing1: bpy.props.IntProperty(
+        name="Spacing",
+        description="Set distribution value between objects",
+        default=1,
+        options={'HIDDEN'},
+    )
+
+    Spacing2: bpy.props.IntProperty(
+        name="Spacing",
+        description="Set distribution value between objects",
+        default=1,
+        options={'HIDDEN'},
+    )
+
+    x_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction"),
+               ("+z", "+z", "Align objects to their most positive point in the z direction"),
+               ("-z", "-z", "Align objects to their most negative point in the z direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    y_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the x direction"),
+               ("-x", "-x", "Align objects to their most negative point in the x direction"),
+               ("+z", "+z", "Align objects to their most positive point in the z direction"),
+               ("-z", "-z", "Align objects to their most negative point in the z direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    z_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the x direction"),
+               ("-x", "-x", "Align objects to their most negative point in the x direction"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    yz_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the y direction"),
+               ("-x", "-x", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    xz_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    xy_selected0: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+z", "+z", "Align objects to their most positive point in the y direction"),
+               ("-z", "-z", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    x_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction"),
+               ("+z", "+z", "Align objects to their most positive point in the z direction"),
+               ("-z", "-z", "Align objects to their most negative point in the z direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    y_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the x direction"),
+               ("-x", "-x", "Align objects to their most negative point in the x direction"),
+               ("+z", "+z", "Align objects to their most positive point in the z direction"),
+               ("-z", "-z", "Align objects to their most negative point in the z direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    z_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the x direction"),
+               ("-x", "-x", "Align objects to their most negative point in the x direction"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    yz_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the y direction"),
+               ("-x", "-x", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    xz_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    xy_selected1: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+z", "+z", "Align objects to their most positive point in the y direction"),
+               ("-z", "-z", "Align objects to their most negative point in the y direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    top_row2: bpy.props.BoolProperty(
+        name="",
+        description="If this button is clicked, options from the top row are available",
+        options={'HIDDEN'},
+        default=True
+    )
+
+    bottom_row2: bpy.props.BoolProperty(
+        name="",
+        description="If this button is clicked, options from the bottom row are available",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    exact_geometry: bpy.props.BoolProperty(
+        name="Exact Geometry",
+        description="Align to the extreme vertices of each object's evaluated mesh instead of its bounding box",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    cache_budget: bpy.props.IntProperty(
+        name="Cache Budget (MB)",
+        description="Memory the exact geometry hull cache may use before least recently used meshes are dropped",
+        default=256,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    bounds_backend: bpy.props.EnumProperty(
+        name="Bounds Backend",
+        items=[("SERIAL", "Serial", "Compute exact extents on the main thread"),
+               ("THREADS", "Threads", "Split exact extents across a thread pool"),
+               ("PROCESSES", "Processes", "Split exact extents across a process pool sharing memory")],
+        description="Where the per-object reductions of exact geometry mode run",
+        options={'HIDDEN'},
+        default="SERIAL"
+    )
+
+    bounds_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of bounds workers (0 for one per core)",
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    grid_columns: bpy.props.IntProperty(
+        name="Columns",
+        description="Number of grid columns (0 for the square root of the object count)",
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    grid_rows: bpy.props.IntProperty(
+        name="Rows",
+        description="Number of rows per layer (0 for a single layer)",
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    grid_axes: bpy.props.EnumProperty(
+        name="Axes",
+        items=[("xyz", "X, Y, Z", "Columns along x, rows along y, layers along z"),
+               ("xzy", "X, Z, Y", "Columns along x, rows along z, layers along y"),
+               ("yxz", "Y, X, Z", "Columns along y, rows along x, layers along z"),
+               ("yzx", "Y, Z, X", "Columns along y, rows along z, layers along x"),
+               ("zxy", "Z, X, Y", "Columns along z, rows along x, layers along y"),
+               ("zyx", "Z, Y, X", "Columns along z, rows along y, layers along x")],
+        description="Axes the grid columns, rows and layers run along",
+        options={'HIDDEN'},
+        default="xyz"
+    )
+
+    grid_sort: bpy.props.EnumProperty(
+        name="Order",
+        items=[("SELECTION", "Selection", "Fill the grid in selection order"),
+               ("X", "X", "Fill the grid by location along x"),
+               ("Y", "Y", "Fill the grid by location along y"),
+               ("Z", "Z", "Fill the grid by location along z"),
+               ("NAME", "Name", "Fill the grid by object name"),
+               ("SIZE", "Size", "Fill the grid from the largest bounding box to the smallest"),
+               ("PROPERTY", "Property", "Fill the grid by the value of a custom property")],
+        description="Order the objects fill the grid in",
+        options={'HIDDEN'},
+        default="SELECTION"
+    )
+
+    sort_property: bpy.props.StringProperty(
+        name="Property",
+        description="Custom property the grid is filled by, objects without a numeric value go last",
+        options={'HIDDEN'},
+        default=""
+    )
+
+    grid_ops: bpy.props.EnumProperty(
+        name="Distribute from",
+        items=[("center", "Center", "Space object centers evenly"),
+               ("edge", "Edge", "Size each column, row and layer to its largest object")],
+        options={'HIDDEN'},
+        default="center"
+    )
+
+    grid_spacing: bpy.props.FloatProperty(
+        name="Spacing",
+        description="Distance between centers or gap between edges (0 for the largest object size between centers, or touching edges)",
+        default=0.0,
+        min=0.0,
+        options={'HIDDEN'},
+    )
+
+    pack_plane: bpy.props.EnumProperty(
+        name="Plane",
+        items=[("y-z", "Y-Z", "Pack on the y-z plane, shelves along y"),
+               ("x-z", "X-Z", "Pack on the x-z plane, shelves along x"),
+               ("x-y", "X-Y", "Pack on the x-y plane, shelves along x")],
+        description="Plane the selection is packed on",
+        options={'HIDDEN'},
+        default="x-y"
+    )
+
+    pack_spacing: bpy.props.FloatProperty(
+        name="Spacing",
+        description="Gap between packed objects",
+        default=0.0,
+        min=0.0,
+        options={'HIDDEN'},
+    )
+
+    pack_width: bpy.props.FloatProperty(
+        name="Width",
+        description="Width of the packed layout (0 to find the width with the smallest area)",
+        default=0.0,
+        min=0.0,
+        options={'HIDDEN'},
+    )
+
+    avoid_overlaps: bpy.props.BoolProperty(
+        name="Avoid Overlaps",
+        description="Move objects that would overlap after aligning or distributing apart along the free axes",
+        default=False,
+        options={'HIDDEN'},
+    )
+
+    overlap_gap: bpy.props.FloatProperty(
+        name="Gap",
+        description="Smallest distance kept between objects when avoiding overlaps",
+        default=0.0,
+        min=0.0,
+        options={'HIDDEN'},
+    )
+
+    basis: bpy.props.EnumProperty(
+        name="Axes",
+        items=[("GLOBAL", "Global", "Align and distribute along the world axes, around the world origin"),
+               ("ACTIVE", "Active Object", "Align and distribute along the active object's local axes, around its origin"),
+               ("ORIENTATION", "Transform Orientation", "Align and distribute along the current custom transform orientation"),
+               ("CURSOR", "3D Cursor", "Align and distribute along the 3D cursor's axes, around the cursor")],
+        description="Axes and origin that align and distribute work in",
+        options={'HIDDEN'},
+        default="GLOBAL"
+    )
+
+    align_units: bpy.props.EnumProperty(
+        name="Move",
+        items=[("OBJECT", "Objects", "Align and distribute every selected object on its own"),
+               ("HIERARCHY", "Hierarchies", "Align and distribute the hierarchy of each selected object as one, moving only its root"),
+               ("COLLECTION", "Collections", "Align and distribute the collection of each selected object as one, moving only its root objects")],
+        description="What the align and distribute buttons move",
+        options={'HIDDEN'},
+        default="OBJECT"
+    )
+
+    snapshot_steps: bpy.props.IntProperty(
+        name="Revert Steps",
+        description="Number of Blign operations whose moved locations are kept for Revert (0 to disable)",
+        default=16,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    live_alignment: bpy.props.BoolProperty(
+        name="Live Alignment",
+        description="Keep the last aligned objects on their axis, plane or line while they or the Blign objects move",
+        options={'HIDDEN'},
+        default=False,
+        update=stop_live_alignment
+    )
+
+    instance_attribute: bpy.props.StringProperty(
+        name="Attribute",
+        description="Point attribute the instance offsets are written to, for the geometry nodes to apply",
+        default="blign_offset",
+        options={'HIDDEN'},
+    )
+
+    edit_units: bpy.props.EnumProperty(
+        name="Move",
+        items=[("VERTEX", "Vertices", "Move every selected vertex on its own"),
+               ("ISLAND", "Islands", "Move the islands of selected vertices, edges and faces as rigid pieces")],
+        description="What edit mode align and distribute move",
+        options={'HIDDEN'},
+        default="VERTEX"
+    )
+
+    keyframe_range: bpy.props.BoolProperty(
+        name="Keyframe Range",
+        description="Run align and distribute on every frame of a range and key the locations",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    keyframe_start: bpy.props.IntProperty(
+        name="Start",
+        description="First frame to key",
+        default=1,
+        options={'HIDDEN'},
+    )
+
+    keyframe_end: bpy.props.IntProperty(
+        name="End",
+        description="Last frame to key",
+        default=250,
+        options={'HIDDEN'},
+    )
+
+    keyframe_step: bpy.props.IntProperty(
+        name="Step",
+        description="Frames between keys",
+        default=1,
+        min=1,
+        options={'HIDDEN'},
+    )
+
+    clamp_segment2: bpy.props.BoolProperty(
+        name="Clamp to Segment",
+        description="Keep aligned objects between the 2 Blign objects",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    stations2: bpy.props.IntProperty(
+        name="Stations",
+        description="Snap aligned objects to this many evenly spaced points between the 2 Blign objects (0 to disable)",
+        default=0,
+        min=0,
+        options={'HIDDEN'},
+    )
+
+    instrument: bpy.props.BoolProperty(
+        name="Profile Operations",
+        description="Time each phase of the align and distribute operators and report it in the Info editor",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    capture_profile: bpy.props.BoolProperty(
+        name="Capture cProfile",
+        description="Also run the operators under cProfile and keep the stats of the last operation",
+        options={'HIDDEN'},
+        default=False
+    )
+
+    timing_log: bpy.props.StringProperty(
+        name="Timing Log",
+        description="JSON lines file every recorded operation is appended to (leave empty to disable)",
+        subtype='FILE_PATH',
+        default="",
+        options={'HIDDEN'},
+    )
+
+    modal_threshold: bpy.props.IntProperty(
+        name="Modal Threshold",
+        description="Selections at least this large are moved in chunks with progress and Esc to cancel",
+        default=20000,
+        min=1,
+        options={'HIDDEN'},
+    )
+
+    align_to_2_ops: bpy.props.EnumProperty(
+        name="Align to",
+        items=[("center", "Center", "Align to center of object"),
+               ("+x", "+x", "Align objects to their most positive point in the x direction"),
+               ("-x", "-x", "Align objects to their most negative point in the x direction"),
+               ("+y", "+y", "Align objects to their most positive point in the y direction"),
+               ("-y", "-y", "Align objects to their most negative point in the y direction"),
+               ("+z", "+z", "Align objects to their most positive point in the z direction"),
+               ("-z", "-z", "Align objects to their most negative point in the z direction")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    distribute_ops0: bpy.props.EnumProperty(
+        name="Distribute from",
+        items=[("center", "Center", "Distribute from center of object"),
+               ("edge", "Edge", "Distribute from edge of object")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    distribute_ops1: bpy.props.EnumProperty(
+        name="Distribute from",
+        items=[("center", "Center", "Distribute from center of object"),
+               ("edge", "Edge", "Distribute from edge of object")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+    distribute_ops2: bpy.props.EnumProperty(
+        name="Distribute from",
+        items=[("center", "Center", "Distribute from center of object")],
+        #    ("edge", "Edge", "Distribute from edge of object")],
+        default='center',
+        options={'HIDDEN'},
+    )
+
+
+class BLIGN_PT_Blign_Principal_Axes(bpy.types.Panel):
+    """Class that outlines the Align tab."""
+    bl_label = "Principal Axes/Planes"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """The buttons within the tab are called here.
+        settings is a PointerProperty that points to the class BlignSettings, where the buttons are defined.
+        """
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+        axis = bpy.context.scene.object_settings.Axis0
+        check_plane = bpy.context.scene.object_settings.check_plane0
+        plane = bpy.context.scene.object_settings.Plane0
+
+        row = layout.row()
+        if check_plane == False:
+            row.prop(settings, "Axis0", expand=True)
+        elif check_plane == True:
+            row.prop(settings, "Plane0", expand=True)
+
+        row = layout.row()
+        if check_plane == False:
+            row.prop(settings, axis + "_selected0")
+        elif check_plane == True:
+            row.prop(settings, plane.replace('-', '') + "_selected0")
+
+        row = layout.row()
+        row.alignment = 'RIGHT'
+        row.prop(settings, "check_plane0")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_align_button0')
+
+        row = layout.row()
+        row.prop(settings, "distribute_ops0", expand=True)
+
+        row = layout.row()
+        row.prop(settings, "indicate_spacing0")
+        row.prop(settings, 'Spacing0')
+
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_button0')
+
+
+class BLIGN_PT_Blign_One_Object(bpy.types.Panel):
+    """Class that outlines the Align to One Object tab."""
+    bl_label = "Align to One Object"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """The buttons within the Align to One Object tab are called here."""
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+        axis = bpy.context.scene.object_settings.Axis1
+        check_plane = bpy.context.scene.object_settings.check_plane1
+        plane = bpy.context.scene.object_settings.Plane1
+
+        row = layout.row()
+        if check_plane == False:
+            row.prop(settings, "Axis1", expand=True)
+        elif check_plane == True:
+            row.prop(settings, "Plane1", expand=True)
+
+        row = layout.row()
+        if check_plane == False:
+            row.prop(settings, axis + "_selected1")
+        elif check_plane == True:
+            row.prop(settings, plane.replace('-', '') + "_selected1")
+
+        row = layout.row()
+        row.alignment = 'RIGHT'
+        row.prop(settings, "check_plane1")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_align_button1')
+
+        row = layout.row()
+        row.prop(settings, "distribute_ops1", expand=True)
+
+        row = layout.row()
+        row.prop(settings, "indicate_spacing1")
+        row.prop(settings, 'Spacing1')
+
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_button1')
+
+
+class BLIGN_PT_Blign_Two_Objects(bpy.types.Panel):
+    """Class that outlines the Align to Two Objects tab."""
+    bl_label = "Align to Two Objects"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Buttons within Align to Two Objects tab are called here."""
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row()
+        row.prop(settings, "align_to_2_ops")
+
+        row = layout.row()
+        row.prop(settings, "clamp_segment2")
+        row.prop(settings, "stations2")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_align_button2')
+
+        # row = layout.row()
+        # row.prop(settings, "distribute_ops2", expand=True)
+
+        row = layout.row()
+        row.prop(settings, "indicate_spacing2")
+        row.prop(settings, 'Spacing2')
+
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_button2')
+
+
+class BLIGN_PT_Blign_Grid(bpy.types.Panel):
+    """Class that outlines the Grid tab."""
+    bl_label = "Grid"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Shows the grid shape, axes, ordering and spacing, and the Distribute Grid button."""
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row(align=True)
+        row.prop(settings, "grid_columns")
+        row.prop(settings, "grid_rows")
+
+        row = layout.row()
+        row.prop(settings, "grid_axes")
+
+        row = layout.row()
+        row.prop(settings, "grid_sort")
+        if settings.grid_sort == 'PROPERTY':
+            row = layout.row()
+            row.prop(settings, "sort_property")
+
+        row = layout.row()
+        row.prop(settings, "grid_ops", expand=True)
+
+        row = layout.row()
+        row.prop(settings, "grid_spacing")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_grid')
+
+
+class BLIGN_PT_Blign_Pack(bpy.types.Panel):
+    """Class that outlines the Pack tab."""
+    bl_label = "Pack"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Shows the packing plane, spacing and width, and the Pack button."""
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row()
+        row.prop(settings, "pack_plane", expand=True)
+
+        row = layout.row()
+        row.prop(settings, "pack_spacing")
+
+        row = layout.row()
+        row.prop(settings, "pack_width")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_pack')
+
+
+class BLIGN_PT_Blign_Instances(bpy.types.Panel):
+    """Class that outlines the Instances tab."""
+    bl_label = "Instances"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Shows the offset attribute and the Align and Distribute Instances buttons.
+        The instances use the axis, plane, vertex and spacing settings of the Principal Axes tab.
+        """
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row()
+        row.prop(settings, "instance_attribute")
+
+        row = layout.row()
+        row.label(text="Uses the Principal Axes settings")
+
+        row = layout.row()
+        row.operator('rigidbody.blign_align_instances')
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_instances')
+
+
+class BLIGN_PT_Blign_Edit(bpy.types.Panel):
+    """Class that outlines the Edit Mode tab."""
+    bl_label = "Edit Mode"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Shows what is moved and the Align and Distribute Selection buttons, which work in mesh edit mode.
+        They use the axis, plane, vertex and spacing settings of the Principal Axes tab,
+        or of the One Object tab for aligning to one Blign object.
+        """
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row()
+        row.prop(settings, "edit_units", expand=True)
+
+        row = layout.row()
+        row.operator('rigidbody.blign_align_edit')
+        row = layout.row()
+        row.operator('rigidbody.blign_distribute_edit')
+
+
+class BLIGN_PT_Blign_Profiling(bpy.types.Panel):
+    """Class that outlines the Profiling tab."""
+    bl_label = "Profiling"
+    bl_parent_id = "BLIGN_PT_Blign"
+    bl_category = "Geometry"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        """Instrumentation options, the last recorded operation and the Save Profile button."""
+        layout = self.layout
+        layout.use_property_split = True
+        settings = context.scene.object_settings
+
+        row = layout.row()
+        row.prop(settings, "instrument")
+
+        if settings.instrument:
+            row = layout.row()
+            row.prop(settings, "capture_profile")
+
+            row = layout.row()
+            row.prop(settings, "timing_log")
+
+        rec = profiling.last_record
+        if rec is not None:
+            row = layout.row()
+            row.label(text="{}: {} objects, {:.3f} s".format(
+                rec.operation, rec.object_count, rec.total))
+            for name, seconds in sorted(rec.phases.items(), key=lambda item: -item[1]):
+                row = layout.row()
+                row.label(text="{}: {:.3f} s, {} blocks".format(
+                    name, seconds, rec.allocated_blocks[name]))
+
+        row = layout.row()
+        row.operator('rigidbody.blign_save_profile')
+
+
+classes = (
+    BLIGN_OT_Add_Object,
+    BLIGN_OT_Remove_Object,
+    Blign_OT_Clear_Objects,
+    BLIGN_OT_Align_Button0,
+    BLIGN_OT_Align_Button1,
+    BLIGN_OT_Align_Button2,
+    BLIGN_OT_Distribute_Button0,
+    BLIGN_OT_Distribute_Grid,
+    BLIGN_OT_Pack,
+    BLIGN_OT_Distribute_Button1,
+    BLIGN_OT_Distribute_Button2,
+    BLIGN_OT_Align_Instances,
+    BLIGN_OT_Distribute_Instances,
+    BLIGN_OT_Align_Edit,
+    BLIGN_OT_Distribute_Edit,
+    BLIGN_OT_Revert,
+    BLIGN_OT_Reapply,
+    BLIGN_OT_Save_Profile,
+    BLIGN_PT_Blign,
+    BlignObject,
+    BlignSettings,
+    BLIGN_PT_Blign_Principal_Axes,
+    BLIGN_PT_Blign_One_Object,
+    BLIGN_PT_Blign_Two_Objects,
+    BLIGN_PT_Blign_Grid,
+    BLIGN_PT_Blign_Pack,
+    BLIGN_PT_Blign_Instances,
+    BLIGN_PT_Blign_Edit,
+    BLIGN_PT_Blign_Profiling,
+)
+
+
+def register():
+    """Registers classes and defines scene.object_settings, scene.blign_objects and object.blign.
+    Creates new subset of bpy.types.scene called object_Settings that points to BlignSettings.
+    Creates new subset of bpy.types.scene called blign_objects, the ordered registry of Blign objects.
+    Creates new subset of bpy.types.object called blign.
+    """
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    bpy.types.Scene.object_settings = bpy.props.PointerProperty(
+        type=BlignSettings)
+    bpy.types.Scene.blign_objects = bpy.props.CollectionProperty(
+        type=BlignObject)
+    bpy.types.Object.blign = bpy.props.BoolProperty(name="BLIGN_PT_Blign")
+
+    bpy.app.handlers.depsgraph_update_post.append(blign_depsgraph_handler)
+    bpy.app.handlers.frame_change_post.append(blign_frame_handler)
+    bpy.app.handlers.undo_post.append(blign_undo_handler)
+    bpy.app.handlers.redo_post.append(blign_undo_handler)
+    bpy.app.handlers.load_post.append(blign_load_handler)
+
+
+def unregister():
+    """Unregisters classes."""
+
+    bpy.app.handlers.depsgraph_update_post.remove(blign_depsgraph_handler)
+    bpy.app.handlers.frame_change_post.remove(blign_frame_handler)
+    bpy.app.handlers.undo_post.remove(blign_undo_handler)
+    bpy.app.handlers.redo_post.remove(blign_undo_handler)
+    bpy.app.handlers.load_post.remove(blign_load_handler)
+    parallel.shutdown()
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.object_settings
+    del bpy.types.Scene.blign_objects
+    del bpy.types.Object.blign
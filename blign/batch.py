@@ -0,0 +1,305 @@
+"""
+Applies Blign align and distribute steps to many .blend files from the command line.
+
+    python -m blign.batch jobs.json --workers 8 --report report.json
+
+The driver needs no Blender of its own: it starts one `blender --background` worker per file,
+up to --workers at a time, and collects a per-file timing and result report. Each worker
+runs this same file inside Blender, registers the add-on, applies the steps and saves.
+
+A job file looks like:
+
+    {
+      "jobs": [
+        {
+          "files": ["assets/*.blend"],
+          "scenes": ["Scene"],
+          "collection": "Props",
+          "output_dir": "aligned",
+          "steps": [
+            {"operator": "align0", "settings": {"Axis0": "x", "x_selected0": "-y"}},
+            {"operator": "distribute1", "reference": ["Floor"],
+             "settings": {"Axis1": "x", "distribute_ops1": "edge", "indicate_spacing1": true, "Spacing1": 2}}
+          ]
+        }
+      ]
+    }
+
+"files" are glob patterns. "scenes" names the scenes the steps run in (every scene of the file
+otherwise). "collection" limits the selection to one collection (every object in the scene
+otherwise). "reference" names the Blign objects a step uses. "settings" are BlignSettings values.
+Without "output_dir" files are saved in place. Objects that are in a scene but not in its first
+view layer cannot be selected, so they are left out and listed in the report.
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Step names accepted in job files and the operators they run.
+OPERATORS = {
+    'align0': 'blign_align_button0',
+    'align1': 'blign_align_button1',
+    'align2': 'blign_align_button2',
+    'distribute0': 'blign_distribute_button0',
+    'distribute1': 'blign_distribute_button1',
+    'distribute2': 'blign_distribute_button2',
+}
+
+# Prefix of the line a worker prints its result on.
+RESULT_MARKER = "BLIGN_RESULT "
+
+
+def load_tasks(path):
+    """
+    Reads a job file and expands it into one task per .blend file.
+    Arguments
+    ---------
+    path : str
+        Job file path. Relative paths inside it are relative to the job file.
+    Returns
+    -------
+    tasks : list
+        Dicts with the file path and the job it belongs to.
+    """
+    with open(path) as f:
+        jobs = json.load(f)['jobs']
+    root = os.path.dirname(os.path.abspath(path))
+    tasks = []
+    for job in jobs:
+        if job.get('output_dir'):
+            job = dict(job, output_dir=os.path.join(root, job['output_dir']))
+        for pattern in job['files']:
+            for filepath in sorted(glob.glob(os.path.join(root, pattern))):
+                tasks.append({'file': filepath, 'job': job})
+    return tasks
+
+
+def run_task(task, blender, timeout):
+    """
+    Processes one .blend file in a background Blender worker.
+    Arguments
+    ---------
+    task : dict
+        Task from load_tasks.
+    blender : str
+        Blender executable.
+    timeout : float
+        Seconds before the worker is killed.
+    Returns
+    -------
+    result : dict
+        File, status, wall time and the worker's per-step timings or error.
+    """
+    command = [blender, '--background', '--factory-startup', task['file'],
+               '--python', os.path.abspath(__file__), '--', '--worker', json.dumps(task['job'])]
+    start = time.perf_counter()
+    result = {'file': task['file']}
+    try:
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                 universal_newlines=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        result.update(status='timeout', error="worker exceeded {} s".format(timeout))
+    except OSError as error:
+        result.update(status='error', error="could not start {}: {}".format(blender, error))
+    else:
+        lines = [line for line in process.stdout.splitlines() if line.startswith(RESULT_MARKER)]
+        if lines:
+            result.update(json.loads(lines[-1][len(RESULT_MARKER):]))
+        else:
+            result.update(status='error', error=process.stdout[-2000:])
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+@contextlib.contextmanager
+def window_scene(scene):
+    """
+    Makes a scene and its first view layer those of the window for as long as the context lasts.
+    The fallback of scene_context for Blender before 3.2, which has no Context.temp_override.
+    Arguments
+    ---------
+    scene : Blender scene
+        Scene to run in.
+    Returns
+    -------
+    context : context manager
+        Switches the window's scene and view layer and switches them back on exit.
+    """
+    import bpy
+    window = bpy.context.window or next(iter(bpy.context.window_manager.windows), None)
+    if window is None:
+        raise RuntimeError("No window to switch to scene {!r} in".format(scene.name))
+    old_scene, old_view_layer = window.scene, window.view_layer
+    window.scene = scene
+    window.view_layer = scene.view_layers[0]
+    try:
+        yield
+    finally:
+        window.scene = old_scene
+        window.view_layer = old_view_layer
+
+
+def scene_context(scene):
+    """
+    Makes a scene and its first view layer the context the operators run in.
+    Arguments
+    ---------
+    scene : Blender scene
+        Scene to run in.
+    Returns
+    -------
+    context : context manager
+        Override of bpy.context, or nothing to do when the scene already is the context scene.
+    """
+    import bpy
+    if scene == bpy.context.scene and bpy.context.view_layer == scene.view_layers[0]:
+        return contextlib.nullcontext()
+    if not hasattr(bpy.context, 'temp_override'):
+        return window_scene(scene)
+    return bpy.context.temp_override(scene=scene, view_layer=scene.view_layers[0])
+
+
+def run_scene(job, scene):
+    """
+    Applies a job's steps to one scene. Runs inside Blender, with the scene as the context scene.
+    Arguments
+    ---------
+    job : dict
+        Job from the job file.
+    scene : Blender scene
+        Scene to apply the steps in.
+    Returns
+    -------
+    result : dict
+        Scene name, per-step timings and the names of the objects that could not be selected.
+    """
+    import bpy
+    from blign import addon
+
+    view_layer = scene.view_layers[0]
+    addon.rebuild_blign_objects(scene)
+    in_scene = {obj.as_pointer() for obj in scene.objects}
+    selectable = {obj.as_pointer() for obj in view_layer.objects}
+
+    if job.get('collection'):
+        targets = [obj for obj in bpy.data.collections[job['collection']].all_objects
+                   if obj.as_pointer() in in_scene]
+    else:
+        targets = list(scene.objects)
+    skipped = [obj.name for obj in targets if obj.as_pointer() not in selectable]
+    targets = [obj for obj in targets if obj.as_pointer() in selectable]
+
+    steps = []
+    for step in job['steps']:
+        start = time.perf_counter()
+        for obj in addon.get_blign_objects(scene):
+            addon.remove_blign_object(obj, scene)
+        references = [bpy.data.objects[name] for name in step.get('reference', [])]
+        for obj in references:
+            addon.add_blign_object(obj, scene)
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False, view_layer=view_layer)
+        for obj in targets:
+            if obj not in references:
+                obj.select_set(True, view_layer=view_layer)
+        if references and step['operator'] == 'align2':
+            for obj in references:
+                if obj.as_pointer() in selectable:
+                    obj.select_set(True, view_layer=view_layer)
+        for key, value in step.get('settings', {}).items():
+            setattr(scene.object_settings, key, value)
+        getattr(bpy.ops.rigidbody, OPERATORS[step['operator']])()
+        steps.append({'operator': step['operator'], 'objects': len(bpy.context.selected_objects),
+                      'seconds': time.perf_counter() - start})
+
+    for obj in addon.get_blign_objects(scene):
+        addon.remove_blign_object(obj, scene)
+    return {'scene': scene.name, 'steps': steps, 'skipped': skipped}
+
+
+def run_worker(job):
+    """
+    Applies a job's steps to the listed scenes, or every scene, of the file open in this Blender and saves it.
+    Runs inside Blender.
+    Arguments
+    ---------
+    job : dict
+        Job from the job file.
+    Returns
+    -------
+    result : dict
+        Status and the result of each scene.
+    """
+    import bpy
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import blign
+
+    if not hasattr(bpy.types.Scene, 'blign_objects'):
+        blign.register()
+    if job.get('scenes'):
+        scenes = [bpy.data.scenes[name] for name in job['scenes']]
+    else:
+        scenes = list(bpy.data.scenes)
+
+    results = []
+    for scene in scenes:
+        with scene_context(scene):
+            results.append(run_scene(job, scene))
+
+    if job.get('output_dir'):
+        os.makedirs(job['output_dir'], exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.join(
+            job['output_dir'], os.path.basename(bpy.data.filepath)), copy=True)
+    else:
+        bpy.ops.wm.save_mainfile()
+    return {'status': 'ok', 'scenes': results}
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Apply Blign steps to many .blend files.")
+    parser.add_argument('jobfile', nargs='?')
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'))
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--timeout', type=float, default=3600)
+    parser.add_argument('--report', default='blign_batch_report.json')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        try:
+            result = run_worker(json.loads(args.worker))
+        except Exception as error:
+            result = {'status': 'error', 'error': "{}: {}".format(type(error).__name__, error)}
+        print(RESULT_MARKER + json.dumps(result))
+        return 0 if result['status'] == 'ok' else 1
+
+    if args.jobfile is None:
+        parser.error("a job file is required")
+    tasks = load_tasks(args.jobfile)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        results = list(pool.map(lambda task: run_task(task, args.blender, args.timeout), tasks))
+    for result in results:
+        print("{:<8} {:>8.2f} s  {}".format(result['status'], result['seconds'], result['file']))
+        for scene in result.get('scenes', []):
+            if scene['skipped']:
+                print("{:<8} {} objects of scene {} are not in its view layer".format(
+                    'skipped', len(scene['skipped']), scene['scene']))
+
+    report = {'jobfile': os.path.abspath(args.jobfile), 'workers': args.workers,
+              'seconds': time.perf_counter() - start, 'results': results}
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+    return 0 if all(result['status'] == 'ok' for result in results) else 1
+
+
+if __name__ == '__main__':
+    if '--' in sys.argv:
+        sys.exit(main(sys.argv[sys.argv.index('--') + 1:]))
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,1386 @@
+"""
+Alignment and distribution algorithms on plain NumPy arrays.
+Nothing in this module imports bpy, so it can be profiled and tested outside Blender.
+The operators in blign.addon gather arrays from the scene, call these functions and write the results back.
+"""
+import numpy as np
+from .profiling import phase
+
+# Location columns that align_to_point changes when aligning to an axis or a plane.
+AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
+AXIS_COLUMNS = {'x': [1, 2], 'y': [0, 2], 'z': [0, 1]}
+PLANE_COLUMNS = {'y-z': [0], 'x-z': [1], 'x-y': [2]}
+
+
+def to_basis(points, basis):
+    """
+    Expresses world space points in the coordinates of a basis.
+    Arguments
+    ---------
+    points : numpy array
+        (..., 3) array of world space points.
+    basis : tuple
+        (rotation, origin): (3, 3) array whose columns are the basis axes in world space, and the
+        world space origin. None for the world axes, in which case the points are returned as they are.
+    Returns
+    -------
+    points : numpy array
+        (..., 3) array of the points in basis coordinates.
+    """
+    if basis is None:
+        return points
+    rotation, origin = basis
+    return (points - origin) @ rotation
+
+
+def from_basis(points, basis):
+    """
+    Expresses points given in the coordinates of a basis in world space, the inverse of to_basis.
+    Arguments
+    ---------
+    points : numpy array
+        (..., 3) array of points in basis coordinates.
+    basis : tuple
+        (rotation, origin) as for to_basis, or None for the world axes.
+    Returns
+    -------
+    points : numpy array
+        (..., 3) array of world space points.
+    """
+    if basis is None:
+        return points
+    rotation, origin = basis
+    return points @ rotation.T + origin
+
+
+def basis_inverse(basis):
+    """
+    Builds the matrix that takes world space to the coordinates of a basis, so that world matrices
+    can be moved into the basis with one batched matmul.
+    Arguments
+    ---------
+    basis : tuple
+        (rotation, origin) as for to_basis.
+    Returns
+    -------
+    matrix : numpy array
+        (4, 4) array.
+    """
+    rotation, origin = basis
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation.T
+    matrix[:3, 3] = -rotation.T @ origin
+    return matrix
+
+
+def orthonormal_basis(matrix):
+    """
+    Builds a basis from a world matrix, with scale and shear removed, so distances stay in world units.
+    The axes are the orthonormal matrix nearest to the matrix's 3x3 part, so its transpose is its inverse
+    even when the matrix is sheared or non-uniformly scaled.
+    Arguments
+    ---------
+    matrix : numpy array
+        (4, 4) world matrix.
+    Returns
+    -------
+    basis : tuple
+        (rotation, origin) as for to_basis.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    u, _, vt = np.linalg.svd(matrix[:3, :3])
+    return u @ vt, matrix[:3, 3].copy()
+
+
+def line_basis(p1, p2):
+    """
+    Builds a basis whose x axis runs along the line through two points, with its origin at the first.
+    Arguments
+    ---------
+    p1 : numpy array
+        First point on the line.
+    p2 : numpy array
+        Second point on the line.
+    Returns
+    -------
+    basis : tuple
+        (rotation, origin) as for to_basis.
+    """
+    u = np.asarray(p2, dtype=float) - p1
+    length = np.linalg.norm(u)
+    if length == 0:
+        raise ValueError('The 2 Blign objects must not be at the same point!')
+    u = u / length
+    v = np.cross(u, np.eye(3)[np.argmin(np.abs(u))])
+    v /= np.linalg.norm(v)
+    return np.column_stack([u, v, np.cross(u, v)]), np.array(p1, dtype=float)
+
+
+def transform_corners(matrices, local):
+    """
+    Transforms a batch of local space bounding boxes to world space with one batched matmul.
+    Arguments
+    ---------
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    local : numpy array
+        (N, 8, 3) array of local space bounding box corners.
+    Returns
+    -------
+    corners : numpy array
+        (N, 8, 3) array of world space bounding box corners.
+    """
+    corners = local @ matrices[:, :3, :3].transpose(0, 2, 1) + \
+        matrices[:, np.newaxis, :3, 3]
+    return corners
+
+
+def find_bounds(corners):
+    """
+    Finds the per-axis extents of a batch of world space bounding boxes.
+    Arguments
+    ---------
+    corners : numpy array
+        (N, 8, 3) array of world space bounding box corners.
+    Returns
+    -------
+    lo : numpy array
+        (N, 3) array of each object's most negative point along x, y and z.
+    hi : numpy array
+        (N, 3) array of each object's most positive point along x, y and z.
+    center : numpy array
+        (N, 3) array of each object's bounding box center.
+    """
+    lo = corners.min(axis=1)
+    hi = corners.max(axis=1)
+    center = (lo + hi) / 2
+    return lo, hi, center
+
+
+def find_vertices(corners, direction, vertex_sign):
+    """
+    Finds the 3d coordinates for a specified vertex on a batch of objects.
+    Arguments
+    ---------
+    corners : numpy array
+        (N, 8, 3) array of world space bounding box corners.
+    direction : str
+        Direction in 3D space ['x', 'y', 'z'].
+    vertex_sign : str
+        Sign of the vertex ['+', '-'].
+    Returns
+    -------
+    p : numpy array
+        (N, 3) array of the desired vertex on each object.
+    """
+    drx_idx = AXIS_INDEX[direction]
+    vertex_idx = {'-': 0, '+': -1}[vertex_sign]
+    order = np.argsort(corners[:, :, drx_idx], axis=1, kind='stable')
+    p = corners[np.arange(len(corners)), order[:, vertex_idx]]
+    return p
+
+
+def find_default_spacing(axis, locations, order=None):
+    """
+    Function finds the default distance between that objects are being distributed from their centers.
+    Arguments
+    ---------
+    axis : str
+        The axis that objects get aligned to.
+    locations : numpy array
+        (N, 3) array of object locations.
+    order : numpy array
+        Object indices sorted along the axis, e.g. from an ordering index. If None, they are sorted here.
+    Returns
+    -------
+    default_spacing : float
+        Distance between objects' centers when distributed.
+    obj_idx : list
+        An indexed numpy list of all object locations.
+    """
+    pos_list = locations[:, AXIS_INDEX[axis]]
+    if order is None:
+        with phase('sort'):
+            order = sort_order(pos_list)
+    distance = pos_list[order[-1]] - pos_list[order[0]]
+    default_spacing = distance / (len(pos_list) - 1)
+    return default_spacing, order
+
+
+def sort_order(keys):
+    """
+    Sorts objects by a key, ties going to the lower index.
+    Arguments
+    ---------
+    keys : numpy array
+        (N,) array of sort keys, numbers or strings.
+    Returns
+    -------
+    order : numpy array
+        (N,) array of object indices by ascending key.
+    """
+    return np.argsort(keys, kind='stable')
+
+
+def is_sorted(order, keys):
+    """
+    Checks whether an order still sorts a set of keys the way sort_order would.
+    Arguments
+    ---------
+    order : numpy array
+        (N,) array of object indices.
+    keys : numpy array
+        (N,) array of sort keys.
+    Returns
+    -------
+    valid : bool
+        True if keys are ascending along order and tied keys keep ascending indices.
+    """
+    ordered = keys[order]
+    before, after = ordered[:-1], ordered[1:]
+    return bool(np.all((before < after) | ((before == after) & (order[:-1] < order[1:]))))
+
+
+def merge_order(order, keys, moved):
+    """
+    Inserts objects into an order that already sorts every other object.
+    Arguments
+    ---------
+    order : numpy array
+        Indices of the objects not in moved, sorted by key with ties going to the lower index.
+    keys : numpy array
+        (N,) array of sort keys of every object.
+    moved : numpy array
+        Indices of the objects to insert.
+    Returns
+    -------
+    order : numpy array
+        (N,) array of object indices by ascending key, as sort_order would find it.
+    """
+    moved = np.sort(moved)
+    moved = moved[sort_order(keys[moved])]
+    kept = keys[order]
+    positions = np.searchsorted(kept, keys[moved], side='left')
+    stops = np.searchsorted(kept, keys[moved], side='right')
+    for i in np.flatnonzero(stops > positions):
+        positions[i] += np.searchsorted(order[positions[i]:stops[i]], moved[i])
+    return np.insert(order, positions, moved)
+
+
+def update_order(order, old_keys, keys, old_of_new=None):
+    """
+    Updates an order after some sort keys or the set of objects changed, re-sorting only what it has to.
+    Few changed objects are taken out and merged back in. When many changed, the old order is kept
+    if it still sorts the new keys, which it does after distributing along the same key.
+    Arguments
+    ---------
+    order : numpy array
+        Object indices sorted by old_keys.
+    old_keys : numpy array
+        Keys order was found for.
+    keys : numpy array
+        (N,) array of the current keys.
+    old_of_new : numpy array
+        (N,) array of each object's index in the old keys, -1 for objects that are new.
+        If None, the objects are the same as before.
+    Returns
+    -------
+    order : numpy array
+        (N,) array of object indices by ascending key, as sort_order would find it.
+    """
+    if old_of_new is None:
+        changed = np.flatnonzero(old_keys != keys)
+        if not len(changed):
+            return order
+        stale = np.zeros(len(keys), dtype=bool)
+        stale[changed] = True
+    else:
+        found = np.flatnonzero(old_of_new >= 0)
+        if np.any(np.diff(old_of_new[found]) <= 0):
+            # Kept objects changed places, so ties among them may no longer go to the lower index.
+            return sort_order(keys)
+        new_of_old = np.full(len(old_keys), -1)
+        new_of_old[old_of_new[found]] = found
+        order = new_of_old[order]
+        order = order[order >= 0]
+        stale = np.ones(len(keys), dtype=bool)
+        stale[found] = old_keys[old_of_new[found]] != keys[found]
+        changed = np.flatnonzero(stale)
+    if len(changed) * 8 <= len(keys):
+        return merge_order(order[~stale[order]], keys, changed)
+    if len(order) == len(keys) and is_sorted(order, keys):
+        return order
+    return sort_order(keys)
+
+
+def find_d(obj_idx, direction, lo, hi):
+    """
+    Function that defines the distance between objects' edges.
+    Arguments
+    ---------
+    obj_idx : list
+        An indexed numpy list of all object locations.
+    direction : str
+        Either x y or z.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    Returns
+    -------
+    d : float
+        distance between the edges of one object and the next.
+    """
+    drx_idx = AXIS_INDEX[direction]
+    start = lo[obj_idx[0], drx_idx]
+    end = hi[obj_idx[-1], drx_idx]
+    obj_space = (hi[:, drx_idx] - lo[:, drx_idx]).sum()
+    distance = end - start
+    empty_space = distance - obj_space
+    d = empty_space / (len(obj_idx) - 1)
+    return d
+
+
+def find_c_to_v(obj_idx, direction, lo, hi, locations):
+    """
+    Function finds the default distance between that objects are being distributed from their centers.
+    Arguments
+    ---------
+    obj_idx : list
+        An indexed numpy list of all object locations.
+    direction : str
+        Either x y or z.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    locations : numpy array
+        (N, 3) array of object locations.
+    Returns
+    -------
+    c_to_v1 : numpy array
+        The distances from an object's most positive edge to its center.
+    c_to_v2 : numpy array
+        The distances from an object's most negative edge to its center.
+    """
+    drx_idx = AXIS_INDEX[direction]
+    loc = locations[obj_idx, drx_idx]
+    c_to_v1 = hi[obj_idx, drx_idx] - loc
+    c_to_v2 = loc - lo[obj_idx, drx_idx]
+    return c_to_v1, c_to_v2
+
+
+def align_to_point(locations, points, target, columns):
+    """
+    Moves objects so that their reference points match a target along some columns.
+    Arguments
+    ---------
+    locations : numpy array
+        (N, 3) array of object locations.
+    points : numpy array
+        (N, 3) array of each object's reference point, e.g. a vertex or the location itself.
+    target : numpy array
+        Point the reference points are aligned to.
+    columns : list
+        Location columns to change, from AXIS_COLUMNS or PLANE_COLUMNS.
+    Returns
+    -------
+    new_locations : numpy array
+        (N, 3) array of aligned object locations.
+    """
+    new_locations = locations.copy()
+    offset = points[:, columns] - locations[:, columns]
+    new_locations[:, columns] = np.asarray(target)[columns] - offset
+    return new_locations
+
+
+def project_onto_line(points, p1, p2, clamp=False, stations=0):
+    """
+    Projects a batch of points onto the line through two points.
+    Arguments
+    ---------
+    points : numpy array
+        (N, 3) array of points to project.
+    p1 : numpy array
+        First point on the line.
+    p2 : numpy array
+        Second point on the line.
+    clamp : bool
+        If True, projections are clamped to the segment between p1 and p2.
+    stations : int
+        If greater than 1, projections snap to this many evenly spaced stations from p1 to p2,
+        continuing at the same spacing past the ends unless clamped.
+    Returns
+    -------
+    q : numpy array
+        (N, 3) array of projected points.
+    """
+    u = p2 - p1
+    length2 = u @ u
+    if length2 == 0:
+        raise ValueError('The 2 Blign objects must not be at the same point!')
+    t = (points - p1) @ u / length2
+    if clamp:
+        t = np.clip(t, 0, 1)
+    if stations > 1:
+        t = np.round(t * (stations - 1)) / (stations - 1)
+    q = p1 + np.outer(t, u)
+    return q
+
+
+def distribute_centers(locations, axis, spacing=None, order=None):
+    """
+    Distributes object centers along an axis, keeping the first object in place.
+    Arguments
+    ---------
+    locations : numpy array
+        (N, 3) array of object locations.
+    axis : str
+        Either x y or z.
+    spacing : float
+        Distance between centers. If None, objects are spread evenly between the first and last.
+    order : numpy array
+        Object indices sorted along the axis. If None, they are sorted here.
+    Returns
+    -------
+    new_locations : numpy array
+        (N, 3) array of distributed object locations.
+    """
+    drx_idx = AXIS_INDEX[axis]
+    default_spacing, obj_idx = find_default_spacing(axis, locations, order)
+    if spacing is None:
+        spacing = default_spacing
+    new_locations = locations.copy()
+    new_locations[obj_idx, drx_idx] = locations[obj_idx[0], drx_idx] + \
+        spacing * np.arange(len(obj_idx))
+    return new_locations
+
+
+def distribute_edges(locations, lo, hi, axis, spacing=None, order=None):
+    """
+    Distributes objects along an axis so the gaps between their edges are equal, keeping the first object in place.
+    Arguments
+    ---------
+    locations : numpy array
+        (N, 3) array of object locations.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    axis : str
+        Either x y or z.
+    spacing : float
+        Gap between edges. If None, objects are spread evenly between the first and last.
+    order : numpy array
+        Object indices sorted along the axis. If None, they are sorted here.
+    Returns
+    -------
+    new_locations : numpy array
+        (N, 3) array of distributed object locations.
+    """
+    drx_idx = AXIS_INDEX[axis]
+    obj_idx = find_default_spacing(axis, locations, order)[1]
+    c_to_v1, c_to_v2 = find_c_to_v(obj_idx, axis, lo, hi, locations)
+    if spacing is None:
+        spacing = find_d(obj_idx, axis, lo, hi)
+    steps = c_to_v1[:-1] + spacing + c_to_v2[1:]
+    new_locations = locations.copy()
+    new_locations[obj_idx[1:], drx_idx] = locations[obj_idx[0], drx_idx] + \
+        np.cumsum(steps)
+    return new_locations
+
+
+def distribute_along_line(count, p1, p2, spacing):
+    """
+    Places objects at a fixed spacing along the direction from one point to another, starting at the first.
+    Arguments
+    ---------
+    count : int
+        Number of objects.
+    p1 : numpy array
+        Start point.
+    p2 : numpy array
+        Point giving the direction.
+    spacing : float
+        Distance between consecutive objects.
+    Returns
+    -------
+    locations : numpy array
+        (count, 3) array of object locations.
+    """
+    v = p2 - p1
+    u = v / np.linalg.norm(v)
+    locations = p1 + np.outer(spacing * np.arange(count), u)
+    return locations
+
+
+def find_unit_groups(selected, parents, blign, mode, collections=None, collection_members=None):
+    """
+    Groups the selected objects into the hierarchies or collections that are moved as one, by their indices
+    in the scene. Blign objects are never members and a hierarchy stops below a Blign parent, so a reference
+    never moves with a unit. A Blign object parented to a member would be carried along, so it is pinned.
+    Arguments
+    ---------
+    selected : list
+        Indices of the selected objects.
+    parents : numpy array
+        (N,) array of the index of each object's parent, -1 for none.
+    blign : numpy array
+        (N,) boolean array, True for Blign objects.
+    mode : str
+        'HIERARCHY' or 'COLLECTION'.
+    collections : numpy array
+        (N,) array of the index in collection_members of each selected object's first collection, -1 for a
+        master collection, which would take in the whole scene, so the object is a unit of its own.
+    collection_members : list
+        Indices of every object in each collection, nested collections included.
+    Returns
+    -------
+    groups : list
+        (roots, members, pinned) lists of object indices for each unit, members starting with the roots.
+    """
+    parents = np.asarray(parents).tolist()
+    blign = np.asarray(blign, dtype=bool).tolist()
+    children = {}
+    for i, parent in enumerate(parents):
+        if parent >= 0:
+            children.setdefault(parent, []).append(i)
+
+    groups = {}
+    tops = {}
+    for i in selected:
+        if blign[i]:
+            continue
+        if mode == 'HIERARCHY':
+            chain = []
+            top = i
+            while parents[top] >= 0 and not blign[parents[top]] and top not in tops:
+                chain.append(top)
+                top = parents[top]
+            top = tops.get(top, top)
+            for link in chain:
+                tops[link] = top
+            if top not in groups:
+                members = [top]
+                for obj in members:
+                    members.extend(child for child in children.get(obj, ()) if not blign[child])
+                groups[top] = members
+        else:
+            collection = collections[i]
+            key = ('COLLECTION', collection) if collection >= 0 else ('OBJECT', i)
+            if key not in groups:
+                groups[key] = [i] if collection < 0 else [obj for obj in collection_members[collection] if not blign[obj]]
+
+    found = []
+    for members in groups.values():
+        keys = set(members)
+        roots = [obj for obj in members if parents[obj] not in keys]
+        root_keys = set(roots)
+        members = roots + [obj for obj in members if obj not in root_keys]
+        pinned = [child for obj in members for child in children.get(obj, ()) if blign[child]]
+        found.append((roots, members, pinned))
+    return found
+
+
+def union_bounds(lo, hi, offsets):
+    """
+    Finds the extents of groups of objects, e.g. the members of each hierarchy or collection.
+    Arguments
+    ---------
+    lo : numpy array
+        (M, 3) array of each member's most negative point, grouped unit after unit.
+    hi : numpy array
+        (M, 3) array of each member's most positive point, grouped unit after unit.
+    offsets : numpy array
+        (N + 1,) array, the members of unit i are rows offsets[i] to offsets[i + 1]. No unit may be empty.
+    Returns
+    -------
+    lo : numpy array
+        (N, 3) array of each unit's most negative point.
+    hi : numpy array
+        (N, 3) array of each unit's most positive point.
+    """
+    return np.minimum.reduceat(lo, offsets[:-1], axis=0), np.maximum.reduceat(hi, offsets[:-1], axis=0)
+
+
+def box_corners(lo, hi):
+    """
+    Builds the corners of axis aligned boxes.
+    Arguments
+    ---------
+    lo : numpy array
+        (N, 3) array of each box's most negative point.
+    hi : numpy array
+        (N, 3) array of each box's most positive point.
+    Returns
+    -------
+    corners : numpy array
+        (N, 8, 3) array of box corners.
+    """
+    bits = np.array([[i >> 2 & 1, i >> 1 & 1, i & 1] for i in range(8)], dtype=bool)
+    return np.where(bits, hi[:, np.newaxis], lo[:, np.newaxis])
+
+
+def arrange_grid(locations, lo, hi, order, columns=0, rows=0, axes='xyz', spacing=None, dist_type='center'):
+    """
+    Lays objects out in a grid of columns, rows and layers, keeping the first object in place.
+    Arguments
+    ---------
+    locations : numpy array
+        (N, 3) array of object locations.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    order : numpy array
+        Object indices in the order they fill the grid, column by column, then row by row, then layer by layer.
+    columns : int
+        Number of columns, or 0 for the ceiling of the square root of N.
+    rows : int
+        Number of rows per layer, or 0 for as many as the objects need in a single layer.
+    axes : str
+        Axes the columns, rows and layers run along, e.g. 'xyz' or 'xzy'.
+    spacing : float
+        Distance between centers, or gap between edges. If None, centers are spaced by the largest
+        object along each axis and edges touch.
+    dist_type : str
+        'center' to space object centers evenly, 'edge' to size each column, row and layer to its largest object.
+    Returns
+    -------
+    new_locations : numpy array
+        (N, 3) array of arranged object locations.
+    """
+    n = len(order)
+    idx = [AXIS_INDEX[a] for a in axes]
+    columns = columns if columns > 0 else int(np.ceil(np.sqrt(n)))
+    rows = rows if rows > 0 else int(np.ceil(n / columns))
+    slot = np.empty(n, dtype=int)
+    slot[order] = np.arange(n)
+    cell = np.stack([slot % columns, slot // columns % rows, slot // (columns * rows)], axis=1)
+    size = (hi - lo)[:, idx]
+    new_locations = locations.copy()
+    first = order[0]
+
+    if dist_type == 'center':
+        pitch = size.max(axis=0) if spacing is None else np.full(3, float(spacing))
+        new_locations[:, idx] = locations[first, idx] + cell * pitch
+    else:
+        gap = 0.0 if spacing is None else float(spacing)
+        starts = np.empty((n, 3))
+        for k in range(3):
+            widths = np.zeros(cell[:, k].max() + 1)
+            np.maximum.at(widths, cell[:, k], size[:, k])
+            edges = np.concatenate([[0.0], np.cumsum(widths + gap)[:-1]])
+            starts[:, k] = edges[cell[:, k]]
+        new_locations[:, idx] = lo[first, idx] + starts + (locations - lo)[:, idx]
+    return new_locations
+
+
+def find_shelf_layout(widths, heights, prefix, width):
+    """
+    Places boxes, tallest first, on shelves no wider than a given width (next fit decreasing height).
+    Each shelf is filled with one binary search over the prefix sums of the widths.
+    Arguments
+    ---------
+    widths : numpy array
+        (N,) array of box widths, in placement order.
+    heights : numpy array
+        (N,) array of box heights, in placement order, decreasing.
+    prefix : numpy array
+        (N + 1,) array of the cumulative widths, starting at 0.
+    width : float
+        Shelf width, at least the widest box.
+    Returns
+    -------
+    x : numpy array
+        (N,) array of each box's offset along its shelf.
+    y : numpy array
+        (N,) array of each box's shelf offset.
+    used_width : float
+        Width of the widest shelf.
+    used_height : float
+        Height of all shelves.
+    """
+    n = len(widths)
+    x = np.empty(n)
+    y = np.empty(n)
+    start = 0
+    used_width = 0.0
+    used_height = 0.0
+    while start < n:
+        stop = max(start + 1, int(np.searchsorted(prefix, prefix[start] + width, side='right')) - 1)
+        x[start:stop] = prefix[start:stop] - prefix[start]
+        y[start:stop] = used_height
+        used_width = max(used_width, prefix[stop] - prefix[start])
+        used_height += heights[start]
+        start = stop
+    return x, y, used_width, used_height
+
+
+def pack_shelves(locations, lo, hi, plane='x-y', spacing=0.0, width=0.0):
+    """
+    Packs objects of different sizes into a compact layout on a plane, starting at the most negative
+    corner of the selection. Objects keep their position along the third axis.
+    Arguments
+    ---------
+    locations : numpy array
+        (N, 3) array of object locations.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    plane : str
+        Plane to pack on ['y-z', 'x-z', 'x-y'], shelves run along the first axis.
+    spacing : float
+        Gap between objects.
+    width : float
+        Shelf width. If 0, several widths around the square root of the total area are tried and the
+        one with the smallest layout area is kept.
+    Returns
+    -------
+    new_locations : numpy array
+        (N, 3) array of packed object locations.
+    """
+    a, b = [AXIS_INDEX[c] for c in plane.split('-')]
+    w = hi[:, a] - lo[:, a] + spacing
+    h = hi[:, b] - lo[:, b] + spacing
+    order = np.argsort(-h, kind='stable')
+    widths, heights = w[order], h[order]
+    prefix = np.concatenate([[0.0], np.cumsum(widths)])
+
+    if width > 0:
+        candidates = [max(width, widths.max())]
+    else:
+        side = np.sqrt((w * h).sum())
+        candidates = np.maximum(widths.max(), side * np.geomspace(0.5, 2.0, 9))
+    best = None
+    for candidate in candidates:
+        layout = find_shelf_layout(widths, heights, prefix, candidate)
+        if best is None or layout[2] * layout[3] < best[2] * best[3]:
+            best = layout
+
+    offsets = np.empty((len(order), 2))
+    offsets[order, 0] = best[0]
+    offsets[order, 1] = best[1]
+    origin = lo.min(axis=0)
+    new_locations = locations.copy()
+    new_locations[:, [a, b]] = origin[[a, b]] + offsets + (locations - lo)[:, [a, b]]
+    return new_locations
+
+
+def find_grid_cell_size(lo, hi, gap=0.0):
+    """
+    Picks the cell size of a uniform grid over boxes so that nearly every box fits in one cell.
+    Arguments
+    ---------
+    lo : numpy array
+        (N, 3) array of each box's most negative point.
+    hi : numpy array
+        (N, 3) array of each box's most positive point.
+    gap : float
+        Distance that still counts as touching.
+    Returns
+    -------
+    size : float
+        Cell size, twice the 90th percentile of the box extents plus the gap, at most the largest.
+    big : numpy array
+        (N,) bool array of the boxes larger than a cell, which are tested against every box instead.
+    """
+    extent = (hi - lo).max(axis=1) + gap
+    if not len(extent):
+        return 1.0, extent > 0
+    size = max(min(2 * float(np.percentile(extent, 90)), float(extent.max())), 1e-9)
+    return size, extent > size
+
+
+def find_overlaps(lo, hi, gap=0.0):
+    """
+    Finds every pair of boxes closer than a gap on all axes, using a uniform grid as the spatial index.
+    Boxes are filed under the cell of their lo corner, so boxes that fit in a cell can only overlap
+    boxes filed in the same or a neighbouring cell. Candidates are generated with sorted cell keys and
+    binary searches, then tested exactly. The few boxes larger than a cell are tested against all boxes.
+    Arguments
+    ---------
+    lo : numpy array
+        (N, 3) array of each box's most negative point.
+    hi : numpy array
+        (N, 3) array of each box's most positive point.
+    gap : float
+        Boxes closer than this count as overlapping. Touching boxes do not overlap when it is 0.
+    Returns
+    -------
+    a : numpy array
+        Index of the first box of each overlapping pair.
+    b : numpy array
+        Index of the second box of each overlapping pair.
+    """
+    size, big = find_grid_cell_size(lo, hi, gap)
+    small = np.flatnonzero(~big)
+    pairs_a, pairs_b = [], []
+
+    if len(small):
+        cells = np.floor(lo[small] / size).astype(np.int64)
+        cells += 1 - cells.min(axis=0)
+        dims = cells.max(axis=0) + 2
+        key = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        m = len(order)
+        # The cell itself and the 13 neighbours after it, so each pair of cells is visited once.
+        for dx, dy, dz in [d for d in np.ndindex(3, 3, 3) if d >= (1, 1, 1)]:
+            shift = ((dx - 1) * dims[1] + (dy - 1)) * dims[2] + (dz - 1)
+            start = np.searchsorted(sorted_key, sorted_key + shift, side='left')
+            stop = np.searchsorted(sorted_key, sorted_key + shift, side='right')
+            if shift == 0:
+                start = np.arange(1, m + 1)
+            counts = np.maximum(stop - start, 0)
+            i = np.repeat(np.arange(m), counts)
+            j = np.repeat(start, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            pairs_a.append(small[order[i]])
+            pairs_b.append(small[order[j]])
+
+    if pairs_a:
+        a, b = np.concatenate(pairs_a), np.concatenate(pairs_b)
+        keep = np.all((lo[a] < hi[b] + gap) & (lo[b] < hi[a] + gap), axis=1)
+        pairs_a, pairs_b = [a[keep]], [b[keep]]
+
+    for i in np.flatnonzero(big):
+        hits = np.flatnonzero(np.all((lo[i] < hi + gap) & (lo < hi[i] + gap), axis=1))
+        hits = hits[~big[hits] | (hits > i)]
+        hits = hits[hits != i]
+        pairs_a.append(np.full(len(hits), i))
+        pairs_b.append(hits)
+
+    if not pairs_a:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    return np.concatenate(pairs_a), np.concatenate(pairs_b)
+
+
+def find_chain_offsets(offsets, first, second, length, order, forward=True):
+    """
+    Finds offsets along one axis that keep the second box of every constraint a length past the first.
+    Pushing forward, second boxes move up until they clear their first boxes; pushing backward, first boxes
+    move down until they clear their second boxes. Vectorized passes over all constraints settle short
+    chains; they are tried for as long as they cost less than one pass over the boxes in order, each box
+    taking the largest push over its constraints, which then finishes longer chains.
+    Arguments
+    ---------
+    offsets : numpy array
+        (N,) array of offsets to start from, no further than the result, e.g. the result for fewer constraints.
+    first : numpy array
+        (E,) array of the box each constraint keeps behind.
+    second : numpy array
+        (E,) array of the box each constraint keeps ahead.
+    length : numpy array
+        (E,) array of how much further the second box's offset has to be than the first box's.
+    order : numpy array
+        Box indices in an order every constraint agrees with, first boxes before second boxes.
+    forward : bool
+        If True, boxes are pushed forward, otherwise backward.
+    Returns
+    -------
+    offsets : numpy array
+        (N,) array of the offsets closest to the starting ones that meet every constraint.
+    """
+    if forward:
+        source, target, step, reduce = first, second, length, np.maximum
+    else:
+        source, target, step, reduce = second, first, -length, np.minimum
+        order = order[::-1]
+    # A pass in order costs about as much per box as a vectorized pass does per hundred constraints.
+    for _ in range(max(4, 100 * len(offsets) // max(len(first), 1))):
+        pushed = offsets.copy()
+        reduce.at(pushed, target, offsets[source] + step)
+        if np.array_equal(pushed, offsets):
+            return offsets
+        offsets = pushed
+    by_target = np.argsort(target, kind='stable')
+    source, step = source[by_target], step[by_target]
+    starts = np.searchsorted(target[by_target], np.arange(len(offsets) + 1))
+    for i in order[starts[order + 1] > starts[order]].tolist():
+        pushes = offsets[source[starts[i]:starts[i + 1]]] + step[starts[i]:starts[i + 1]]
+        offsets[i] = reduce(offsets[i], reduce.reduce(pushes))
+    return offsets
+
+
+def separate_boxes(lo, hi, axes='xyz', gap=0.0, max_rounds=64):
+    """
+    Moves overlapping boxes apart along some axes by small offsets that stay within each cluster of overlaps.
+    Every overlapping pair gets a constraint along the free axis where the boxes overlap least: the box that
+    comes second along that axis has to clear the first by the gap. The offsets are the mean of pushing boxes
+    forward and pushing them backward along the chains of constraints, so two boxes that only overlap each
+    other move apart by half the overlap each and a box only moves as far as the chains through it require.
+    Pairs that overlap after a round add their constraints and the offsets are found again, starting from
+    the last ones. Each round is a few vectorized passes over the overlapping pairs.
+    Arguments
+    ---------
+    lo : numpy array
+        (N, 3) array of each box's most negative point.
+    hi : numpy array
+        (N, 3) array of each box's most positive point.
+    axes : str
+        Axes boxes may move along, e.g. 'yz'.
+    gap : float
+        Smallest distance left between boxes.
+    max_rounds : int
+        Rounds of finding overlaps. Overlaps still left after that many, which takes boxes packed far
+        denser than the free axes leave room for, are not resolved.
+    Returns
+    -------
+    offsets : numpy array
+        (N, 3) array of how far each box moves.
+    """
+    count = len(lo)
+    free = [AXIS_INDEX[c] for c in axes]
+    offsets = np.zeros((count, 3))
+    forward = np.zeros((count, 3))
+    backward = np.zeros((count, 3))
+    first = {k: np.empty(0, dtype=int) for k in free}
+    second = {k: np.empty(0, dtype=int) for k in free}
+    for _ in range(max_rounds):
+        lo_now, hi_now = lo + offsets, hi + offsets
+        a, b = find_overlaps(lo_now, hi_now, gap)
+        if not len(a) or not free:
+            break
+        center = (lo_now + hi_now)[:, free] / 2
+        # b comes second along an axis if its center is further along, ties going to the higher index.
+        b_second = (center[b] > center[a]) | ((center[b] == center[a]) & (b > a)[:, np.newaxis])
+        depth = np.where(b_second, hi_now[a][:, free] - lo_now[b][:, free],
+                         hi_now[b][:, free] - lo_now[a][:, free])
+        pick = np.argmin(depth, axis=1)
+        b_second = b_second[np.arange(len(a)), pick]
+        pair_first, pair_second = np.where(b_second, a, b), np.where(b_second, b, a)
+        for j, k in enumerate(free):
+            new = pick == j
+            if not new.any():
+                continue
+            first[k] = np.concatenate([first[k], pair_first[new]])
+            second[k] = np.concatenate([second[k], pair_second[new]])
+            length = hi[first[k], k] - lo[second[k], k] + gap
+            # A little slack, so rounding never leaves a separated pair overlapping.
+            length += 1e-9 * (np.abs(hi[first[k], k]) + np.abs(lo[second[k], k]) + np.abs(length)) + 1e-12
+            # Earlier constraints are met, so the current order along the axis agrees with all of them.
+            order = np.argsort(center[:, j], kind='stable')
+            forward[:, k] = find_chain_offsets(forward[:, k], first[k], second[k], length, order, True)
+            backward[:, k] = find_chain_offsets(backward[:, k], first[k], second[k], length, order, False)
+            offsets[:, k] = (forward[:, k] + backward[:, k]) / 2
+    return offsets
+
+
+def find_islands(edges, count):
+    """
+    Labels the connected parts of a mesh, e.g. the islands of the selected vertices in edit mode.
+    Each edge hooks the root of one endpoint's part under the smaller root of the other, then the
+    labels are shortcut to their roots, so the loop runs a few times rather than once per vertex.
+    Arguments
+    ---------
+    edges : numpy array
+        (E, 2) array of vertex indices.
+    count : int
+        Number of vertices.
+    Returns
+    -------
+    labels : numpy array
+        (count,) array of the smallest vertex index in each vertex's island.
+    """
+    labels = np.arange(count)
+    if not len(edges):
+        return labels
+    a, b = edges[:, 0], edges[:, 1]
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[a], low)
+        np.minimum.at(hooked, labels[b], low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+# The operations below are what the align and distribute buttons do. They read the scene through
+# a reader, so the add-on and blign.headless run the same code. A reader has these methods:
+#     locations(oblist)                              (N, 3) array of world locations
+#     points(oblist, direction, vertex_sign, basis)  (N, 3) array of a vertex of each object, in basis coordinates
+#     extents(oblist, basis)                         (lo, hi) pair of (N, 3) arrays along the basis axes
+#     sort(oblist, kind, keys)                       order of the objects by keys, as sort_order finds it
+#     names(oblist)                                  list of object names
+#     property_keys(oblist, name)                    (N,) array of a custom property, infinity where missing
+# Settings are anything with the BlignSettings attributes an operation reads.
+
+
+def find_axis_direction(direction, vertex_sign, basis=None):
+    """
+    Finds the world space direction of a signed axis of a basis.
+    Arguments
+    ---------
+    direction : str
+        Direction in 3D space ['x', 'y', 'z'].
+    vertex_sign : str
+        Sign of the vertex ['+', '-'].
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    u : numpy array
+        World space unit vector.
+    """
+    u = np.zeros(3)
+    u[AXIS_INDEX[direction]] = {'-': -1, '+': 1}[vertex_sign]
+    if basis is not None:
+        u = basis[0] @ u
+    return u
+
+
+def find_alignment(settings, tab):
+    """
+    Finds the location columns an axis or plane alignment sets and the vertex it aligns, from a tab's settings.
+    Arguments
+    ---------
+    settings : BlignSettings
+        Scene settings.
+    tab : str
+        '0' for the Principal Axes tab, '1' for the Align to One Object tab.
+    Returns
+    -------
+    columns : list
+        Location columns, from AXIS_COLUMNS or PLANE_COLUMNS.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    """
+    if getattr(settings, 'check_plane' + tab):
+        plane = getattr(settings, 'Plane' + tab)
+        return PLANE_COLUMNS[plane], getattr(settings, plane.replace('-', '') + '_selected' + tab)
+    axis = getattr(settings, 'Axis' + tab)
+    return AXIS_COLUMNS[axis], getattr(settings, axis + '_selected' + tab)
+
+
+def find_alignment_target(reader, reference, direction, basis=None):
+    """
+    Finds the point an axis or plane alignment aligns to.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the reference.
+    reference : object
+        Blign object to align to, None to align to the origin of the basis.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    target : numpy array
+        Target point in basis coordinates.
+    """
+    if reference is None:
+        return np.zeros(3)
+    if direction == 'center':
+        return to_basis(reader.locations([reference])[0], basis)
+    return reader.points([reference], direction[1], direction[0], basis)[0]
+
+
+def find_line_points(reader, references, direction):
+    """
+    Finds the points on the 2 Blign objects that the alignment line runs through.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the references.
+    references : list
+        The Blign objects.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    Returns
+    -------
+    p1 : numpy array
+        Point on the first Blign object.
+    p2 : numpy array
+        Point on the second Blign object.
+    """
+    if len(references) != 2:
+        raise ValueError('There should be 2 Blign objects selected!')
+    if direction == 'center':
+        return reader.locations(references)
+    return reader.points(references, direction[1], direction[0], None)
+
+
+def separate_objects(reader, oblist, locations, columns, settings, basis=None):
+    """
+    Moves objects that would overlap at their new locations apart, when Avoid Overlaps is on.
+    Objects only move along the axes the operation left free, so the alignment is kept. Distributing
+    with 2 Blign objects and Grid set every axis, and Pack never overlaps, so those do not call this.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the objects' extents at their current locations.
+    oblist : list
+        Objects being moved.
+    locations : numpy array
+        (N, 3) array of the new object locations.
+    columns : list
+        Axes the operation set, as column indices. The other axes are free.
+    settings : BlignSettings
+        Scene settings, for avoid_overlaps and overlap_gap.
+    basis : tuple
+        (rotation, origin) the columns are in, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the new object locations without overlaps.
+    """
+    free = ''.join(axis for k, axis in enumerate('xyz') if k not in columns)
+    if not settings.avoid_overlaps or not free or len(oblist) < 2:
+        return locations
+    lo, hi = reader.extents(oblist, basis)
+    moved = to_basis(locations, basis)
+    shift = moved - to_basis(reader.locations(oblist), basis)
+    with phase('math'):
+        return from_basis(moved + separate_boxes(lo + shift, hi + shift, free, settings.overlap_gap), basis)
+
+
+def align_objects(reader, oblist, settings, columns, direction, reference=None, basis=None):
+    """
+    Aligns objects on an axis or plane of a basis, to its origin or to a Blign object.
+    Every object is moved into the basis once, aligned there and moved back.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the objects and the reference.
+    oblist : list
+        Objects to align.
+    settings : BlignSettings
+        Scene settings.
+    columns : list
+        Location columns to set, from AXIS_COLUMNS or PLANE_COLUMNS.
+    direction : str
+        'center' or the vertex used, e.g. '+y'.
+    reference : object
+        Blign object to align to, None to align to the origin of the basis.
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the aligned locations.
+    """
+    locations = to_basis(reader.locations(oblist), basis)
+    if direction == 'center':
+        points = locations
+    else:
+        points = reader.points(oblist, direction[1], direction[0], basis)
+    target = find_alignment_target(reader, reference, direction, basis)
+    with phase('math'):
+        locations = from_basis(align_to_point(locations, points, target, columns), basis)
+    return separate_objects(reader, oblist, locations, columns, settings, basis)
+
+
+def align_objects_to_line(reader, oblist, references, settings):
+    """
+    Aligns objects to the line through 2 Blign objects. The Blign objects themselves are left where they are.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the objects and the references.
+    oblist : list
+        Objects to align.
+    references : list
+        The 2 Blign objects.
+    settings : BlignSettings
+        Scene settings.
+    Returns
+    -------
+    oblist : list
+        The objects that were aligned, without Blign objects.
+    locations : numpy array
+        (N, 3) array of their aligned locations.
+    """
+    align = settings.align_to_2_ops
+    clamp = settings.clamp_segment2
+    stations = settings.stations2
+    p1, p2 = find_line_points(reader, references, align)
+    oblist = [obj for obj in oblist if not obj.blign]
+    locations = reader.locations(oblist)
+    if align == 'center':
+        points = locations
+    else:
+        points = reader.points(oblist, align[1], align[0], None)
+
+    with phase('math'):
+        locations = locations + project_onto_line(points, p1, p2, clamp, stations) - points
+    if not clamp and stations < 2:
+        # Objects only move along the line. Clamped and snapped objects keep their places on the segment.
+        locations = separate_objects(reader, oblist, locations, [1, 2], settings, line_basis(p1, p2))
+    return oblist, locations
+
+
+def distribute_objects(reader, oblist, settings, indicate, axis, dist_type, spacing, basis=None):
+    """
+    Distributes objects from their centers or edges when 0 or 1 blign objects are added.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads and sorts the objects.
+    oblist : list
+        Objects to distribute.
+    settings : BlignSettings
+        Scene settings.
+    indicate : bool
+        If True, user can set spacing. If False, Blign finds default spacing.
+    axis: str
+        Either x y or z.
+    dist_type : str
+        The user's choice to distribute from either center or edge.
+    spacing : int
+        number of units between objects (specified by user).
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the distributed locations, None when there are fewer than 2 objects.
+    """
+    if len(oblist) < 2:
+        return None
+    locations = to_basis(reader.locations(oblist), basis)
+    order = reader.sort(oblist, axis, locations[:, AXIS_INDEX[axis]])
+    if dist_type == 'center':
+        if indicate:
+            spacing = settings.Spacing0
+        with phase('math'):
+            locations = distribute_centers(locations, axis, spacing if indicate else None, order)
+    elif dist_type == 'edge':
+        lo, hi = reader.extents(oblist, basis)
+        with phase('math'):
+            locations = distribute_edges(locations, lo, hi, axis, spacing if indicate else None, order)
+    return separate_objects(reader, oblist, from_basis(locations, basis), [AXIS_INDEX[axis]], settings, basis)
+
+
+def distribute_objects_between(reader, oblist, references, settings, basis=None):
+    """
+    Distributes objects from their centers when 2 blign objects are added: evenly along every axis of
+    the basis, or at a fixed spacing along the line from the first Blign object to the second.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads and sorts the objects.
+    oblist : list
+        Objects to distribute.
+    references : list
+        The 2 Blign objects.
+    settings : BlignSettings
+        Scene settings.
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the distributed locations, None when there is nothing to distribute.
+    """
+    if settings.distribute_ops2 != 'center' or len(oblist) < 2:
+        return None
+    if settings.indicate_spacing2:
+        p1, p2 = reader.locations(references)
+        with phase('math'):
+            return distribute_along_line(len(oblist), p1, p2, settings.Spacing2)
+    locations = to_basis(reader.locations(oblist), basis)
+    for axis in 'xyz':
+        order = reader.sort(oblist, axis, locations[:, AXIS_INDEX[axis]])
+        with phase('math'):
+            locations = distribute_centers(locations, axis, order=order)
+    return from_basis(locations, basis)
+
+
+def find_grid_order(reader, oblist, key, locations, lo, hi, name=""):
+    """
+    Finds the order objects fill the grid in.
+    Arguments
+    ---------
+    reader : scene reader
+        Sorts the objects and reads their names and properties.
+    oblist : list
+        Objects being arranged.
+    key : str
+        'SELECTION', 'X', 'Y', 'Z', 'NAME', 'SIZE' or 'PROPERTY'.
+    locations : numpy array
+        (N, 3) array of object locations.
+    lo : numpy array
+        (N, 3) array of each object's most negative point.
+    hi : numpy array
+        (N, 3) array of each object's most positive point.
+    name : str
+        Custom property sorted by when key is 'PROPERTY'.
+    Returns
+    -------
+    order : numpy array
+        Object indices in grid order.
+    """
+    if key in {'X', 'Y', 'Z'}:
+        return reader.sort(oblist, key.lower(), locations[:, AXIS_INDEX[key.lower()]])
+    if key == 'SIZE':
+        return reader.sort(oblist, key, -np.prod(hi - lo, axis=1))
+    if key == 'NAME':
+        return reader.sort(oblist, key, reader.names(oblist))
+    if key == 'PROPERTY':
+        return reader.sort(oblist, (key, name), reader.property_keys(oblist, name))
+    return np.arange(len(oblist))
+
+
+def arrange_objects(reader, oblist, settings, basis=None):
+    """
+    Distributes objects in a grid of columns, rows and layers of a basis.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads and sorts the objects.
+    oblist : list
+        Objects to arrange.
+    settings : BlignSettings
+        Scene settings.
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the arranged locations, None when there are fewer than 2 objects.
+    """
+    if len(oblist) < 2:
+        return None
+    locations = to_basis(reader.locations(oblist), basis)
+    lo, hi = reader.extents(oblist, basis)
+    order = find_grid_order(reader, oblist, settings.grid_sort, locations, lo, hi, settings.sort_property)
+    with phase('math'):
+        locations = arrange_grid(locations, lo, hi, order, settings.grid_columns, settings.grid_rows,
+                                 settings.grid_axes, settings.grid_spacing or None, settings.grid_ops)
+    return from_basis(locations, basis)
+
+
+def pack_objects(reader, oblist, settings, basis=None):
+    """
+    Packs objects of different sizes into a compact layout on a plane of a basis.
+    Arguments
+    ---------
+    reader : scene reader
+        Reads the objects.
+    oblist : list
+        Objects to pack.
+    settings : BlignSettings
+        Scene settings.
+    basis : tuple
+        (rotation, origin) as for to_basis, None for the world axes.
+    Returns
+    -------
+    locations : numpy array
+        (N, 3) array of the packed locations, None when there are fewer than 2 objects.
+    """
+    if len(oblist) < 2:
+        return None
+    locations = to_basis(reader.locations(oblist), basis)
+    lo, hi = reader.extents(oblist, basis)
+    with phase('math'):
+        locations = pack_shelves(locations, lo, hi, settings.pack_plane, settings.pack_spacing, settings.pack_width)
+    return from_basis(locations, basis)
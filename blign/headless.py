@@ -0,0 +1,282 @@
+"""
+A lightweight stand-in for the parts of a Blender scene that Blign reads and writes.
+Objects carry a location, rotation, scale and bounding box as NumPy arrays, so blign.core
+can be driven by tests and benchmarks in environments without Blender.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+from .core import (to_basis, basis_inverse, transform_corners, find_bounds, find_vertices,
+                   find_axis_direction, sort_order, find_unit_groups, union_bounds, box_corners,
+                   orthonormal_basis)
+from .parallel import pack_hulls, find_packed_bounds, find_packed_support
+
+# Corners of a unit cube in the order Blender stores bound_box.
+UNIT_BOUND_BOX = np.array([[-1, -1, -1], [-1, -1, 1], [-1, 1, 1], [-1, 1, -1],
+                           [1, -1, -1], [1, -1, 1], [1, 1, 1], [1, 1, -1]], dtype=float)
+
+# Defaults of every BlignSettings property the operations in blign.core read.
+DEFAULT_SETTINGS = {
+    'Axis0': 'x', 'Axis1': 'x', 'Plane0': 'y-z', 'Plane1': 'y-z', 'check_plane0': False, 'check_plane1': False,
+    'x_selected0': 'center', 'y_selected0': 'center', 'z_selected0': 'center',
+    'xy_selected0': 'center', 'xz_selected0': 'center', 'yz_selected0': 'center',
+    'x_selected1': 'center', 'y_selected1': 'center', 'z_selected1': 'center',
+    'xy_selected1': 'center', 'xz_selected1': 'center', 'yz_selected1': 'center',
+    'indicate_spacing0': False, 'indicate_spacing1': False, 'indicate_spacing2': False,
+    'Spacing0': 1, 'Spacing1': 1, 'Spacing2': 1,
+    'distribute_ops0': 'center', 'distribute_ops1': 'center', 'distribute_ops2': 'center',
+    'align_to_2_ops': 'center', 'clamp_segment2': False, 'stations2': 0,
+    'exact_geometry': False, 'bounds_backend': 'SERIAL', 'bounds_workers': 0,
+    'grid_columns': 0, 'grid_rows': 0, 'grid_axes': 'xyz', 'grid_sort': 'SELECTION', 'sort_property': '',
+    'grid_ops': 'center', 'grid_spacing': 0.0, 'pack_plane': 'x-y', 'pack_spacing': 0.0, 'pack_width': 0.0,
+    'avoid_overlaps': False, 'overlap_gap': 0.0, 'basis': 'GLOBAL', 'align_units': 'OBJECT',
+}
+
+
+def make_settings(**values):
+    """Stand-in for a scene's BlignSettings, the defaults overridden by values."""
+    return SimpleNamespace(**dict(DEFAULT_SETTINGS, **values))
+
+
+class Object:
+    """Stand-in for a Blender object with the attributes Blign uses. The location of a child is in its parent's
+    space, and its collection is None when it is linked straight to the scene collection."""
+
+    def __init__(self, name, location=(0, 0, 0), rotation=None, scale=(1, 1, 1), bound_box=None, vertices=None):
+        self.name = name
+        self.location = np.array(location, dtype=float)
+        self.rotation = np.eye(3) if rotation is None else np.array(rotation, dtype=float)
+        self.scale = np.array(scale, dtype=float)
+        self.vertices = None if vertices is None else np.asarray(vertices, dtype=float)
+        if bound_box is None:
+            if self.vertices is None:
+                bound_box = UNIT_BOUND_BOX
+            else:
+                lo, hi = self.vertices.min(axis=0), self.vertices.max(axis=0)
+                bound_box = lo + (UNIT_BOUND_BOX + 1) / 2 * (hi - lo)
+        self.bound_box = np.array(bound_box, dtype=float)
+        self.blign = False
+        self.properties = {}
+        self.parent = None
+        self.collection = None
+
+    def get(self, name, default=None):
+        """Reads a custom property like ID.get."""
+        return self.properties.get(name, default)
+
+    @property
+    def matrix_world(self):
+        """4x4 world matrix built from location, rotation and scale."""
+        matrix = np.eye(4)
+        matrix[:3, :3] = self.rotation * self.scale
+        matrix[:3, 3] = self.location
+        if self.parent is not None:
+            matrix = self.parent.matrix_world @ matrix
+        return matrix
+
+
+class Unit:
+    """Stand-in for addon.Unit, a hierarchy or collection moved as one by moving its roots."""
+
+    def __init__(self, roots, members, corners, pinned=()):
+        self.roots = roots
+        self.members = members
+        self.corners = corners
+        self.pinned = list(pinned)
+        self.blign = False
+        self.name = roots[0].name
+        self._location = roots[0].matrix_world[:3, 3]
+
+    def get(self, name, default=None):
+        return self.roots[0].get(name, default)
+
+    @property
+    def location(self):
+        return self._location.copy()
+
+    @location.setter
+    def location(self, location):
+        delta = np.asarray(location, dtype=float) - self._location
+        for obj in self.roots + self.pinned:
+            shift = -delta if obj.blign else delta
+            if obj.parent is not None:
+                shift = np.linalg.solve(obj.parent.matrix_world[:3, :3], shift)
+            obj.location = obj.location + shift
+        self._location = self._location + delta
+        self.corners = self.corners + delta
+
+
+class Scene:
+    """
+    Stand-in for a Blender scene, holding objects, a selection, the Blign objects and the settings.
+    It is also a scene reader for the operations in blign.core, like addon.BlenderReader.
+    """
+
+    def __init__(self, objects=(), settings=None):
+        self.objects = list(objects)
+        self.selected_objects = list(self.objects)
+        self.settings = make_settings() if settings is None else settings
+        self.active = None
+
+    @property
+    def blign_objects(self):
+        """Blign objects in scene order."""
+        return [obj for obj in self.objects if obj.blign]
+
+    def get_locations(self, oblist=None):
+        """Reads the locations of a list of objects, the selection by default, into one (N, 3) array."""
+        oblist = self.selected_objects if oblist is None else oblist
+        return np.array([obj.location for obj in oblist], dtype=float).reshape(-1, 3)
+
+    def set_locations(self, locations, oblist=None):
+        """Writes an (N, 3) array of locations back to a list of objects, the selection by default."""
+        oblist = self.selected_objects if oblist is None else oblist
+        for obj, location in zip(oblist, locations):
+            obj.location = np.array(location, dtype=float)
+
+    def world_corners(self, oblist=None):
+        """Finds the (N, 8, 3) world space bounding box corners of a list of objects, the selection by default."""
+        oblist = self.selected_objects if oblist is None else oblist
+        matrices = np.array([obj.matrix_world for obj in oblist]).reshape(-1, 4, 4)
+        local = np.array([obj.bound_box for obj in oblist]).reshape(-1, 8, 3)
+        return transform_corners(matrices, local)
+
+    def packed_hulls(self, oblist=None):
+        """Packs the vertices and world matrices of a list of objects, the selection by default, for blign.parallel.
+        Objects without vertices are packed as their bounding box corners."""
+        oblist = self.selected_objects if oblist is None else oblist
+        vertices, offsets = pack_hulls([obj.bound_box if obj.vertices is None else obj.vertices for obj in oblist])
+        return vertices, offsets, np.array([obj.matrix_world for obj in oblist]).reshape(-1, 4, 4)
+
+    def find_basis(self):
+        """Finds the basis the operations work in like addon.find_basis, for the world or the active object's axes."""
+        if self.settings.basis == 'ACTIVE' and self.active is not None:
+            return orthonormal_basis(self.active.matrix_world)
+        return None
+
+    def find_units(self, mode):
+        """
+        Finds the hierarchies or collections the selected objects belong to, like addon.find_selected_units.
+        Arguments
+        ---------
+        mode : str
+            'OBJECT', 'HIERARCHY' or 'COLLECTION'.
+        Returns
+        -------
+        oblist : list
+            Selected objects, or Unit objects.
+        """
+        if mode == 'OBJECT':
+            return self.selected_objects
+        index = {id(obj): i for i, obj in enumerate(self.objects)}
+        parents = [-1 if obj.parent is None else index[id(obj.parent)] for obj in self.objects]
+        names = sorted({obj.collection for obj in self.objects if obj.collection is not None})
+        collections = np.array([-1 if obj.collection is None else names.index(obj.collection) for obj in self.objects])
+        collection_members = [np.flatnonzero(collections == k) for k in range(len(names))]
+        groups = find_unit_groups([index[id(obj)] for obj in self.selected_objects], parents,
+                                  [obj.blign for obj in self.objects], mode, collections, collection_members)
+        if not groups:
+            return []
+        lo, hi = self.extents([self.objects[i] for _, members, _ in groups for i in members])
+        corners = box_corners(*union_bounds(lo, hi, np.cumsum([0] + [len(members) for _, members, _ in groups])))
+        return [Unit([self.objects[i] for i in roots], [self.objects[i] for i in members], unit_corners,
+                     [self.objects[i] for i in pinned])
+                for (roots, members, pinned), unit_corners in zip(groups, corners)]
+
+    def locations(self, oblist):
+        """Reads the (N, 3) locations of a list of objects."""
+        return self.get_locations(oblist)
+
+    def points(self, oblist, direction, vertex_sign, basis=None):
+        """Finds a vertex of each object in basis coordinates, from the hulls with exact geometry."""
+        if oblist and isinstance(oblist[0], Unit):
+            return find_vertices(to_basis(np.array([unit.corners for unit in oblist]), basis), direction, vertex_sign)
+        if self.settings.exact_geometry:
+            u = find_axis_direction(direction, vertex_sign, basis)
+            support = find_packed_support(*self.packed_hulls(oblist), u, self.settings.bounds_backend,
+                                          self.settings.bounds_workers)
+            return to_basis(support, basis)
+        return find_vertices(to_basis(self.world_corners(oblist), basis), direction, vertex_sign)
+
+    def extents(self, oblist, basis=None):
+        """Finds the (N, 3) lo and hi extents of each object along the axes of a basis, from the hulls with exact geometry."""
+        if oblist and isinstance(oblist[0], Unit):
+            return find_bounds(to_basis(np.array([unit.corners for unit in oblist]), basis))[:2]
+        if self.settings.exact_geometry:
+            vertices, offsets, matrices = self.packed_hulls(oblist)
+            if basis is not None:
+                matrices = basis_inverse(basis) @ matrices
+            return find_packed_bounds(vertices, offsets, matrices, self.settings.bounds_backend,
+                                      self.settings.bounds_workers)[:2]
+        return find_bounds(to_basis(self.world_corners(oblist), basis))[:2]
+
+    def sort(self, oblist, kind, keys):
+        """Sorts objects by a key, from scratch since there is no ordering index."""
+        return sort_order(np.array(keys))
+
+    def names(self, oblist):
+        """Reads the name of each object."""
+        return [obj.name for obj in oblist]
+
+    def property_keys(self, oblist, name):
+        """Reads a custom property of each object as a sort key, infinity where it is missing or not a number."""
+        keys = np.full(len(oblist), np.inf)
+        for i, obj in enumerate(oblist):
+            value = obj.get(name)
+            if isinstance(value, (int, float)):
+                keys[i] = value
+        return keys
+
+
+def random_rotation(rng):
+    """
+    Draws a uniformly random rotation matrix.
+    Arguments
+    ---------
+    rng : numpy Generator
+        Random number generator.
+    Returns
+    -------
+    rotation : numpy array
+        3x3 rotation matrix.
+    """
+    q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] *= -1
+    return q
+
+
+def random_scene(count, seed=0, rotated=True, shared_meshes=0, vertices_per_mesh=256, extent=100.0):
+    """
+    Builds a scene of randomly placed, sized and optionally rotated objects.
+    Arguments
+    ---------
+    count : int
+        Number of objects.
+    seed : int
+        Seed of the random number generator.
+    rotated : bool
+        If True, objects get random rotations.
+    shared_meshes : int
+        If greater than 0, objects get vertices from this many shared random meshes instead of plain boxes.
+    vertices_per_mesh : int
+        Number of vertices in each shared mesh.
+    extent : float
+        Objects are placed within [-extent, extent] on every axis.
+    Returns
+    -------
+    scene : Scene
+        Scene with every object selected.
+    """
+    rng = np.random.default_rng(seed)
+    meshes = [rng.normal(size=(vertices_per_mesh, 3)) for _ in range(shared_meshes)]
+    objects = []
+    for i in range(count):
+        objects.append(Object(
+            "Object.{:06d}".format(i),
+            location=rng.uniform(-extent, extent, size=3),
+            rotation=random_rotation(rng) if rotated else None,
+            scale=rng.uniform(0.2, 2.0, size=3),
+            vertices=meshes[i % shared_meshes] if shared_meshes else None))
+    return Scene(objects)
@@ -0,0 +1,282 @@
+"""
+Optional parallel evaluation of the per-object extents used by exact geometry mode.
+The hull vertices of every object are packed once into flat arrays and each worker reduces a
+contiguous range of objects. Every object is reduced by the same code whatever range it falls
+in, so results match the serial path exactly for any number of workers. The process backend
+shares the packed arrays with its workers through shared memory instead of pickling them.
+Nothing in this module imports bpy.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+# Executors kept alive between operations, keyed by (backend, workers).
+_pools = {}
+
+
+def pack_hulls(hulls):
+    """
+    Packs per-object vertex arrays into one flat array.
+    Arguments
+    ---------
+    hulls : list
+        (H, 3) arrays of local space vertices, one per object, none of them empty.
+    Returns
+    -------
+    vertices : numpy array
+        (M, 3) array of every object's vertices, object after object.
+    offsets : numpy array
+        (N + 1,) array, the vertices of object i are vertices[offsets[i]:offsets[i + 1]].
+    """
+    offsets = np.zeros(len(hulls) + 1, dtype=np.int64)
+    np.cumsum([len(hull) for hull in hulls], out=offsets[1:])
+    vertices = np.concatenate(hulls) if hulls else np.empty((0, 3))
+    return vertices, offsets
+
+
+def split_ranges(count, workers):
+    """
+    Splits object indices into contiguous ranges, one per worker.
+    Arguments
+    ---------
+    count : int
+        Number of objects.
+    workers : int
+        Number of ranges wanted.
+    Returns
+    -------
+    ranges : list
+        (start, stop) pairs covering range(count) in order.
+    """
+    bounds = np.linspace(0, count, min(workers, count) + 1).astype(int)
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _rotate(v, owner, rotation):
+    """Applies each vertex's object rotation one output column at a time, keeping temporaries (M,) sized."""
+    world = np.empty_like(v)
+    for k in range(3):
+        world[:, k] = v[:, 0] * rotation[owner, k, 0] + v[:, 1] * rotation[owner, k, 1] + \
+            v[:, 2] * rotation[owner, k, 2]
+    return world
+
+
+def _segment(vertices, offsets, start, stop):
+    """Vertices, local segment starts and owning object of every vertex of objects start to stop."""
+    v = vertices[offsets[start]:offsets[stop]]
+    starts = offsets[start:stop] - offsets[start]
+    owner = np.repeat(np.arange(stop - start), np.diff(offsets[start:stop + 1]))
+    return v, starts, owner
+
+
+def reduce_bounds(vertices, offsets, matrices, lo, hi, start, stop):
+    """
+    Finds the world space extents of objects start to stop and writes them into lo and hi.
+    Arguments
+    ---------
+    vertices : numpy array
+        Packed vertices from pack_hulls.
+    offsets : numpy array
+        Packed offsets from pack_hulls.
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    lo : numpy array
+        (N, 3) output array of most negative points.
+    hi : numpy array
+        (N, 3) output array of most positive points.
+    start : int
+        First object of the range.
+    stop : int
+        Object after the last of the range.
+    Returns
+    -------
+    """
+    v, starts, owner = _segment(vertices, offsets, start, stop)
+    world = _rotate(v, owner, matrices[start:stop, :3, :3])
+    translation = matrices[start:stop, :3, 3]
+    lo[start:stop] = np.minimum.reduceat(world, starts, axis=0) + translation
+    hi[start:stop] = np.maximum.reduceat(world, starts, axis=0) + translation
+
+
+def reduce_support(vertices, offsets, matrices, u, p, start, stop):
+    """
+    Finds the world space support point of objects start to stop along u and writes them into p.
+    Ties go to the first vertex, like argmax.
+    Arguments
+    ---------
+    vertices : numpy array
+        Packed vertices from pack_hulls.
+    offsets : numpy array
+        Packed offsets from pack_hulls.
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    u : numpy array
+        World space direction to query.
+    p : numpy array
+        (N, 3) output array of support points.
+    start : int
+        First object of the range.
+    stop : int
+        Object after the last of the range.
+    Returns
+    -------
+    """
+    v, starts, owner = _segment(vertices, offsets, start, stop)
+    rotation = matrices[start:stop, :3, :3]
+    w = rotation.transpose(0, 2, 1) @ u
+    dots = v[:, 0] * w[owner, 0] + v[:, 1] * w[owner, 1] + v[:, 2] * w[owner, 2]
+    best = np.maximum.reduceat(dots, starts)
+    candidates = np.flatnonzero(dots == best[owner])
+    first = candidates[np.unique(owner[candidates], return_index=True)[1]]
+    p[start:stop] = (rotation @ v[first][:, :, np.newaxis])[:, :, 0] + matrices[start:stop, :3, 3]
+
+
+def _share(array):
+    """Copies an array into a new shared memory block."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach(spec):
+    """Opens a shared memory block from _share as an array."""
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype, buffer=block.buf)
+
+
+def _run_shared(function, input_specs, args, output_specs, start, stop):
+    """Runs a reduction in a worker process on arrays attached from shared memory."""
+    blocks, arrays = zip(*[_attach(spec) for spec in input_specs + output_specs])
+    try:
+        function(*arrays[:len(input_specs)], *args, *arrays[len(input_specs):], start, stop)
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def get_pool(backend, workers):
+    """
+    Finds or starts the executor of a backend.
+    Arguments
+    ---------
+    backend : str
+        'THREADS' or 'PROCESSES'.
+    workers : int
+        Number of workers.
+    Returns
+    -------
+    pool : Executor
+        Thread or process pool kept for later operations.
+    """
+    key = (backend, workers)
+    if key not in _pools:
+        if backend == 'PROCESSES':
+            _pools[key] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            _pools[key] = ThreadPoolExecutor(workers)
+    return _pools[key]
+
+
+def shutdown():
+    """Stops every executor started by get_pool."""
+    for pool in _pools.values():
+        pool.shutdown(wait=False)
+    _pools.clear()
+
+
+def _map_ranges(function, inputs, args, outputs, backend, workers):
+    """Runs a reduction over all objects, serially or split into ranges on a pool."""
+    count = len(inputs[1]) - 1
+    workers = workers or os.cpu_count() or 1
+    if backend == 'PROCESSES' and shared_memory is None:
+        backend = 'THREADS'
+    if backend == 'SERIAL' or workers == 1 or count < 2:
+        function(*inputs, *args, *outputs, 0, count)
+        return
+    ranges = split_ranges(count, workers)
+    pool = get_pool(backend, workers)
+    if backend == 'THREADS':
+        for future in [pool.submit(function, *inputs, *args, *outputs, start, stop) for start, stop in ranges]:
+            future.result()
+        return
+
+    blocks, specs = zip(*[_share(array) for array in (*inputs, *outputs)])
+    try:
+        input_specs, output_specs = specs[:len(inputs)], specs[len(inputs):]
+        futures = [pool.submit(_run_shared, function, input_specs, args, output_specs, start, stop)
+                   for start, stop in ranges]
+        for future in futures:
+            future.result()
+        for output, block, spec in zip(outputs, blocks[-len(outputs):], specs[-len(outputs):]):
+            output[...] = np.ndarray(spec[1], spec[2], buffer=block.buf)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def find_packed_bounds(vertices, offsets, matrices, backend='SERIAL', workers=0):
+    """
+    Finds the world space extents of every packed object.
+    Arguments
+    ---------
+    vertices : numpy array
+        Packed vertices from pack_hulls.
+    offsets : numpy array
+        Packed offsets from pack_hulls.
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    backend : str
+        'SERIAL', 'THREADS' or 'PROCESSES'.
+    workers : int
+        Number of workers, 0 for one per core.
+    Returns
+    -------
+    lo : numpy array
+        (N, 3) array of each object's most negative point along x, y and z.
+    hi : numpy array
+        (N, 3) array of each object's most positive point along x, y and z.
+    center : numpy array
+        (N, 3) array of the center of each object's extents.
+    """
+    lo = np.empty((len(offsets) - 1, 3))
+    hi = np.empty((len(offsets) - 1, 3))
+    _map_ranges(reduce_bounds, (vertices, offsets, matrices), (), (lo, hi), backend, workers)
+    center = (lo + hi) / 2
+    return lo, hi, center
+
+
+def find_packed_support(vertices, offsets, matrices, u, backend='SERIAL', workers=0):
+    """
+    Finds the world space support point of every packed object along a direction.
+    Arguments
+    ---------
+    vertices : numpy array
+        Packed vertices from pack_hulls.
+    offsets : numpy array
+        Packed offsets from pack_hulls.
+    matrices : numpy array
+        (N, 4, 4) array of world matrices.
+    u : numpy array
+        World space direction to query, need not be normalized.
+    backend : str
+        'SERIAL', 'THREADS' or 'PROCESSES'.
+    workers : int
+        Number of workers, 0 for one per core.
+    Returns
+    -------
+    p : numpy array
+        (N, 3) array of the world space support point of each object.
+    """
+    p = np.empty((len(offsets) - 1, 3))
+    _map_ranges(reduce_support, (vertices, offsets, matrices), (np.asarray(u, dtype=float),), (p,),
+                backend, workers)
+    return p
@@ -0,0 +1,149 @@
+"""
+Opt-in per-phase timing of Blign operations.
+Code marks its phases with `with phase('bounds'):`, which costs nothing unless an operation is
+being recorded. Nested phases are reported exclusively, so a 'sort' phase inside 'math' is not
+counted twice. Nothing in this module imports bpy.
+"""
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+
+# Record being filled by the running operation, None when instrumentation is off.
+_current = None
+# Most recent finished record and cProfile capture.
+last_record = None
+last_profile = None
+
+
+class Record:
+    """Timings, object count and allocation counts of one operation."""
+
+    def __init__(self, operation, object_count):
+        self.operation = operation
+        self.object_count = object_count
+        self.phases = {}
+        self.allocated_blocks = {}
+        self.total = 0.0
+        self._stack = []
+
+    def as_dict(self):
+        """JSON-serializable form of the record."""
+        return {
+            'operation': self.operation,
+            'object_count': self.object_count,
+            'total_seconds': self.total,
+            'phases': self.phases,
+            'allocated_blocks': self.allocated_blocks,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+
+    def summary(self):
+        """One line description for the Info report."""
+        phases = ", ".join("{} {:.3f} s".format(name, seconds) for name, seconds in
+                           sorted(self.phases.items(), key=lambda item: -item[1]))
+        return "{}: {} objects in {:.3f} s ({})".format(self.operation, self.object_count, self.total, phases)
+
+
+@contextmanager
+def phase(name):
+    """
+    Times a block of code as a named phase of the operation being recorded.
+    Arguments
+    ---------
+    name : str
+        Phase name, e.g. 'read', 'bounds', 'sort', 'math' or 'write'.
+    Returns
+    -------
+    """
+    rec = _current
+    if rec is None:
+        yield
+        return
+    frame = [0.0]
+    rec._stack.append(frame)
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        rec._stack.pop()
+        if rec._stack:
+            rec._stack[-1][0] += elapsed
+        rec.phases[name] = rec.phases.get(name, 0.0) + elapsed - frame[0]
+        rec.allocated_blocks[name] = rec.allocated_blocks.get(name, 0) + sys.getallocatedblocks() - blocks
+
+
+@contextmanager
+def record(operation, object_count, profile=False):
+    """
+    Records the phases of one operation and keeps the result in last_record.
+    Arguments
+    ---------
+    operation : str
+        Name of the operation, usually the operator's bl_idname.
+    object_count : int
+        Number of objects the operation works on.
+    profile : bool
+        If True, the operation also runs under cProfile and the stats are kept in last_profile.
+    Returns
+    -------
+    rec : Record
+        Record that is filled while the block runs.
+    """
+    global _current, last_record, last_profile
+    rec = Record(operation, object_count)
+    profiler = cProfile.Profile() if profile else None
+    _current = rec
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield rec
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            last_profile = pstats.Stats(profiler)
+        rec.total = time.perf_counter() - start
+        _current = None
+        last_record = rec
+
+
+def append_to_log(rec, path):
+    """
+    Appends a record to a JSON lines log file.
+    Arguments
+    ---------
+    rec : Record
+        Finished record.
+    path : str
+        Log file path.
+    Returns
+    -------
+    """
+    with open(path, 'a') as f:
+        f.write(json.dumps(rec.as_dict()) + "\n")
+
+
+def format_profile(stats, limit=40):
+    """
+    Formats cProfile stats sorted by cumulative time.
+    Arguments
+    ---------
+    stats : pstats.Stats
+        Captured stats.
+    limit : int
+        Number of functions to list.
+    Returns
+    -------
+    text : str
+        Printable stats table.
+    """
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
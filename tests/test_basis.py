@@ -0,0 +1,83 @@
+"""
+Tests of the bases blign.core aligns and distributes in.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def random_basis(seed):
+    """A random rotation and origin."""
+    rng = np.random.default_rng(seed)
+    return headless.random_rotation(rng), rng.uniform(-10, 10, size=3)
+
+
+def sheared_matrix(seed):
+    """A world matrix with a random rotation, non-uniform scale, shear and translation."""
+    rng = np.random.default_rng(seed)
+    matrix = np.eye(4)
+    shear = np.eye(3)
+    shear[0, 1], shear[0, 2], shear[1, 2] = rng.uniform(-1, 1, size=3)
+    matrix[:3, :3] = headless.random_rotation(rng) @ shear * rng.uniform(0.2, 3.0, size=3)
+    matrix[:3, 3] = rng.uniform(-10, 10, size=3)
+    return matrix
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_from_basis_undoes_to_basis(seed):
+    basis = random_basis(seed)
+    points = np.random.default_rng(seed).normal(size=(50, 8, 3)) * 20
+    np.testing.assert_allclose(core.from_basis(core.to_basis(points, basis), basis), points, atol=1e-9)
+    np.testing.assert_allclose(core.to_basis(core.from_basis(points, basis), basis), points, atol=1e-9)
+
+
+def test_world_basis_leaves_points_as_they_are():
+    points = np.arange(12.0).reshape(4, 3)
+    assert core.to_basis(points, None) is points
+    assert core.from_basis(points, None) is points
+
+
+def test_basis_inverse_matches_to_basis():
+    basis = random_basis(3)
+    scene = headless.random_scene(30, seed=3)
+    matrices = np.array([obj.matrix_world for obj in scene.objects])
+    local = np.array([obj.bound_box for obj in scene.objects])
+    np.testing.assert_allclose(core.transform_corners(core.basis_inverse(basis) @ matrices, local),
+                               core.to_basis(scene.world_corners(), basis), atol=1e-9)
+
+
+@pytest.mark.parametrize('p1, p2', [
+    ([0, 0, 0], [3, 0, 0]),
+    ([1, -2, 3], [-4, 5, 0.5]),
+    ([0, 0, 0], [0, 0, -2]),
+])
+def test_line_basis_runs_along_the_line(p1, p2):
+    p1, p2 = np.array(p1, dtype=float), np.array(p2, dtype=float)
+    basis = core.line_basis(p1, p2)
+    rotation, origin = basis
+    np.testing.assert_allclose(rotation.T @ rotation, np.eye(3), atol=1e-12)
+    np.testing.assert_allclose(origin, p1)
+    np.testing.assert_allclose(core.to_basis(p2, basis), [np.linalg.norm(p2 - p1), 0, 0], atol=1e-12)
+    points = np.random.default_rng(0).normal(size=(20, 3))
+    np.testing.assert_allclose(core.from_basis(core.to_basis(points, basis), basis), points, atol=1e-12)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 3])
+def test_orthonormal_basis_of_a_sheared_matrix(seed):
+    matrix = sheared_matrix(seed)
+    basis = core.orthonormal_basis(matrix)
+    rotation, origin = basis
+    np.testing.assert_allclose(rotation.T @ rotation, np.eye(3), atol=1e-12)
+    np.testing.assert_allclose(origin, matrix[:3, 3])
+    points = np.random.default_rng(seed).normal(size=(20, 3)) * 5
+    np.testing.assert_allclose(core.from_basis(core.to_basis(points, basis), basis), points, atol=1e-9)
+    np.testing.assert_allclose(core.basis_inverse(basis)[:3, :3] @ (points - origin).T,
+                               core.to_basis(points, basis).T, atol=1e-9)
+
+
+def test_orthonormal_basis_keeps_the_rotation_of_a_scaled_matrix():
+    rotation, _ = random_basis(4)
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.array([0.5, 2.0, 7.0])
+    np.testing.assert_allclose(core.orthonormal_basis(matrix)[0], rotation, atol=1e-12)
@@ -0,0 +1,222 @@
+"""
+Tests of blign.core on blign.headless scenes. The expected results come from the object by object
+loops of the original single file add-on, run on the same stand-in objects.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def baseline_vertex(corners, direction, vertex_sign):
+    """The vertex of the original find_vertex: the corner sorted first or last along the axis."""
+    ordered = corners[np.argsort(corners[:, core.AXIS_INDEX[direction]])]
+    return ordered[-1] if vertex_sign == '+' else ordered[0]
+
+
+def baseline_distribute_centers(scene, axis, spacing=None):
+    """The original distribute_0_or_1 from centers."""
+    k = core.AXIS_INDEX[axis]
+    oblist = scene.selected_objects
+    pos_list = [obj.location[k] for obj in oblist]
+    obj_idx = np.argsort(pos_list)
+    if spacing is None:
+        spacing = (max(pos_list) - min(pos_list)) / (len(pos_list) - 1)
+    for i, idx in enumerate(obj_idx):
+        oblist[idx].location[k] = oblist[obj_idx[0]].location[k] + spacing * i
+
+
+def baseline_distribute_edges(scene, axis, spacing=None):
+    """The original distribute_0_or_1 from edges, with find_d and find_c_to_v."""
+    k = core.AXIS_INDEX[axis]
+    oblist = scene.selected_objects
+    obj_idx = np.argsort([obj.location[k] for obj in oblist])
+    corners = scene.world_corners()
+    c_to_v1, c_to_v2 = [], []
+    obj_space = 0
+    for i, idx in enumerate(obj_idx):
+        p1 = baseline_vertex(corners[idx], axis, '-')
+        p2 = baseline_vertex(corners[idx], axis, '+')
+        if i == 0:
+            start = p1[k]
+        elif i == max(obj_idx):
+            end = p2[k]
+        obj_space += p2[k] - p1[k]
+        c_to_v1.append(p2[k] - oblist[idx].location[k])
+        c_to_v2.append(oblist[idx].location[k] - p1[k])
+    if spacing is None:
+        spacing = (end - start - obj_space) / (len(oblist) - 1)
+    for i, idx in enumerate(obj_idx):
+        if i < max(obj_idx):
+            oblist[obj_idx[i + 1]].location[k] = oblist[idx].location[k] + c_to_v1[i] + spacing + c_to_v2[i + 1]
+
+
+def scene_bounds(scene):
+    """World space extents of every object in a scene."""
+    return core.find_bounds(scene.world_corners())[:2]
+
+
+@pytest.mark.parametrize('axis', ['x', 'y', 'z'])
+@pytest.mark.parametrize('direction', ['center', '+x', '-y', '+z'])
+def test_align_to_point_matches_baseline(axis, direction):
+    scene = headless.random_scene(200, seed=1)
+    columns = core.AXIS_COLUMNS[axis]
+    locations = scene.get_locations()
+    if direction == 'center':
+        points = locations
+    else:
+        points = core.find_vertices(scene.world_corners(), direction[1], direction[0])
+    aligned = core.align_to_point(locations, points, np.zeros(3), columns)
+
+    for obj, corners in zip(scene.selected_objects, scene.world_corners()):
+        point = obj.location if direction == 'center' else baseline_vertex(corners, direction[1], direction[0])
+        obj.location[columns] -= point[columns]
+    np.testing.assert_allclose(aligned, scene.get_locations(), atol=1e-9)
+
+
+def test_project_onto_line_matches_baseline():
+    scene = headless.random_scene(200, seed=15)
+    p1, p2 = np.array([1.0, -2, 3]), np.array([-4.0, 5, 0.5])
+    projected = core.project_onto_line(scene.get_locations(), p1, p2)
+
+    u = p2 - p1
+    a = np.array([[(u ** 2).sum()]])
+    for obj in scene.selected_objects:
+        b = np.array([[(u * (obj.location - p2)).sum()]])
+        obj.location = obj.location + u * np.linalg.solve(a, b)[0][0] + (p2 - obj.location)
+    np.testing.assert_allclose(projected, scene.get_locations(), atol=1e-9)
+
+
+def test_project_onto_line_clamps_outside_both_ends():
+    p1, p2 = np.array([0.0, 0, 0]), np.array([4.0, 0, 0])
+    points = np.array([[-3.0, 1, 0], [2, 5, 5], [9, -1, 2]])
+    np.testing.assert_allclose(core.project_onto_line(points, p1, p2, clamp=True),
+                               [[0, 0, 0], [2, 0, 0], [4, 0, 0]])
+    np.testing.assert_allclose(core.project_onto_line(points, p1, p2),
+                               [[-3, 0, 0], [2, 0, 0], [9, 0, 0]])
+
+
+@pytest.mark.parametrize('stations, expected', [
+    (1, [-3, 0.9, 2.6, 9]),
+    (2, [-4, 0, 4, 8]),
+    (5, [-3, 1, 3, 9]),
+])
+def test_project_onto_line_snaps_to_stations(stations, expected):
+    p1, p2 = np.array([0.0, 0, 0]), np.array([4.0, 0, 0])
+    points = np.array([[-3.0, 1, 0], [0.9, 0, 1], [2.6, -2, 0], [9, 0, 0]])
+    projected = core.project_onto_line(points, p1, p2, stations=stations)
+    np.testing.assert_allclose(projected[:, 0], expected)
+    assert not projected[:, 1:].any()
+
+
+def test_project_onto_line_snaps_clamped_stations_to_the_segment():
+    p1, p2 = np.array([0.0, 0, 0]), np.array([0.0, 0, 6])
+    points = np.array([[0.0, 0, -5], [0, 0, 2.9], [0, 0, 20]])
+    projected = core.project_onto_line(points, p1, p2, clamp=True, stations=4)
+    np.testing.assert_allclose(projected[:, 2], [0, 2, 6])
+
+
+def test_project_onto_line_rejects_coincident_points():
+    with pytest.raises(ValueError):
+        core.project_onto_line(np.zeros((1, 3)), np.ones(3), np.ones(3))
+
+
+@pytest.mark.parametrize('axis', ['x', 'y', 'z'])
+@pytest.mark.parametrize('spacing', [None, 2.0])
+def test_distribute_centers_matches_baseline(axis, spacing):
+    scene = headless.random_scene(300, seed=2)
+    distributed = core.distribute_centers(scene.get_locations(), axis, spacing)
+    baseline_distribute_centers(scene, axis, spacing)
+    np.testing.assert_allclose(distributed, scene.get_locations(), atol=1e-9)
+
+
+@pytest.mark.parametrize('axis', ['x', 'y', 'z'])
+@pytest.mark.parametrize('spacing', [None, 0.5])
+def test_distribute_edges_matches_baseline(axis, spacing):
+    scene = headless.random_scene(300, seed=3)
+    lo, hi = scene_bounds(scene)
+    distributed = core.distribute_edges(scene.get_locations(), lo, hi, axis, spacing)
+    baseline_distribute_edges(scene, axis, spacing)
+    np.testing.assert_allclose(distributed, scene.get_locations(), atol=1e-9)
+
+
+def add_blign_objects(scene, count):
+    """Turns the last objects of a scene into Blign objects, returning them and the other objects."""
+    for obj in scene.objects[-count:]:
+        obj.blign = True
+    return scene.blign_objects, [obj for obj in scene.selected_objects if not obj.blign]
+
+
+@pytest.mark.parametrize('direction', ['center', '+x', '-z'])
+def test_align_objects_to_a_blign_object_matches_baseline(direction):
+    scene = headless.random_scene(200, seed=5)
+    (reference,), oblist = add_blign_objects(scene, 1)
+    columns = core.PLANE_COLUMNS['x-y']
+    aligned = core.align_objects(scene, oblist, scene.settings, columns, direction, reference)
+
+    corners = dict(zip(map(id, scene.objects), scene.world_corners(scene.objects)))
+    if direction == 'center':
+        target = reference.location.copy()
+    else:
+        target = baseline_vertex(corners[id(reference)], direction[1], direction[0])
+    for obj in oblist:
+        point = obj.location if direction == 'center' else baseline_vertex(corners[id(obj)], direction[1], direction[0])
+        obj.location[columns] += target[columns] - point[columns]
+    np.testing.assert_allclose(aligned, scene.get_locations(oblist), atol=1e-9)
+
+
+def test_align_objects_avoiding_overlaps_keeps_the_alignment():
+    scene = headless.random_scene(100, seed=6, extent=20.0)
+    scene.settings.avoid_overlaps = True
+    aligned = core.align_objects(scene, scene.selected_objects, scene.settings, core.PLANE_COLUMNS['x-y'], '-z')
+    scene.set_locations(aligned)
+    lo, hi = scene_bounds(scene)
+    np.testing.assert_allclose(lo[:, 2], 0, atol=1e-9)
+    assert not len(core.find_overlaps(lo + 1e-9, hi - 1e-9)[0])
+
+
+def test_align_objects_to_line_leaves_the_blign_objects_out():
+    scene = headless.random_scene(200, seed=7)
+    references, oblist = add_blign_objects(scene, 2)
+    moved, aligned = core.align_objects_to_line(scene, scene.selected_objects, references, scene.settings)
+    assert moved == oblist
+    p1, p2 = scene.get_locations(references)
+    np.testing.assert_allclose(aligned, core.project_onto_line(scene.get_locations(oblist), p1, p2), atol=1e-9)
+
+
+def test_align_objects_to_line_needs_2_blign_objects():
+    scene = headless.random_scene(10, seed=8)
+    references, oblist = add_blign_objects(scene, 1)
+    with pytest.raises(ValueError):
+        core.align_objects_to_line(scene, oblist, references, scene.settings)
+
+
+@pytest.mark.parametrize('dist_type', ['center', 'edge'])
+@pytest.mark.parametrize('indicate', [False, True])
+def test_distribute_objects_matches_baseline(dist_type, indicate):
+    scene = headless.random_scene(300, seed=9)
+    scene.settings.Spacing0 = 3
+    distributed = core.distribute_objects(scene, scene.selected_objects, scene.settings, indicate, 'y', dist_type, 0.5)
+    # From centers, the original read the spacing of the first tab whichever tab was used.
+    spacing = (3 if dist_type == 'center' else 0.5) if indicate else None
+    if dist_type == 'center':
+        baseline_distribute_centers(scene, 'y', spacing)
+    else:
+        baseline_distribute_edges(scene, 'y', spacing)
+    np.testing.assert_allclose(distributed, scene.get_locations(), atol=1e-9)
+
+
+def test_distribute_objects_between_2_blign_objects():
+    scene = headless.random_scene(50, seed=10)
+    references, oblist = add_blign_objects(scene, 2)
+    distributed = core.distribute_objects_between(scene, oblist, references, scene.settings)
+    for axis in 'xyz':
+        baseline_distribute_centers(headless.Scene(oblist), axis)
+    np.testing.assert_allclose(distributed, scene.get_locations(oblist), atol=1e-9)
+
+    scene.settings.indicate_spacing2 = True
+    p1, p2 = scene.get_locations(references)
+    distributed = core.distribute_objects_between(scene, oblist, references, scene.settings)
+    np.testing.assert_allclose(distributed, core.distribute_along_line(len(oblist), p1, p2, 1), atol=1e-9)
+    scene.settings.distribute_ops2 = 'edge'
+    assert core.distribute_objects_between(scene, oblist, references, scene.settings) is None
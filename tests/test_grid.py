@@ -0,0 +1,72 @@
+"""
+Tests of the grid layout in blign.core on blign.headless scenes.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def scene_bounds(scene):
+    """World space extents of every object in a scene."""
+    return core.find_bounds(scene.world_corners())[:2]
+
+
+def test_arrange_grid_from_centers():
+    scene = headless.random_scene(50, seed=12)
+    locations = scene.get_locations()
+    lo, hi = scene_bounds(scene)
+    order = np.arange(50)
+    arranged = core.arrange_grid(locations, lo, hi, order, columns=5, rows=4, axes='xzy', spacing=3.0)
+
+    slot = np.arange(50)
+    cells = np.stack([slot % 5, slot // 5 % 4, slot // 20], axis=1)
+    np.testing.assert_allclose(arranged[:, [0, 2, 1]], locations[0, [0, 2, 1]] + 3.0 * cells)
+
+
+@pytest.mark.parametrize('spacing', [None, 0.5])
+def test_arrange_grid_from_edges_leaves_no_overlaps(spacing):
+    scene = headless.random_scene(200, seed=13)
+    locations = scene.get_locations()
+    lo, hi = scene_bounds(scene)
+    order = core.sort_order(locations[:, 0])
+    arranged = core.arrange_grid(locations, lo, hi, order, dist_type='edge', spacing=spacing)
+    shift = arranged - locations
+
+    np.testing.assert_allclose(arranged[order[0]], locations[order[0]])
+    gap = 0.0 if spacing is None else spacing
+    assert not len(core.find_overlaps(lo + shift, hi + shift, gap - 1e-9)[0])
+
+
+def test_find_grid_order_by_name_size_and_property():
+    scene = headless.random_scene(6, seed=16)
+    objects = scene.objects
+    for obj, name in zip(objects, ['f', 'b', 'e', 'a', 'd', 'c']):
+        obj.name = name
+    for obj, value in zip(objects, [3, 'text', 1.5, None, -2, 7]):
+        if value is not None:
+            obj.properties['rank'] = value
+    locations = scene.get_locations()
+    lo, hi = scene_bounds(scene)
+
+    np.testing.assert_array_equal(core.find_grid_order(scene, objects, 'NAME', locations, lo, hi), [3, 1, 5, 4, 2, 0])
+    np.testing.assert_array_equal(core.find_grid_order(scene, objects, 'SIZE', locations, lo, hi),
+                                  np.argsort(-np.prod(hi - lo, axis=1), kind='stable'))
+    # Objects without a number go last, in selection order.
+    np.testing.assert_array_equal(core.find_grid_order(scene, objects, 'PROPERTY', locations, lo, hi, 'rank'),
+                                  [4, 2, 0, 5, 1, 3])
+    np.testing.assert_array_equal(core.find_grid_order(scene, objects, 'SELECTION', locations, lo, hi), np.arange(6))
+
+
+def test_arrange_objects_in_the_axes_of_the_active_object():
+    scene = headless.random_scene(40, seed=17)
+    scene.settings = headless.make_settings(basis='ACTIVE', grid_columns=4, grid_sort='X', grid_ops='edge')
+    scene.active = scene.objects[3]
+    basis = scene.find_basis()
+    arranged = core.arrange_objects(scene, scene.objects, scene.settings, basis)
+
+    locations = core.to_basis(scene.get_locations(), basis)
+    lo, hi = core.find_bounds(core.to_basis(scene.world_corners(), basis))[:2]
+    order = core.sort_order(locations[:, 0])
+    expected = core.arrange_grid(locations, lo, hi, order, columns=4, dist_type='edge')
+    np.testing.assert_allclose(core.to_basis(arranged, basis), expected, atol=1e-9)
@@ -0,0 +1,43 @@
+"""
+Tests of the mesh islands blign.core finds for edit mode.
+"""
+import numpy as np
+
+from blign import core
+
+
+def test_find_islands_matches_a_graph_search():
+    rng = np.random.default_rng(14)
+    count = 3000
+    edges = rng.integers(0, count, size=(2000, 2))
+    labels = core.find_islands(edges, count)
+
+    neighbours = [[] for _ in range(count)]
+    for a, b in edges.tolist():
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    expected = np.full(count, -1)
+    for start in range(count):
+        if expected[start] >= 0:
+            continue
+        expected[start] = start
+        stack = [start]
+        while stack:
+            for other in neighbours[stack.pop()]:
+                if expected[other] < 0:
+                    expected[other] = start
+                    stack.append(other)
+    np.testing.assert_array_equal(labels, expected)
+
+
+def test_find_islands_without_edges():
+    np.testing.assert_array_equal(core.find_islands(np.empty((0, 2), dtype=int), 4), np.arange(4))
+
+
+def test_find_islands_on_a_long_shuffled_chain():
+    rng = np.random.default_rng(15)
+    path = rng.permutation(5000)
+    edges = np.stack([path[:-1], path[1:]], axis=1)[rng.permutation(4999)]
+    flip = rng.random(len(edges)) < 0.5
+    edges[flip] = edges[flip][:, ::-1]
+    np.testing.assert_array_equal(core.find_islands(edges, 5000), np.zeros(5000, dtype=int))
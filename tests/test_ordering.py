@@ -0,0 +1,69 @@
+"""
+Tests of the sort orders blign.core keeps between operations.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def scene_bounds(scene):
+    """World space extents of every object in a scene."""
+    return core.find_bounds(scene.world_corners())[:2]
+
+
+@pytest.mark.parametrize('changed', [1, 10, 500])
+def test_update_order_matches_sort_order(changed):
+    rng = np.random.default_rng(5)
+    # Integer keys, so there are ties for the lower index rule to break.
+    old_keys = rng.integers(0, 200, size=1000).astype(float)
+    keys = old_keys.copy()
+    keys[rng.choice(len(keys), changed, replace=False)] = rng.integers(0, 200, size=changed)
+    order = core.update_order(core.sort_order(old_keys), old_keys, keys)
+    np.testing.assert_array_equal(order, core.sort_order(keys))
+
+
+def test_update_order_keeps_an_order_that_still_sorts():
+    scene = headless.random_scene(500, seed=6)
+    old_keys = scene.get_locations()[:, 0]
+    keys = core.distribute_centers(scene.get_locations(), 'x')[:, 0]
+    order = core.update_order(core.sort_order(old_keys), old_keys, keys)
+    np.testing.assert_array_equal(order, core.sort_order(keys))
+
+
+def test_update_order_with_added_and_removed_objects():
+    rng = np.random.default_rng(7)
+    old_keys = rng.integers(0, 100, size=400).astype(float)
+    kept = np.sort(rng.choice(len(old_keys), 350, replace=False))
+    old_of_new = np.concatenate([kept, np.full(20, -1)])
+    keys = np.concatenate([old_keys[kept], rng.integers(0, 100, size=20)]).astype(float)
+    keys[:5] += 1
+    order = core.update_order(core.sort_order(old_keys), old_keys, keys, old_of_new)
+    np.testing.assert_array_equal(order, core.sort_order(keys))
+
+
+def test_merge_order_matches_sort_order():
+    rng = np.random.default_rng(8)
+    keys = rng.integers(0, 50, size=600).astype(float)
+    moved = rng.choice(len(keys), 40, replace=False)
+    rest = np.setdiff1d(np.arange(len(keys)), moved)
+    order = rest[core.sort_order(keys[rest])]
+    np.testing.assert_array_equal(core.merge_order(order, keys, moved), core.sort_order(keys))
+
+
+def test_distribute_with_an_order_matches_sorting_here():
+    scene = headless.random_scene(300, seed=4)
+    locations = scene.get_locations()
+    lo, hi = scene_bounds(scene)
+    order = core.sort_order(locations[:, 1])
+    np.testing.assert_array_equal(core.distribute_centers(locations, 'y', order=order),
+                                  core.distribute_centers(locations, 'y'))
+    np.testing.assert_array_equal(core.distribute_edges(locations, lo, hi, 'y', order=order),
+                                  core.distribute_edges(locations, lo, hi, 'y'))
+
+
+def test_is_sorted_breaks_ties_by_index():
+    keys = np.array([1.0, 0, 1, 0])
+    assert core.is_sorted(np.array([1, 3, 0, 2]), keys)
+    assert not core.is_sorted(np.array([3, 1, 0, 2]), keys)
+    assert not core.is_sorted(np.array([0, 2, 1, 3]), keys)
@@ -0,0 +1,78 @@
+"""
+Tests of finding and resolving overlaps in blign.core on blign.headless scenes.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def brute_force_overlaps(lo, hi, gap=0.0):
+    """Every overlapping pair, i < j, by testing all pairs."""
+    hit = np.all((lo[:, np.newaxis] < hi[np.newaxis] + gap) & (lo[np.newaxis] < hi[:, np.newaxis] + gap), axis=2)
+    return set(zip(*np.nonzero(np.triu(hit, 1))))
+
+
+def scene_bounds(scene):
+    """World space extents of every object in a scene."""
+    return core.find_bounds(scene.world_corners())[:2]
+
+
+@pytest.mark.parametrize('gap', [0.0, 0.5])
+def test_find_overlaps_matches_brute_force(gap):
+    scene = headless.random_scene(800, seed=9, extent=30.0)
+    # A few large objects, which are tested against every box instead of through the grid.
+    for obj in scene.objects[:5]:
+        obj.scale = obj.scale * 10
+    lo, hi = scene_bounds(scene)
+    a, b = core.find_overlaps(lo, hi, gap)
+    pairs = {(min(i, j), max(i, j)) for i, j in zip(a.tolist(), b.tolist())}
+    assert len(pairs) == len(a)
+    assert pairs == brute_force_overlaps(lo, hi, gap)
+
+
+def test_separate_boxes_moves_two_boxes_apart_evenly():
+    lo = np.array([[0.0, 0, 0], [1, 0, 0]])
+    hi = np.array([[2.0, 1, 1], [3, 1, 1]])
+    offsets = core.separate_boxes(lo, hi, 'x')
+    np.testing.assert_allclose(offsets, [[-0.5, 0, 0], [0.5, 0, 0]], atol=1e-6)
+
+
+@pytest.mark.parametrize('axes', ['xyz', 'xy', 'z'])
+def test_separate_boxes_leaves_no_overlaps(axes):
+    scene = headless.random_scene(2000, seed=10, rotated=False, extent=30.0)
+    lo, hi = scene_bounds(scene)
+    gap = 0.1
+    offsets = core.separate_boxes(lo, hi, axes, gap)
+
+    assert not len(core.find_overlaps(lo + offsets, hi + offsets, gap)[0])
+    fixed = [k for k in range(3) if 'xyz'[k] not in axes]
+    assert not offsets[:, fixed].any()
+    # Boxes only make room for their neighbours, they are not pushed past the whole scene.
+    size = (hi - lo).max()
+    moved = np.linalg.norm(offsets, axis=1)
+    assert moved.max() < 4 * size
+    assert np.median(moved) < size / 2
+    clear = np.ones(len(lo), dtype=bool)
+    clear[np.concatenate(core.find_overlaps(lo, hi, gap))] = False
+    assert np.mean(moved[clear] > 0) < 0.2
+
+
+def test_separate_boxes_without_overlaps_moves_nothing():
+    lo = np.arange(30, dtype=float)[:, np.newaxis] * np.array([2.0, 0, 0])
+    hi = lo + 1
+    assert not core.separate_boxes(lo, hi).any()
+
+
+@pytest.mark.parametrize('axis', ['x', 'y'])
+def test_distribute_objects_avoiding_overlaps_moves_only_the_free_axes(axis):
+    scene = headless.random_scene(150, seed=20, extent=10.0)
+    scene.settings.avoid_overlaps = True
+    scene.settings.overlap_gap = 0.2
+    before = scene.get_locations()
+    distributed = core.distribute_objects(scene, scene.objects, scene.settings, False, axis, 'center', 1)
+    k = core.AXIS_INDEX[axis]
+    np.testing.assert_allclose(distributed[:, k], core.distribute_centers(before, axis)[:, k], atol=1e-9)
+    scene.set_locations(distributed)
+    lo, hi = scene_bounds(scene)
+    assert not brute_force_overlaps(lo, hi, 0.2 - 1e-9)
@@ -0,0 +1,47 @@
+"""
+Tests of the shelf packing in blign.core on blign.headless scenes.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def scene_bounds(scene):
+    """World space extents of every object in a scene."""
+    return core.find_bounds(scene.world_corners())[:2]
+
+
+@pytest.mark.parametrize('plane', ['x-y', 'y-z'])
+@pytest.mark.parametrize('spacing', [0.0, 0.25])
+def test_pack_shelves_leaves_no_overlaps(plane, spacing):
+    scene = headless.random_scene(500, seed=11)
+    locations = scene.get_locations()
+    lo, hi = scene_bounds(scene)
+    packed = core.pack_shelves(locations, lo, hi, plane, spacing)
+    shift = packed - locations
+    a, b = [core.AXIS_INDEX[c] for c in plane.split('-')]
+    third = 3 - a - b
+
+    np.testing.assert_array_equal(packed[:, third], locations[:, third])
+    # Flattened onto the plane, so only the packing can keep boxes apart.
+    flat_lo, flat_hi = lo + shift, hi + shift
+    flat_lo[:, third], flat_hi[:, third] = 0, 1
+    assert not len(core.find_overlaps(flat_lo, flat_hi, spacing - 1e-9)[0])
+    np.testing.assert_allclose(flat_lo[:, [a, b]].min(axis=0), lo[:, [a, b]].min(axis=0))
+
+
+def test_pack_objects_keeps_shelves_within_the_width():
+    scene = headless.random_scene(300, seed=18)
+    scene.settings.pack_width = 60.0
+    lo, hi = scene_bounds(scene)
+    packed = core.pack_objects(scene, scene.objects, scene.settings)
+    shift = packed - scene.get_locations()
+    left = lo[:, 0].min()
+    assert (hi[:, 0] + shift[:, 0]).max() - left <= 60.0 + 1e-9
+    np.testing.assert_allclose((lo[:, 0] + shift[:, 0]).min(), left)
+
+
+def test_pack_objects_needs_2_objects():
+    scene = headless.random_scene(1, seed=19)
+    assert core.pack_objects(scene, scene.objects, scene.settings) is None
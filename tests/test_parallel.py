@@ -0,0 +1,59 @@
+"""
+Tests that the thread and process backends of blign.parallel match the serial path exactly.
+Process workers are spawned, so they only import blign.parallel and never run this file.
+"""
+import numpy as np
+import pytest
+
+from blign import headless, parallel
+
+
+@pytest.fixture(scope='module')
+def packed():
+    """Packed hulls of objects sharing a few random meshes of different sizes, and their world matrices."""
+    scene = headless.random_scene(500, seed=12, shared_meshes=5, vertices_per_mesh=64)
+    scene.objects[7].vertices = scene.objects[7].vertices[:1]
+    yield scene.packed_hulls()
+    parallel.shutdown()
+
+
+@pytest.mark.parametrize('count, workers', [(0, 3), (1, 4), (5, 2), (10, 3), (7, 16)])
+def test_split_ranges_cover_every_object_in_order(count, workers):
+    ranges = parallel.split_ranges(count, workers)
+    assert len(ranges) <= workers
+    assert [i for start, stop in ranges for i in range(start, stop)] == list(range(count))
+
+
+@pytest.mark.parametrize('backend', ['THREADS', 'PROCESSES'])
+@pytest.mark.parametrize('workers', [2, 3])
+def test_packed_bounds_match_the_serial_path(packed, backend, workers):
+    serial = parallel.find_packed_bounds(*packed)
+    for expected, found in zip(serial, parallel.find_packed_bounds(*packed, backend=backend, workers=workers)):
+        np.testing.assert_array_equal(found, expected)
+
+
+@pytest.mark.parametrize('backend', ['THREADS', 'PROCESSES'])
+@pytest.mark.parametrize('workers', [2, 3])
+def test_packed_support_matches_the_serial_path(packed, backend, workers):
+    u = np.array([0.3, -1.0, 0.2])
+    np.testing.assert_array_equal(parallel.find_packed_support(*packed, u, backend=backend, workers=workers),
+                                  parallel.find_packed_support(*packed, u))
+
+
+def test_process_backend_frees_its_shared_memory(packed, monkeypatch):
+    if parallel.shared_memory is None:
+        pytest.skip("no multiprocessing.shared_memory")
+    names = []
+    share = parallel._share
+
+    def recorded_share(array):
+        block, spec = share(array)
+        names.append(block.name)
+        return block, spec
+
+    monkeypatch.setattr(parallel, '_share', recorded_share)
+    parallel.find_packed_bounds(*packed, backend='PROCESSES', workers=2)
+    assert len(names) == 5
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            parallel.shared_memory.SharedMemory(name=name)
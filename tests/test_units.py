@@ -0,0 +1,102 @@
+"""
+Tests of the hierarchies and collections Blign moves as one, in blign.core and on blign.headless scenes.
+"""
+import numpy as np
+import pytest
+
+from blign import core, headless
+
+
+def make_objects(names):
+    """Unit boxes named after names, spread along x."""
+    return [headless.Object(name, location=(3 * i, 0, 0)) for i, name in enumerate(names)]
+
+
+def test_union_bounds_matches_a_loop_over_the_units():
+    rng = np.random.default_rng(0)
+    lo = rng.uniform(-10, 0, size=(40, 3))
+    hi = lo + rng.uniform(0, 5, size=(40, 3))
+    offsets = np.array([0, 1, 7, 8, 25, 40])
+    unit_lo, unit_hi = core.union_bounds(lo, hi, offsets)
+    for i, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+        np.testing.assert_array_equal(unit_lo[i], lo[start:stop].min(axis=0))
+        np.testing.assert_array_equal(unit_hi[i], hi[start:stop].max(axis=0))
+
+
+def test_box_corners_span_the_box():
+    lo = np.array([[0.0, -1, 2], [-5, -5, -5]])
+    hi = np.array([[1.0, 1, 3], [5, 6, 7]])
+    corners = core.box_corners(lo, hi)
+    assert corners.shape == (2, 8, 3)
+    for box, box_lo, box_hi in zip(corners, lo, hi):
+        expected = {(x, y, z) for x in (box_lo[0], box_hi[0]) for y in (box_lo[1], box_hi[1])
+                    for z in (box_lo[2], box_hi[2])}
+        assert set(map(tuple, box)) == expected
+    found_lo, found_hi = core.find_bounds(corners)[:2]
+    np.testing.assert_array_equal(found_lo, lo)
+    np.testing.assert_array_equal(found_hi, hi)
+
+
+def test_find_unit_groups_leaves_blign_objects_out_of_hierarchies():
+    # 0 -> 1 -> 2, Blign object 3 is a child of 1 and the parent of 4.
+    parents = [-1, 0, 1, 1, 3]
+    blign = [False, False, False, True, False]
+    (roots, members, pinned), = core.find_unit_groups([2], parents, blign, 'HIERARCHY')
+    assert roots == [0]
+    assert members == [0, 1, 2]
+    assert pinned == [3]
+
+    # The hierarchy of 4 stops below its Blign parent.
+    assert core.find_unit_groups([4], parents, blign, 'HIERARCHY') == [([4], [4], [])]
+    assert core.find_unit_groups([3], parents, blign, 'HIERARCHY') == []
+
+
+def test_find_unit_groups_shares_a_hierarchy_between_selected_objects():
+    parents = [-1, 0, 0, 1, -1]
+    groups = core.find_unit_groups([3, 2, 4, 0], parents, [False] * 5, 'HIERARCHY')
+    assert [members for _, members, _ in groups] == [[0, 1, 2, 3], [4]]
+
+
+def test_find_unit_groups_in_collections():
+    # 0, 1 (a Blign object) and its child 2 are in collection 0. 3 is linked straight to the scene collection.
+    parents = [-1, -1, 1, -1, 3]
+    blign = [False, True, False, False, True]
+    collections = np.array([0, 0, 0, -1, -1])
+    groups = core.find_unit_groups([2, 0, 3], parents, blign, 'COLLECTION', collections, [[0, 1, 2]])
+    assert groups == [([0, 2], [0, 2], []), ([3], [3], [4])]
+
+
+def test_units_move_without_their_blign_objects():
+    top, child, reference, other = make_objects(['Top', 'Child', 'Reference', 'Other'])
+    child.parent = top
+    reference.parent = top
+    reference.location = np.array([1.0, 2, 3])
+    reference.blign = True
+    other.location = np.array([0.0, -7, 4])
+    scene = headless.Scene([top, child, reference, other])
+    scene.selected_objects = [child, other]
+    target = reference.matrix_world[:3, 3].copy()
+
+    units = scene.find_units('HIERARCHY')
+    assert [unit.members for unit in units] == [[top, child], [other]]
+    columns = core.AXIS_COLUMNS['x']
+    scene.set_locations(core.align_objects(scene, units, scene.settings, columns, 'center', reference), units)
+    np.testing.assert_allclose(reference.matrix_world[:3, 3], target, atol=1e-9)
+    np.testing.assert_allclose(top.matrix_world[:3, 3][columns], target[columns], atol=1e-9)
+    np.testing.assert_allclose(other.matrix_world[:3, 3][columns], target[columns], atol=1e-9)
+
+
+@pytest.mark.parametrize('mode', ['HIERARCHY', 'COLLECTION'])
+def test_unit_bounds_are_the_union_of_their_members(mode):
+    scene = headless.random_scene(60, seed=11)
+    for i, obj in enumerate(scene.objects):
+        if i % 3:
+            obj.parent = scene.objects[i - i % 3]
+        obj.collection = 'Collection.{}'.format(i // 6)
+    scene.selected_objects = scene.objects[::5]
+    units = scene.find_units(mode)
+    lo, hi = scene.extents(units)
+    for unit, unit_lo, unit_hi in zip(units, lo, hi):
+        member_lo, member_hi = scene.extents(unit.members)
+        np.testing.assert_allclose(unit_lo, member_lo.min(axis=0))
+        np.testing.assert_allclose(unit_hi, member_hi.max(axis=0))